@@ -2,50 +2,159 @@
 # © 2025 VortexBlack LLC — AEI Layer
 # File: self_healing_memory_engine.py
 # Purpose: Auto-correct corrupted or incoherent memory logs in Tex's memory archive
+#          (incremental: each breath only scans what was appended since the last one)
 # ============================================================
 
 import os
 import json
+import threading
 from datetime import datetime
 
+from memory_archive.log_store import LOG_STORE_ENABLED, jsonl_lock, log_store
+
 MEMORY_FILE = "memory_archive/tex_memory.jsonl"
 HEAL_LOG_FILE = "memory_archive/memory_healing_log.jsonl"
+HEAL_STATE_FILE = "memory_archive/.tex_memory_heal_state.json"  # last scanned byte offset + inode
+SHORT_REPAIR = "[HEALED]"
 
-def self_heal_memory():
-    healed_entries = 0
-    rewritten = []
 
-    if not os.path.exists(MEMORY_FILE):
-        return
+def _repair(entry):
+    """Replacement reasoning for a damaged entry, or None when it is healthy."""
+    reasoning = entry.get("reasoning")
+    if not isinstance(reasoning, str) or not reasoning.strip():
+        return "[HEALED] Reasoning missing — entry repaired."
+    if reasoning == "None" or "???" in reasoning:
+        return f"[HEALED @ {datetime.utcnow().isoformat()}] Corrupted reasoning replaced."
+    return None
 
-    try:
-        with open(MEMORY_FILE, "r") as f:
-            lines = f.readlines()
 
-        for i, line in enumerate(lines):
+def _fixed_length_patch(entry: dict, fix: str, length: int):
+    """
+    The healed entry encoded to exactly `length` bytes (space-padded before the newline),
+    falling back to the short marker when the full note does not fit; None if neither fits.
+    """
+    for reasoning in (fix, SHORT_REPAIR):
+        encoded = json.dumps({**entry, "reasoning": reasoning}, separators=(",", ":")).encode("utf-8")
+        if len(encoded) + 1 <= length:
+            return encoded + b" " * (length - len(encoded) - 1) + b"\n"
+    return None
+
+
+def _blank_line(length: int) -> bytes:
+    """Whitespace of a line's exact length: every JSONL reader here skips blank lines."""
+    return b" " * (length - 1) + b"\n"
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class IncrementalMemoryHealer:
+    """
+    Remembers the byte offset it has healed up to. Each pass parses only the complete
+    lines appended after it. A healed entry is written back over its own line at the same
+    length, so the file is never rewritten or renamed and concurrent appends are never lost.
+    An entry whose repair cannot fit its line is superseded: the line is blanked and the
+    healed record appended at the end. The log store is re-synced after every patch, since
+    same-size writes are invisible to its offset importer.
+    """
+
+    def __init__(self, path: str = MEMORY_FILE, state_path: str = HEAL_STATE_FILE, log_path: str = HEAL_LOG_FILE,
+                 store=None):
+        self.path = path
+        self.state_path = state_path
+        self.log_path = log_path
+        self.store = store if store is not None else (log_store if LOG_STORE_ENABLED else None)
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path, "r") as f:
+                state = json.load(f)
+            return {"offset": int(state.get("offset", 0)), "inode": int(state.get("inode", 0))}
+        except (OSError, ValueError):
+            return {"offset": 0, "inode": 0}
+
+    def _save_state(self):
+        _write_atomic(self.state_path, json.dumps(self.state).encode("utf-8"))
+
+    def heal(self) -> int:
+        """Heal newly appended entries; returns how many were repaired."""
+        with self._lock:
             try:
-                entry = json.loads(line)
-                if "reasoning" not in entry or not entry["reasoning"].strip():
-                    entry["reasoning"] = "[HEALED] Reasoning missing — entry repaired."
-                    healed_entries += 1
-                    rewritten.append(entry)
-                elif entry.get("reasoning") == "None" or "???" in entry.get("reasoning", ""):
-                    entry["reasoning"] = f"[HEALED @ {datetime.utcnow().isoformat()}] Corrupted reasoning replaced."
-                    healed_entries += 1
-                    rewritten.append(entry)
-            except json.JSONDecodeError:
-                continue
-
-        if healed_entries > 0:
-            with open(MEMORY_FILE, "w") as f:
-                for entry in rewritten:
-                    f.write(json.dumps(entry) + "\n")
-
-            with open(HEAL_LOG_FILE, "a") as logf:
+                f = open(self.path, "r+b")
+            except FileNotFoundError:
+                return 0
+            with f:
+                st = os.fstat(f.fileno())
+                offset = self.state["offset"]
+                if st.st_ino != self.state["inode"] or st.st_size < offset:
+                    offset = 0  # file replaced or truncated by someone else: rescan it
+                if st.st_size == offset:
+                    return 0
+
+                f.seek(offset)
+                chunk = f.read(st.st_size - offset)
+                chunk = chunk[:chunk.rfind(b"\n") + 1]  # a trailing partial line is left for the next breath
+
+                in_place, overflow = [], []
+                position = offset
+                for raw in chunk.splitlines(keepends=True):
+                    start, position = position, position + len(raw)
+                    try:
+                        entry = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    fix = _repair(entry)
+                    if fix is None:
+                        continue
+                    patch = _fixed_length_patch(entry, fix, len(raw))
+                    if patch is not None:
+                        in_place.append((start, patch))
+                    else:
+                        in_place.append((start, _blank_line(len(raw))))
+                        overflow.append(json.dumps({**entry, "reasoning": fix}) + "\n")
+
+                if in_place:
+                    # Same lock as append_jsonl: patched lines keep their length, and superseding
+                    # records are appended at the end as any other writer would
+                    with jsonl_lock(f):
+                        for start, patch in in_place:
+                            os.pwrite(f.fileno(), patch, start)
+                        if overflow:
+                            os.pwrite(f.fileno(), "".join(overflow).encode("utf-8"), os.fstat(f.fileno()).st_size)
+                        os.fsync(f.fileno())
+
+            healed = len(in_place)
+            self.state = {"offset": offset + len(chunk), "inode": st.st_ino}
+            self._save_state()
+            if healed and self.store is not None:
+                self.store.reimport(self.path)
+
+        if healed:
+            with open(self.log_path, "a") as logf:
                 logf.write(json.dumps({
                     "timestamp": datetime.utcnow().isoformat(),
-                    "healed_count": healed_entries
+                    "healed_count": healed,
+                    "superseded": len(overflow)
                 }) + "\n")
+        return healed
 
+
+memory_healer = IncrementalMemoryHealer()
+
+
+def self_heal_memory():
+    try:
+        return memory_healer.heal()
     except Exception as e:
-        print(f"[MEMORY HEALING ERROR] {e}")
\ No newline at end of file
+        print(f"[MEMORY HEALING ERROR] {e}")
+        return 0
@@ -2,15 +2,251 @@
 # © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
 # File: agentic_ai/embedding_engine.py
 # Tier: ΩΩΩΩ — Sovereign Embedding Engine
-# Purpose: Converts input text into normalized embeddings for Qdrant
+# Purpose: One shared, micro-batching embedding service with LRU + disk cache for every memory layer
 # ============================================================
 
-from sentence_transformers import SentenceTransformer
+import os
+import hashlib
+import sqlite3
+import threading
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future
+from queue import Queue, Empty
+from typing import List, Optional
+
+import numpy as np
+
+# === Configuration ===
+EMBED_MODEL = os.getenv("TEX_EMBED_MODEL", "all-MiniLM-L6-v2")
+EMBED_DIM = 384
+EMBED_BATCH_SIZE = int(os.getenv("TEX_EMBED_BATCH", "64"))        # max texts per encode call
+EMBED_BATCH_WAIT = float(os.getenv("TEX_EMBED_WAIT_MS", "4")) / 1000.0  # coalescing window
+EMBED_CACHE_SIZE = int(os.getenv("TEX_EMBED_CACHE_SIZE", "20000"))  # in-memory LRU entries
+EMBED_CACHE_DIR = os.getenv("TEX_EMBED_CACHE_DIR")                # unset = no disk cache
+EMBED_DEVICE = os.getenv("TEX_EMBED_DEVICE")                      # unset = auto (cuda > mps > cpu)
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _pick_device() -> str:
+    if EMBED_DEVICE:
+        return EMBED_DEVICE
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+        if torch.backends.mps.is_available():
+            return "mps"
+    except Exception:
+        pass
+    return "cpu"
+
+
+# === Disk Cache (SQLite, owned by the worker thread) ===
+class _DiskCache:
+    def __init__(self, directory: str, model_name: str):
+        os.makedirs(directory, exist_ok=True)
+        safe_name = model_name.replace("/", "_")
+        self.path = os.path.join(directory, f"embeddings_{safe_name}.sqlite")
+        self.conn = None
+
+    def _connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS emb (k TEXT PRIMARY KEY, v BLOB)")
+        return self.conn
+
+    def get_many(self, keys: List[str]) -> dict:
+        if not keys:
+            return {}
+        conn = self._connect()
+        found = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for k, blob in conn.execute(f"SELECT k, v FROM emb WHERE k IN ({marks})", chunk):
+                found[k] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put_many(self, items: dict):
+        if not items:
+            return
+        conn = self._connect()
+        conn.executemany(
+            "INSERT OR REPLACE INTO emb (k, v) VALUES (?, ?)",
+            [(k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in items.items()]
+        )
+        conn.commit()
+
+
+# === Embedding Service ===
+class EmbeddingService:
+    """
+    Process-wide embedding front door. Callers on any thread submit texts;
+    a single worker coalesces them into micro-batches for one model.encode call.
+    """
+
+    def __init__(self, model_name: str = EMBED_MODEL, batch_size: int = EMBED_BATCH_SIZE,
+                 batch_wait: float = EMBED_BATCH_WAIT, cache_size: int = EMBED_CACHE_SIZE,
+                 cache_dir: Optional[str] = EMBED_CACHE_DIR):
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.cache_size = cache_size
+        self.disk = _DiskCache(cache_dir, model_name) if cache_dir else None
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._lru = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._requests = Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "encoded": 0, "batches": 0}
+
+    # === Model ===
+    @property
+    def model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    device = _pick_device()
+                    print(f"[📦] Loading embedding model: {self.model_name} on {device.upper()}")
+                    self._model = SentenceTransformer(self.model_name, device=device)
+        return self._model
+
+    # === LRU ===
+    def _cache_get(self, key: str):
+        with self._lru_lock:
+            vec = self._lru.get(key)
+            if vec is not None:
+                self._lru.move_to_end(key)
+            return vec
+
+    def _cache_put(self, key: str, vec: list):
+        with self._lru_lock:
+            self._lru[key] = vec
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+
+    # === Public API ===
+    def embed_text(self, text: str) -> List[float]:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts; duplicates and cached texts are never re-encoded."""
+        self.stats["requests"] += len(texts)
+        results: List[Optional[list]] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            key = text_key(text)
+            vec = self._cache_get(key)
+            if vec is not None:
+                self.stats["cache_hits"] += 1
+                results[i] = vec
+            else:
+                pending.append((i, key, text))
+
+        if pending:
+            futures = []
+            for i, key, text in pending:
+                fut = Future()
+                self._requests.put((key, text, fut))
+                futures.append((i, fut))
+            self._ensure_worker()
+            for i, fut in futures:
+                results[i] = fut.result()
+        return results
+
+    # === Worker ===
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="embedding-service", daemon=True)
+                self._worker.start()
+
+    def _collect_batch(self) -> list:
+        batch = [self._requests.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._requests.get(timeout=self.batch_wait))
+            except Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            try:
+                self._encode_batch(batch)
+            except Exception as e:
+                print(f"❌ [EMBED SERVICE ERROR] {e}")
+                traceback.print_exc()
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+    def _encode_batch(self, batch: list):
+        waiters = {}
+        texts = {}
+        for key, text, fut in batch:
+            waiters.setdefault(key, []).append(fut)
+            texts[key] = text
+
+        resolved = {}
+        for key in list(texts):
+            vec = self._cache_get(key)
+            if vec is not None:
+                resolved[key] = vec
+        if self.disk:
+            resolved.update(self.disk.get_many([k for k in texts if k not in resolved]))
+
+        misses = [k for k in texts if k not in resolved]
+        if misses:
+            encoded = self.model.encode(
+                [texts[k] for k in misses],
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+            fresh = {k: row.tolist() for k, row in zip(misses, encoded)}
+            resolved.update(fresh)
+            self.stats["encoded"] += len(misses)
+            self.stats["batches"] += 1
+            if self.disk:
+                try:
+                    self.disk.put_many(fresh)
+                except Exception as e:
+                    print(f"⚠️ [EMBED CACHE] Disk write failed: {e}")
+
+        for key, futs in waiters.items():
+            vec = resolved[key]
+            self._cache_put(key, vec)
+            for fut in futs:
+                fut.set_result(vec)
+
+
+# === Shared Instance ===
+embedding_service = EmbeddingService()
 
-_model = SentenceTransformer("all-MiniLM-L6-v2")
 
 def embed_text(text: str) -> list:
     """
     Converts input text into a normalized embedding vector.
     """
-    return _model.encode(text, normalize_embeddings=True).tolist()
\ No newline at end of file
+    return embedding_service.embed_text(text)
+
+
+def embed_many(texts: List[str]) -> List[list]:
+    """
+    Converts a batch of texts into normalized embedding vectors (order preserved).
+    """
+    return embedding_service.embed_many(texts)
@@ -0,0 +1,452 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: agentic_ai/local_vector_store.py
+# Tier: ΩΩΩΩ — In-Process Reflex Memory Store
+# Purpose: Milvus-compatible vector memory that lives inside the interpreter (single node, CI, tests)
+# ============================================================
+
+import os
+import json
+import uuid
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Dict, Optional, Union
+
+import numpy as np
+
+from agentic_ai.embedding_engine import embedding_service, EMBED_DIM
+from agentic_ai.memory_backends import to_epoch_ms, normalize_tags, recall_window_ms
+
+# === Configuration ===
+VECTOR_DIM = EMBED_DIM + 4  # text + emotion
+INITIAL_CAPACITY = 1024
+STORE_DIR = os.getenv("TEX_LOCAL_STORE_DIR")                           # unset = RAM only
+SEARCH_BLOCK_ROWS = int(os.getenv("TEX_LOCAL_BLOCK_ROWS", "65536"))    # rows per matmul block
+INDEX_TYPE = os.getenv("TEX_LOCAL_INDEX", "flat").strip().lower()      # flat | ivf | ivfpq
+IVF_NLIST = int(os.getenv("TEX_LOCAL_NLIST", "256"))
+IVF_NPROBE = int(os.getenv("TEX_LOCAL_NPROBE", "8"))
+IVF_MIN_TRAIN = int(os.getenv("TEX_LOCAL_MIN_TRAIN", "8192"))          # below this, search stays exact
+PQ_SUBSPACES = int(os.getenv("TEX_LOCAL_PQ_M", "16"))
+PQ_RERANK = int(os.getenv("TEX_LOCAL_PQ_RERANK", "8"))                 # exact re-rank top_k * this
+
+
+def _normalize(mat: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(mat, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return mat / norms
+
+
+def _merge_topk(best_scores, best_ids, scores, ids, k):
+    """Merge a new block of candidates into the running (Q, k) top-k."""
+    scores = np.concatenate([best_scores, scores], axis=1)
+    ids = np.concatenate([best_ids, ids], axis=1)
+    if scores.shape[1] > k:
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, part, axis=1)
+        ids = np.take_along_axis(ids, part, axis=1)
+    return scores, ids
+
+
+def _kmeans(data: np.ndarray, k: int, iters: int = 12, seed: int = 7) -> np.ndarray:
+    """Plain Lloyd's k-means on float32 rows; returns (k, d) centroids."""
+    rng = np.random.default_rng(seed)
+    k = min(k, data.shape[0])
+    centroids = data[rng.choice(data.shape[0], k, replace=False)].copy()
+    for _ in range(iters):
+        # argmin ||x - c||^2 == argmax (x·c - ||c||^2 / 2)
+        assign = np.argmax(data @ centroids.T - 0.5 * np.sum(centroids ** 2, axis=1), axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, data)
+        counts = np.bincount(assign, minlength=k)[:, None]
+        empty = counts[:, 0] == 0
+        centroids = np.where(empty[:, None], centroids, sums / np.maximum(counts, 1))
+    return centroids.astype(np.float32)
+
+
+# === IVF / IVF-PQ Index ===
+class _IVFIndex:
+    def __init__(self, dim: int, nlist: int, pq_m: int = 0):
+        self.dim = dim
+        self.nlist = nlist
+        self.pq_m = pq_m
+        self.centroids = None
+        self.lists: List[List[int]] = []
+        self.codebooks = None          # (m, 256, sub_dim)
+        self.codes = None              # (capacity, m) uint8
+        self.sub_dim = 0
+        self.pad = 0
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def train(self, data: np.ndarray):
+        self.centroids = _normalize(_kmeans(data, self.nlist))
+        self.lists = [[] for _ in range(self.centroids.shape[0])]
+        if self.pq_m:
+            self.sub_dim = -(-self.dim // self.pq_m)
+            self.pad = self.sub_dim * self.pq_m - self.dim
+            padded = self._pad(data)
+            self.codebooks = np.stack([
+                _kmeans(padded[:, i * self.sub_dim:(i + 1) * self.sub_dim], 256, iters=8, seed=i)
+                for i in range(self.pq_m)
+            ])
+            self.codes = np.zeros((0, self.pq_m), dtype=np.uint8)
+
+    def _pad(self, data: np.ndarray) -> np.ndarray:
+        return np.pad(data, ((0, 0), (0, self.pad))) if self.pad else data
+
+    def _encode(self, data: np.ndarray) -> np.ndarray:
+        padded = self._pad(data)
+        codes = np.empty((data.shape[0], self.pq_m), dtype=np.uint8)
+        for i in range(self.pq_m):
+            sub = padded[:, i * self.sub_dim:(i + 1) * self.sub_dim]
+            book = self.codebooks[i]
+            codes[:, i] = np.argmax(sub @ book.T - 0.5 * np.sum(book ** 2, axis=1), axis=1)
+        return codes
+
+    def add(self, start: int, data: np.ndarray):
+        assign = np.argmax(data @ self.centroids.T, axis=1)
+        for offset, c in enumerate(assign):
+            self.lists[c].append(start + offset)
+        if self.pq_m:
+            needed = start + data.shape[0]
+            if self.codes.shape[0] < needed:
+                grown = np.zeros((max(needed, self.codes.shape[0] * 2), self.pq_m), dtype=np.uint8)
+                grown[:self.codes.shape[0]] = self.codes
+                self.codes = grown
+            self.codes[start:needed] = self._encode(data)
+
+    def candidates(self, q: np.ndarray, nprobe: int) -> np.ndarray:
+        probe = np.argsort(-(self.centroids @ q))[:nprobe]
+        ids = [self.lists[c] for c in probe if self.lists[c]]
+        return np.concatenate([np.asarray(l, dtype=np.int64) for l in ids]) if ids else np.zeros(0, dtype=np.int64)
+
+    def pq_scores(self, q: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Asymmetric inner-product estimate from per-subspace lookup tables."""
+        qp = self._pad(q[None, :])[0]
+        tables = np.einsum("msd,md->ms", self.codebooks, qp.reshape(self.pq_m, self.sub_dim))
+        return tables[np.arange(self.pq_m), self.codes[ids]].sum(axis=1)
+
+
+# === Store ===
+class LocalVectorStore:
+    """
+    Drop-in for MilvusMemoryRouter: same store/query/recall API over a contiguous float32
+    matrix (memory-mapped when a directory is configured). Exact search runs as blocked
+    matrix multiplies; an optional IVF or IVF-PQ index narrows the scan on large stores.
+    """
+
+    def __init__(self, path: Optional[str] = STORE_DIR, dim: int = VECTOR_DIM,
+                 capacity: int = INITIAL_CAPACITY, index: str = INDEX_TYPE,
+                 nlist: int = IVF_NLIST, nprobe: int = IVF_NPROBE, block_rows: int = SEARCH_BLOCK_ROWS):
+        self.path = path
+        self.dim = dim
+        self.nprobe = nprobe
+        self.block_rows = max(1, block_rows)
+        self.index_type = index
+        self._index = _IVFIndex(dim, nlist, PQ_SUBSPACES if index == "ivfpq" else 0) if index in ("ivf", "ivfpq") else None
+        self._records: List[dict] = []
+        self._epochs = np.zeros(capacity, dtype=np.int64)     # row -> epoch ms (time-range scans)
+        self._tag_rows = defaultdict(list)                    # tag -> ascending row ids (inverted index)
+        self._lock = threading.RLock()
+        self._records_file = None
+
+        if path:
+            os.makedirs(path, exist_ok=True)
+            self._load_records()
+            capacity = max(capacity, len(self._records))
+            self._vectors = self._open_matrix(capacity)
+            self._index_records(0, self._records)
+            self._records_file = open(os.path.join(path, "records.jsonl"), "a", encoding="utf-8")
+        else:
+            self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._maybe_train()
+
+    def __len__(self):
+        return len(self._records)
+
+    # === Persistence ===
+    def _matrix_path(self) -> str:
+        return os.path.join(self.path, "vectors.f32")
+
+    def _open_matrix(self, capacity: int) -> np.ndarray:
+        path = self._matrix_path()
+        needed = capacity * self.dim * 4
+        if not os.path.exists(path) or os.path.getsize(path) < needed:
+            with open(path, "ab") as f:
+                f.truncate(needed)
+        rows = os.path.getsize(path) // (self.dim * 4)
+        return np.memmap(path, dtype=np.float32, mode="r+", shape=(rows, self.dim))
+
+    def _load_records(self):
+        path = os.path.join(self.path, "records.jsonl")
+        if not os.path.exists(path):
+            return
+        good = 0  # byte offset just past the last intact record
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # unterminated tail: the write was cut off
+                try:
+                    self._records.append(json.loads(line))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break  # torn tail write; vectors past this row are ignored
+                good += len(line)
+        if good < os.path.getsize(path):
+            # Drop the torn tail so later appends are not stranded behind it on the next reload
+            with open(path, "r+b") as f:
+                f.truncate(good)
+            print(f"⚠️ [LOCAL STORE] Truncated torn tail of {path} at byte {good}")
+        print(f"🧠 [LOCAL STORE] Loaded {len(self._records)} records from {self.path}")
+
+    def _index_records(self, start: int, records: List[dict]):
+        stop = start + len(records)
+        if stop > self._epochs.shape[0]:
+            grown = np.zeros(max(stop, self._epochs.shape[0] * 2), dtype=np.int64)
+            grown[:start] = self._epochs[:start]
+            self._epochs = grown
+        for row, record in enumerate(records, start):
+            epoch = record.get("ts_epoch")
+            self._epochs[row] = epoch if epoch is not None else to_epoch_ms(record.get("timestamp"))
+            for tag in normalize_tags(record.get("tags")):
+                self._tag_rows[tag].append(row)
+
+    def _grow(self, needed: int):
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        if self.path:
+            self._vectors.flush()
+            del self._vectors
+            self._vectors = self._open_matrix(new_capacity)
+        else:
+            grown = np.zeros((new_capacity, self.dim), dtype=np.float32)
+            grown[:capacity] = self._vectors
+            self._vectors = grown
+
+    # === Embedding ===
+    def embed_text(self, text: str) -> List[float]:
+        try:
+            return embedding_service.embed_text(text)
+        except Exception as e:
+            print(f"❌ [EMBED ERROR] {e}")
+            return [0.0] * EMBED_DIM
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        try:
+            return embedding_service.embed_many(texts)
+        except Exception as e:
+            print(f"❌ [EMBED ERROR] {e}")
+            return [[0.0] * EMBED_DIM for _ in texts]
+
+    # === Writes ===
+    def _append_many(self, vectors: np.ndarray, records: List[dict]):
+        with self._lock:
+            start = len(self._records)
+            self._grow(start + len(records))
+            self._vectors[start:start + len(records)] = _normalize(vectors)
+            self._records.extend(records)
+            self._index_records(start, records)
+            if self._records_file:
+                self._records_file.write("".join(json.dumps(r) + "\n" for r in records))
+            if self._index is not None and self._index.trained:
+                self._index.add(start, self._vectors[start:start + len(records)])
+            else:
+                self._maybe_train()
+
+    def _build_record(self, text: str, metadata: Dict, vector: Optional[List[float]]):
+        base_vector = list(vector) if vector is not None else self.embed_text(text)
+        emotion_raw = metadata.get("emotion_vector", [0.5, 0.5, 0.0, 0.0])
+        emotion_vector = emotion_raw.tolist() if isinstance(emotion_raw, np.ndarray) else list(emotion_raw)
+        combined = np.asarray(base_vector + emotion_vector, dtype=np.float32)
+        if combined.shape[0] != self.dim:
+            print(f"⚠️ [MEMORY SKIP] Vector dim {combined.shape[0]} != {self.dim}")
+            return None, None
+
+        tags = metadata.get("tags", [])
+        timestamp = metadata.get("timestamp", datetime.utcnow().isoformat())
+        record = {
+            "id": str(uuid.uuid4()),
+            "timestamp": str(timestamp),
+            "ts_epoch": to_epoch_ms(timestamp),
+            "entropy": float(metadata.get("entropy", 0.5)),
+            "summary": metadata.get("summary", text[:200]),
+            "tags": ",".join(tags) if isinstance(tags, list) else str(tags),
+        }
+        return combined, record
+
+    def store(self, text: str, metadata: Dict, vector: Optional[List[float]] = None) -> Optional[str]:
+        if not text or not isinstance(text, str):
+            print("⚠️ [MEMORY SKIP] Invalid text.")
+            return None
+        combined, record = self._build_record(text, metadata, vector)
+        if record is None:
+            return None
+        self._append_many(combined[None, :], [record])
+        return record["id"]
+
+    def store_many(self, texts: List[str], metadatas: List[Dict]) -> List[Optional[str]]:
+        """Bulk store: one embedding batch and one matrix write for the whole list."""
+        vectors = self.embed_many(texts)
+        rows, records, ids = [], [], []
+        for text, metadata, vector in zip(texts, metadatas, vectors):
+            combined, record = self._build_record(text, metadata, vector) if text else (None, None)
+            ids.append(record["id"] if record else None)
+            if record:
+                rows.append(combined)
+                records.append(record)
+        if records:
+            self._append_many(np.stack(rows), records)
+        return ids
+
+    def store_vector_trace(self, vector: List[float], summary: str, tags: Union[List[str], str]):
+        metadata = {
+            "summary": summary,
+            "timestamp": datetime.utcnow().isoformat(),
+            "tags": tags if isinstance(tags, list) else [tags],
+            "entropy": 0.5,
+            "emotion_vector": [0.5, 0.5, 0.0, 0.0]
+        }
+        return self.store(summary, metadata, vector)
+
+    # === Index ===
+    def _maybe_train(self):
+        if self._index is None or self._index.trained or len(self._records) < IVF_MIN_TRAIN:
+            return
+        self.build_index()
+
+    def build_index(self):
+        """(Re)train the IVF index on the current matrix and assign every row."""
+        if self._index is None:
+            return
+        with self._lock:
+            n = len(self._records)
+            if n == 0:
+                return
+            sample = self._vectors[:n]
+            if n > 50000:
+                sample = sample[np.random.default_rng(0).choice(n, 50000, replace=False)]
+            self._index.train(np.asarray(sample))
+            for start in range(0, n, self.block_rows):
+                self._index.add(start, np.asarray(self._vectors[start:min(n, start + self.block_rows)]))
+            print(f"🧭 [LOCAL STORE] {self.index_type.upper()} index trained on {n} rows")
+
+    # === Reads ===
+    def _prepare_queries(self, vectors) -> np.ndarray:
+        q = np.zeros((len(vectors), self.dim), dtype=np.float32)
+        for i, v in enumerate(vectors):
+            v = np.asarray(v, dtype=np.float32)[:self.dim]
+            q[i, :v.shape[0]] = v
+        return _normalize(q)
+
+    def _exact_topk(self, q: np.ndarray, n: int, k: int):
+        best_scores = np.full((q.shape[0], 0), -np.inf, dtype=np.float32)
+        best_ids = np.zeros((q.shape[0], 0), dtype=np.int64)
+        for start in range(0, n, self.block_rows):
+            stop = min(n, start + self.block_rows)
+            scores = q @ self._vectors[start:stop].T
+            kk = min(k, stop - start)
+            part = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+            best_scores, best_ids = _merge_topk(
+                best_scores, best_ids,
+                np.take_along_axis(scores, part, axis=1), part + start, k
+            )
+        return best_scores, best_ids
+
+    def _ivf_topk(self, qv: np.ndarray, k: int):
+        ids = self._index.candidates(qv, self.nprobe)
+        if ids.size == 0:
+            return np.zeros(0, dtype=np.float32), ids
+        if self._index.pq_m:
+            approx = self._index.pq_scores(qv, ids)
+            keep = min(ids.size, k * PQ_RERANK)
+            ids = ids[np.argpartition(-approx, keep - 1)[:keep]]
+        scores = self._vectors[np.sort(ids)] @ qv
+        ids = np.sort(ids)
+        kk = min(k, ids.size)
+        part = np.argpartition(-scores, kk - 1)[:kk]
+        return scores[part], ids[part]
+
+    def query_many(self, vectors: List[List[float]], top_k: int = 5) -> List[list]:
+        """Batched search: one result list per query vector, best first."""
+        with self._lock:
+            n = len(self._records)
+            if n == 0 or not len(vectors):
+                return [[] for _ in vectors]
+            q = self._prepare_queries(vectors)
+            k = min(top_k, n)
+            results = []
+            if self._index is not None and self._index.trained:
+                for qv in q:
+                    scores, ids = self._ivf_topk(qv, k)
+                    order = np.argsort(-scores)
+                    results.append([{**self._records[ids[j]], "distance": float(scores[j])} for j in order])
+                return results
+            scores, ids = self._exact_topk(q, n, k)
+            order = np.argsort(-scores, axis=1)
+            for row in range(q.shape[0]):
+                results.append([
+                    {**self._records[ids[row, j]], "distance": float(scores[row, j])} for j in order[row]
+                ])
+            return results
+
+    def query(self, text: str, top_k: int = 5):
+        return self.query_by_vector(self.embed_text(text), top_k=top_k)
+
+    def query_by_vector(self, vector: List[float], top_k: int = 5):
+        return self.query_many([vector], top_k=top_k)[0]
+
+    def _rows_for_tags(self, tags) -> np.ndarray:
+        lists = [self._tag_rows[t] for t in normalize_tags(tags) if t in self._tag_rows]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate([np.asarray(l, dtype=np.int64) for l in lists]))
+
+    def _newest(self, rows: np.ndarray, top_k: int) -> list:
+        if rows.size > top_k:
+            rows = rows[np.argpartition(-self._epochs[rows], top_k - 1)[:top_k]]
+        rows = rows[np.argsort(-self._epochs[rows], kind="stable")]
+        return [dict(self._records[i]) for i in rows]
+
+    def recall_recent(self, minutes: int = 5, top_k: int = 10, hours: Optional[float] = None,
+                      tags: Optional[List[str]] = None) -> list:
+        """Newest records inside the window (optionally restricted to any of `tags`)."""
+        cutoff = recall_window_ms(minutes, hours)
+        with self._lock:
+            n = len(self._records)
+            if n == 0 or top_k <= 0:
+                return []
+            if tags:
+                rows = self._rows_for_tags(tags)
+                rows = rows[self._epochs[rows] >= cutoff]
+            else:
+                rows = np.flatnonzero(self._epochs[:n] >= cutoff)
+            return self._newest(rows, top_k)
+
+    def query_by_tags(self, tags: List[str], top_k: int = 10) -> list:
+        """Newest records carrying any of `tags`, served from the inverted tag index."""
+        with self._lock:
+            if top_k <= 0:
+                return []
+            return self._newest(self._rows_for_tags(tags), top_k)
+
+    # === Lifecycle (parity with MilvusMemoryRouter) ===
+    def flush(self, seal: bool = False):
+        with self._lock:
+            if self._records_file:
+                self._records_file.flush()
+            if seal and isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+
+    def close(self):
+        with self._lock:
+            self.flush(seal=True)
+            if self._records_file:
+                self._records_file.close()
+                self._records_file = None
+
+    def pending_writes(self) -> int:
+        return 0
@@ -0,0 +1,118 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: agentic_ai/memory_backends.py
+# Tier: ΩΩΩΩ — Pluggable Vector Memory Backend Registry
+# Purpose: Resolve the active memory backend (Milvus, in-process, Qdrant) lazily on first use
+# ============================================================
+
+import os
+import time
+import atexit
+import importlib
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Union
+
+# === Configuration ===
+# TEX_MEMORY_BACKEND selects the store every `memory_router` import resolves to.
+DEFAULT_BACKEND = os.getenv("TEX_MEMORY_BACKEND", "milvus").strip().lower()
+
+# name -> "module:attr" (imported on first use) or a zero-arg factory
+_BACKENDS: Dict[str, Union[str, Callable]] = {
+    "milvus": "agentic_ai.milvus_memory_router:MilvusMemoryRouter",
+    "inprocess": "agentic_ai.local_vector_store:LocalVectorStore",
+    "qdrant": "agentic_ai.qdrant_memory_router:QdrantMemoryRouter",
+}
+_ALIASES = {"local": "inprocess", "numpy": "inprocess", "memory": "inprocess"}
+
+_instances = {}
+_lock = threading.RLock()
+
+
+def register_backend(name: str, factory: Union[str, Callable]):
+    """Register a backend by name; `factory` is a zero-arg callable or a "module:attr" path."""
+    with _lock:
+        _BACKENDS[name.lower()] = factory
+
+
+def available_backends() -> list:
+    return sorted(_BACKENDS)
+
+
+def _resolve(factory: Union[str, Callable]) -> Callable:
+    if callable(factory):
+        return factory
+    module_name, attr = factory.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def get_memory_backend(name: str = None):
+    """Return the shared instance of the named backend (default: TEX_MEMORY_BACKEND)."""
+    key = (name or DEFAULT_BACKEND).lower()
+    key = _ALIASES.get(key, key)
+    instance = _instances.get(key)
+    if instance is not None:
+        return instance
+    with _lock:
+        if key not in _instances:
+            if key not in _BACKENDS:
+                raise KeyError(f"❌ Unknown memory backend '{key}'. Available: {available_backends()}")
+            _instances[key] = _resolve(_BACKENDS[key])()
+            print(f"🧠 [MEMORY BACKEND] {key} ready")
+        return _instances[key]
+
+
+def close_all_backends():
+    with _lock:
+        for name, instance in list(_instances.items()):
+            close = getattr(instance, "close", None)
+            if close:
+                try:
+                    close()
+                except Exception as e:
+                    print(f"⚠️ [MEMORY BACKEND] close failed for {name}: {e}")
+
+atexit.register(close_all_backends)
+
+
+# === Shared Record Helpers ===
+def to_epoch_ms(ts) -> int:
+    """Epoch milliseconds for an ISO string, datetime, or epoch number; naive values are UTC."""
+    if ts is None or ts == "":
+        return int(time.time() * 1000)
+    if isinstance(ts, (int, float)):
+        return int(ts * 1000) if ts < 1e11 else int(ts)
+    try:
+        dt = ts if isinstance(ts, datetime) else datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        return int(time.time() * 1000)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def normalize_tags(tags) -> List[str]:
+    """Tags as a clean list whether given as a list or the legacy comma-joined string."""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return [str(t).strip() for t in tags if str(t).strip()]
+
+
+def recall_window_ms(minutes: float = 5, hours: float = None) -> int:
+    """Cutoff (epoch ms) for a recall window given in minutes or hours."""
+    span = hours * 3600.0 if hours is not None else minutes * 60.0
+    return int((time.time() - span) * 1000)
+
+
+# === Safe Lazy Singleton ===
+class _MemoryBackendLazyInit:
+    def __init__(self, name: str = None):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(get_memory_backend(self._name), attr)
+
+
+memory_backend = _MemoryBackendLazyInit()
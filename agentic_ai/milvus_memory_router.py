@@ -8,125 +8,278 @@
 import os
 import time
 import uuid
+import threading
 import traceback
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 from typing import List, Dict, Optional, Union
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from pymilvus import (
-    connections, Collection, CollectionSchema,
-    FieldSchema, DataType, utility
-)
+
+from agentic_ai.embedding_engine import embedding_service, EMBED_DIM, EMBED_MODEL
+from agentic_ai.memory_backends import to_epoch_ms, normalize_tags, recall_window_ms
 
 # === Configuration ===
 COLLECTION_NAME = "tex_memory"
-EMBED_DIM = 384
-EMBED_MODEL = "all-MiniLM-L6-v2"
-EMBEDDER = SentenceTransformer(EMBED_MODEL)
 VECTOR_DIM = EMBED_DIM + 4  # text + emotion
 
-# === Milvus Connection ===
+# === Write-Behind Buffer ===
+WRITE_BATCH_SIZE = int(os.getenv("TEX_MEMORY_BATCH_SIZE", "64"))          # rows per insert
+WRITE_FLUSH_INTERVAL = float(os.getenv("TEX_MEMORY_FLUSH_INTERVAL", "0.5"))  # max seconds a row waits
+WRITE_BUFFER_MAX = int(os.getenv("TEX_MEMORY_BUFFER_MAX", "4096"))         # backpressure threshold
+WRITE_PUT_TIMEOUT = float(os.getenv("TEX_MEMORY_PUT_TIMEOUT", "2.0"))      # producer wait before inline drain
+# Seal policy: "off" (let Milvus auto-seal), "batch" (flush after every insert), or a number of seconds
+SEAL_POLICY = os.getenv("TEX_MEMORY_SEAL", "off").strip().lower()
+
+# === Milvus Connection (opened on a background thread at first use) ===
 MILVUS_HOST = os.getenv("MILVUS_HOST")
 MILVUS_PORT = os.getenv("MILVUS_PORT", "19530")
+MILVUS_CONNECT_ATTEMPTS = int(os.getenv("MILVUS_CONNECT_ATTEMPTS", "5"))
+MILVUS_RETRY_DELAY = float(os.getenv("MILVUS_RETRY_DELAY", "3"))
+MILVUS_RETRY_COOLDOWN = float(os.getenv("MILVUS_RETRY_COOLDOWN", "30"))  # seconds offline before reconnecting
+MILVUS_AUTO_MIGRATE = os.getenv("MILVUS_AUTO_MIGRATE", "0") == "1"           # upgrade legacy schema on connect
 
-if not MILVUS_HOST:
-    raise EnvironmentError("❌ MILVUS_HOST environment variable is not set.")
+INDEX_PARAMS = {
+    "index_type": "IVF_FLAT",
+    "metric_type": "COSINE",
+    "params": {"nlist": 1024}
+}
 
-connected = False
-collection = None
-for attempt in range(5):
-    try:
-        connections.connect(host=MILVUS_HOST, port=MILVUS_PORT)
-        connected = True
-        print(f"✅ [MILVUS CONNECTED] {MILVUS_HOST}:{MILVUS_PORT}")
-        break
-    except Exception:
-        print(f"⏳ [RETRY {attempt+1}/5] Milvus not ready... retrying in 3s")
-        time.sleep(3)
+# === Schema v2: epoch INT64 time + ARRAY tag list, both scalar-indexed ===
+MAX_TAGS = 32
+MAX_TAG_LENGTH = 64
+OUTPUT_FIELDS = ["summary", "timestamp", "tags", "entropy"]
+SCALAR_INDEXES = {
+    "ts_epoch": {"index_type": "STL_SORT"},
+    "tag_list": {"index_type": "INVERTED"},
+}
+MIGRATION_BATCH = 1000
 
-if not connected:
-    raise ConnectionError(f"❌ Failed to connect to Milvus at {MILVUS_HOST}:{MILVUS_PORT} after 5 attempts.")
+def _build_schema():
+    from pymilvus import CollectionSchema, FieldSchema, DataType
 
-# === Schema Initialization ===
-try:
     fields = [
         FieldSchema(name="id", dtype=DataType.VARCHAR, is_primary=True, auto_id=False, max_length=64),
         FieldSchema(name="vector_combined", dtype=DataType.FLOAT_VECTOR, dim=VECTOR_DIM),
         FieldSchema(name="timestamp", dtype=DataType.VARCHAR, max_length=64),
+        FieldSchema(name="ts_epoch", dtype=DataType.INT64),
         FieldSchema(name="entropy", dtype=DataType.FLOAT),
         FieldSchema(name="summary", dtype=DataType.VARCHAR, max_length=512),
-        FieldSchema(name="tags", dtype=DataType.VARCHAR, max_length=256)
+        FieldSchema(name="tags", dtype=DataType.VARCHAR, max_length=256),
+        FieldSchema(name="tag_list", dtype=DataType.ARRAY, element_type=DataType.VARCHAR,
+                    max_capacity=MAX_TAGS, max_length=MAX_TAG_LENGTH)
     ]
-    schema = CollectionSchema(fields, description="Quantum-aware reflex memory store")
-
-    if not utility.has_collection(COLLECTION_NAME):
-        collection = Collection(name=COLLECTION_NAME, schema=schema)
-        print(f"✅ [MILVUS INIT] Collection created: {COLLECTION_NAME}")
-
-        collection.create_index(
-            field_name="vector_combined",
-            index_params={
-                "index_type": "IVF_FLAT",
-                "metric_type": "COSINE",
-                "params": {"nlist": 1024}
-            }
-        )
-        print("✅ [MILVUS INDEX] Index created on vector_combined")
-    else:
-        collection = Collection(COLLECTION_NAME)
-
-except Exception:
-    print("❌ [MILVUS SCHEMA ERROR]")
-    traceback.print_exc()
+    return CollectionSchema(fields, description="Quantum-aware reflex memory store")
+
+def _ensure_indexes(collection):
+    indexed = {idx.field_name for idx in collection.indexes}
+    if "vector_combined" not in indexed:
+        print("[⚙️ MILVUS] Index missing — creating index on vector_combined")
+        collection.create_index(field_name="vector_combined", index_params=INDEX_PARAMS)
+        print("✅ [MILVUS] Index successfully created.")
+    field_names = {f.name for f in collection.schema.fields}
+    for field, params in SCALAR_INDEXES.items():
+        if field in field_names and field not in indexed:
+            collection.create_index(field_name=field, index_params=params, index_name=f"{field}_idx")
+            print(f"✅ [MILVUS INDEX] Scalar index created on {field}")
+
+def _has_v2_schema(collection) -> bool:
+    return {"ts_epoch", "tag_list"} <= {f.name for f in collection.schema.fields}
+
+def migrate_legacy_collection(name: str = COLLECTION_NAME, batch_size: int = MIGRATION_BATCH):
+    """
+    Copy a v1 collection (ISO VARCHAR timestamp, comma-joined tags) into the v2 schema.
+    The old collection is kept as `<name>__legacy`; the v2 copy takes over `name`.
+    Requires an open connection (any MilvusMemoryRouter access opens one).
+    """
+    from pymilvus import Collection, utility
+
+    source = Collection(name)
+    if _has_v2_schema(source):
+        print(f"✅ [MILVUS MIGRATE] {name} already uses the v2 schema.")
+        return source
+
+    staging = f"{name}__v2"
+    if utility.has_collection(staging):
+        utility.drop_collection(staging)
+    target = Collection(name=staging, schema=_build_schema())
+    source.load()
+
+    copied = 0
+    iterator = source.query_iterator(
+        batch_size=batch_size, expr="", output_fields=["id", "vector_combined"] + OUTPUT_FIELDS
+    )
+    while True:
+        rows = iterator.next()
+        if not rows:
+            iterator.close()
+            break
+        tag_lists = [normalize_tags(r.get("tags"))[:MAX_TAGS] for r in rows]
+        target.insert([
+            [r["id"] for r in rows],
+            [r["vector_combined"] for r in rows],
+            [r.get("timestamp", "") for r in rows],
+            [to_epoch_ms(r.get("timestamp")) for r in rows],
+            [float(r.get("entropy", 0.5)) for r in rows],
+            [r.get("summary", "") for r in rows],
+            [r.get("tags", "") for r in rows],
+            [[t[:MAX_TAG_LENGTH] for t in tl] for tl in tag_lists]
+        ])
+        copied += len(rows)
+        print(f"⏳ [MILVUS MIGRATE] {copied} rows copied")
+
+    target.flush()
+    _ensure_indexes(target)
+    source.release()
+    utility.rename_collection(name, f"{name}__legacy")
+    utility.rename_collection(staging, name)
+    print(f"✅ [MILVUS MIGRATE] {copied} rows migrated; old data kept as {name}__legacy")
+    return Collection(name)
+
+def _open_collection():
+    """Connect to Milvus and return the tex_memory collection, or None when unavailable."""
+    if not MILVUS_HOST:
+        print("❌ [MILVUS OFFLINE] MILVUS_HOST environment variable is not set.")
+        return None
+
+    from pymilvus import connections, Collection, utility
+
     connected = False
-    collection = None
+    for attempt in range(MILVUS_CONNECT_ATTEMPTS):
+        try:
+            connections.connect(host=MILVUS_HOST, port=MILVUS_PORT)
+            connected = True
+            print(f"✅ [MILVUS CONNECTED] {MILVUS_HOST}:{MILVUS_PORT}")
+            break
+        except Exception:
+            print(f"⏳ [RETRY {attempt+1}/{MILVUS_CONNECT_ATTEMPTS}] Milvus not ready... retrying in {MILVUS_RETRY_DELAY:g}s")
+            time.sleep(MILVUS_RETRY_DELAY)
+
+    if not connected:
+        print(f"❌ [MILVUS OFFLINE] Failed to connect to {MILVUS_HOST}:{MILVUS_PORT} after {MILVUS_CONNECT_ATTEMPTS} attempts.")
+        return None
+
+    # === Schema Initialization ===
+    try:
+        if not utility.has_collection(COLLECTION_NAME):
+            collection = Collection(name=COLLECTION_NAME, schema=_build_schema())
+            print(f"✅ [MILVUS INIT] Collection created: {COLLECTION_NAME}")
+        else:
+            collection = Collection(COLLECTION_NAME)
+            if not _has_v2_schema(collection):
+                if MILVUS_AUTO_MIGRATE:
+                    collection = migrate_legacy_collection(COLLECTION_NAME)
+                else:
+                    print(f"⚠️ [MILVUS] {COLLECTION_NAME} uses the legacy schema — time/tag filters fall back to "
+                          "string scans. Run migrate_legacy_collection() or set MILVUS_AUTO_MIGRATE=1.")
+
+        # ✅ Index safeguard (vector + scalar) for new and existing collections
+        _ensure_indexes(collection)
+        return collection
+
+    except Exception:
+        print("❌ [MILVUS SCHEMA ERROR]")
+        traceback.print_exc()
+        return None
 
 # === MEMORY ROUTER ===
 class MilvusMemoryRouter:
-    def __init__(self):
+    def __init__(self, batch_size: int = WRITE_BATCH_SIZE, flush_interval: float = WRITE_FLUSH_INTERVAL,
+                 buffer_max: int = WRITE_BUFFER_MAX, seal_policy: str = SEAL_POLICY):
+        # === Write-behind buffer state
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.buffer_max = max(self.batch_size, buffer_max)
+        self.seal_policy = seal_policy
+        self._pending = deque()
+        self._inflight = 0  # batches taken off the buffer whose insert has not finished yet
+        self._cond = threading.Condition()
+        self._insert_lock = threading.Lock()
+        self._flusher = None
+        self._closed = False
+        self._last_seal = time.time()
+
+        # === Lazy collection handle
+        self._collection = None
+        self._collection_lock = threading.Lock()
+        self._connector = None
+        self._connect_settled = threading.Event()
+        self._retry_after = 0.0
+        self._v2 = True
+        self._loaded = False
+
+    @property
+    def collection(self):
+        """
+        Milvus collection, or None while not (yet) connected. Never blocks: the first access,
+        and the first one after each offline cooldown, starts a background connect.
+        """
+        if self._collection is None and time.time() >= self._retry_after:
+            self._start_connect()
+        return self._collection
+
+    @property
+    def connecting(self) -> bool:
+        connector = self._connector
+        return connector is not None and connector.is_alive()
+
+    def _start_connect(self):
+        with self._collection_lock:
+            if self._collection is not None or self.connecting or time.time() < self._retry_after:
+                return
+            self._connect_settled.clear()
+            self._connector = threading.Thread(target=self._connect, name="milvus-connect", daemon=True)
+            self._connector.start()
+
+    def _connect(self):
+        """Connect thread: the retry sleeps in _open_collection happen here, off every caller's path."""
+        try:
+            collection = _open_collection()
+        except Exception:
+            print("❌ [MILVUS CONNECT ERROR]")
+            traceback.print_exc()
+            collection = None
         if collection is None:
             print("⚠️ [MEMORY ROUTER OFFLINE] Milvus collection is unavailable.")
-            self.collection = None
+            self._retry_after = time.time() + MILVUS_RETRY_COOLDOWN
         else:
-            self.collection = collection
+            self._v2 = _has_v2_schema(collection)
+            self._collection = collection
+        self._connect_settled.set()
 
-            # ✅ Index safeguard for existing collections
-            try:
-                if not self.collection.has_index():
-                    print("[⚙️ MILVUS] Index missing — creating index on vector_combined")
-                    self.collection.create_index(
-                        field_name="vector_combined",
-                        index_params={
-                            "index_type": "IVF_FLAT",
-                            "metric_type": "COSINE",
-                            "params": {"nlist": 1024}
-                        }
-                    )
-                    print("✅ [MILVUS] Index successfully created.")
-            except Exception:
-                print("❌ [MILVUS INDEX ERROR]")
-                traceback.print_exc()
+    def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Block until a pending connect attempt settles; True if the collection is available."""
+        if self.collection is None and self.connecting:
+            self._connect_settled.wait(timeout)
+        return self._collection is not None
 
     def embed_text(self, text: str) -> List[float]:
         try:
-            return EMBEDDER.encode(text, normalize_embeddings=True).tolist()
+            return embedding_service.embed_text(text)
         except Exception as e:
             print(f"❌ [EMBED ERROR] {e}")
             return [0.0] * EMBED_DIM
 
-    def store(self, text: str, metadata: Dict, vector: Optional[List[float]] = None):
-        if not self.collection:
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        try:
+            return embedding_service.embed_many(texts)
+        except Exception as e:
+            print(f"❌ [EMBED ERROR] {e}")
+            return [[0.0] * EMBED_DIM for _ in texts]
+
+    def store(self, text: str, metadata: Dict, vector: Optional[List[float]] = None) -> Optional[str]:
+        # While the first connect is still in progress rows wait in the write buffer
+        if not self.collection and not self.connecting:
             print("⚠️ [MEMORY SKIP] Milvus is offline.")
-            return
+            return None
         if not text or not isinstance(text, str):
             print("⚠️ [MEMORY SKIP] Invalid text.")
-            return
+            return None
 
         try:
-            base_vector = vector or self.embed_text(text)
+            base_vector = list(vector) if vector is not None else self.embed_text(text)
             emotion_raw = metadata.get("emotion_vector", [0.5, 0.5, 0.0, 0.0])
-            emotion_vector = emotion_raw.tolist() if isinstance(emotion_raw, np.ndarray) else emotion_raw
+            emotion_vector = emotion_raw.tolist() if isinstance(emotion_raw, np.ndarray) else list(emotion_raw)
             combined_vector = base_vector + emotion_vector
 
             record_id = str(uuid.uuid4())
@@ -135,22 +288,164 @@ class MilvusMemoryRouter:
             summary = metadata.get("summary", text[:200])
             tags = metadata.get("tags", [])
             tags_str = ",".join(tags) if isinstance(tags, list) else str(tags)
+            tag_list = [t[:MAX_TAG_LENGTH] for t in normalize_tags(tags)[:MAX_TAGS]]
 
-            self.collection.insert([
-                [record_id],
-                [combined_vector],
-                [timestamp],
-                [entropy],
-                [summary],
-                [tags_str]
-            ])
-            self.collection.flush()
-
-            print(f"🧠 [MEMORY STORED] {record_id} | {summary}")
+            self._enqueue((record_id, combined_vector, str(timestamp), to_epoch_ms(timestamp),
+                           entropy, summary, tags_str, tag_list))
+            return record_id
 
         except Exception:
             print("❌ [STORE ERROR]")
             traceback.print_exc()
+            return None
+
+    # === Write-Behind Buffer ===
+    def _enqueue(self, row: tuple):
+        late = batch = None
+        with self._cond:
+            if self._closed:
+                # Late writes during interpreter shutdown go straight through; the insert runs
+                # after the lock is released (it may wait on the connection), counted in flight
+                # so flush() still waits for it
+                self._inflight += 1
+                late = [row]
+            else:
+                self._ensure_flusher()
+
+                # Backpressure: wait for the flusher to make room, then drain inline
+                if len(self._pending) >= self.buffer_max:
+                    self._cond.wait_for(lambda: len(self._pending) < self.buffer_max, timeout=WRITE_PUT_TIMEOUT)
+                if len(self._pending) >= self.buffer_max:
+                    batch = self._take_batch(len(self._pending))
+                    self._pending.append(row)
+                    self._cond.notify_all()
+                else:
+                    self._pending.append(row)
+                    if len(self._pending) >= self.batch_size:
+                        self._cond.notify_all()
+
+        if late:
+            self._insert_batch(late)
+        elif batch:
+            print(f"⚠️ [MEMORY BACKPRESSURE] Buffer full — draining {len(batch)} rows inline")
+            self._insert_batch(batch)
+
+    def _ensure_flusher(self):
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._flush_loop, name="milvus-write-behind", daemon=True)
+            self._flusher.start()
+
+    def _take_batch(self, limit: int) -> list:
+        """Pop up to `limit` rows (caller holds _cond); a non-empty batch counts as in flight."""
+        batch = []
+        while self._pending and len(batch) < limit:
+            batch.append(self._pending.popleft())
+        if batch:
+            self._inflight += 1
+        return batch
+
+    def _insert_batch(self, batch: list):
+        try:
+            self._insert_rows(batch)
+        finally:
+            with self._cond:
+                self._inflight -= 1
+                self._cond.notify_all()
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    timeout=self.flush_interval
+                )
+                if self._closed and not self._pending:
+                    return
+                batch = self._take_batch(self.batch_size)
+                self._cond.notify_all()
+            if batch:
+                self._insert_batch(batch)
+            else:
+                self._maybe_seal()
+
+    def _insert_rows(self, rows: list):
+        if not rows:
+            return
+        # Flusher-side wait: rows buffered during the initial connect are inserted once it lands
+        if not self.wait_connected(MILVUS_CONNECT_ATTEMPTS * (MILVUS_RETRY_DELAY + 1)):
+            print(f"⚠️ [MEMORY SKIP] Milvus is offline — dropped {len(rows)} buffered row(s).")
+            return
+        ids, vectors, timestamps, epochs, entropies, summaries, tags, tag_lists = (list(col) for col in zip(*rows))
+        if self._v2:
+            columns = [ids, vectors, timestamps, epochs, entropies, summaries, tags, tag_lists]
+        else:
+            columns = [ids, vectors, timestamps, entropies, summaries, tags]
+        with self._insert_lock:
+            try:
+                self.collection.insert(columns)
+                print(f"🧠 [MEMORY STORED] {len(rows)} record(s) | {summaries[-1]}")
+            except Exception:
+                print(f"❌ [STORE ERROR] Batch of {len(rows)} rows failed")
+                traceback.print_exc()
+                return
+            if self.seal_policy == "batch":
+                self._seal()
+        self._maybe_seal()
+
+    def _maybe_seal(self):
+        if self._collection is None:
+            return
+        try:
+            interval = float(self.seal_policy)
+        except ValueError:
+            return
+        if interval > 0 and time.time() - self._last_seal >= interval:
+            with self._insert_lock:
+                self._seal()
+
+    def _seal(self):
+        try:
+            self._collection.flush()
+            self._last_seal = time.time()
+        except Exception:
+            print("❌ [SEAL ERROR]")
+            traceback.print_exc()
+
+    def flush(self, seal: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Synchronously insert every buffered row, then wait for batches other threads (the
+        background flusher, a backpressured producer) already took off the buffer, so a query
+        issued after flush() sees every write that preceded it. Optionally seal segments to disk.
+        Returns False if in-flight inserts were still running after `timeout` seconds.
+        """
+        while True:
+            with self._cond:
+                batch = self._take_batch(self.batch_size)
+                self._cond.notify_all()
+            if not batch:
+                break
+            self._insert_batch(batch)
+        with self._cond:
+            drained = self._cond.wait_for(lambda: self._inflight == 0, timeout=timeout)
+        if seal and self._collection is not None:
+            with self._insert_lock:
+                self._seal()
+        return drained
+
+    def close(self):
+        """Drain the write buffer and stop the background flusher (safe to call twice)."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join(timeout=10.0)
+        self.flush(seal=True)
+
+    def pending_writes(self) -> int:
+        with self._cond:
+            return len(self._pending)
 
     def store_vector_trace(self, vector: List[float], summary: str, tags: Union[List[str], str]):
         metadata = {
@@ -166,19 +461,26 @@ class MilvusMemoryRouter:
         vector = self.embed_text(text)
         return self.query_by_vector(vector, top_k=top_k)
 
-    def query_by_vector(self, vector: List[float], top_k: int = 5):
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.collection.load()
+            self._loaded = True
+
+    def query_by_vector(self, vector: List[float], top_k: int = 5, tags: Optional[List[str]] = None):
         if not self.collection:
             print("⚠️ [QUERY SKIP] Milvus is offline.")
             return []
         try:
-            self.collection.load()
-            combined = vector + [0.0, 0.0, 0.0, 0.0]
+            self.flush()
+            self._ensure_loaded()
+            combined = list(vector) + [0.0, 0.0, 0.0, 0.0]
             results = self.collection.search(
                 data=[combined],
                 anns_field="vector_combined",
                 param={"metric_type": "COSINE", "params": {"nprobe": 10}},
                 limit=top_k,
-                output_fields=["summary", "timestamp", "tags", "entropy"]
+                expr=self._tag_expr(tags) if tags else None,
+                output_fields=OUTPUT_FIELDS
             )
             return results[0]
         except Exception:
@@ -186,28 +488,60 @@ class MilvusMemoryRouter:
             traceback.print_exc()
             return []
 
-    def recall_recent(self, minutes: int = 5, top_k: int = 10) -> list:
+    # === Scalar Filters ===
+    def _time_expr(self, cutoff_ms: int) -> str:
+        if self._v2:
+            return f"ts_epoch >= {int(cutoff_ms)}"
+        cutoff = datetime.utcfromtimestamp(cutoff_ms / 1000.0).isoformat()
+        return f'timestamp >= "{cutoff}"'
+
+    def _tag_expr(self, tags) -> str:
+        wanted = [t.replace('"', "") for t in normalize_tags(tags)]
+        if self._v2:
+            quoted = ", ".join(f'"{t}"' for t in wanted)
+            return f"array_contains_any(tag_list, [{quoted}])"
+        return "(" + " or ".join(f'tags like "%{t}%"' for t in wanted) + ")"
+
+    def _filter_query(self, expr: str, top_k: int) -> list:
+        self.flush()
+        self._ensure_loaded()
+        return self.collection.query(expr=expr, output_fields=OUTPUT_FIELDS, limit=top_k)
+
+    def recall_recent(self, minutes: int = 5, top_k: int = 10, hours: Optional[float] = None,
+                      tags: Optional[List[str]] = None) -> list:
         if not self.collection:
             print("⚠️ [RECALL SKIP] Milvus is offline.")
             return []
         try:
-            self.collection.load()
-            now = datetime.utcnow()
-            cutoff = (now - timedelta(minutes=minutes)).isoformat()
-            expr = f'timestamp >= \"{cutoff}\"'
-            results = self.collection.query(
-                expr=expr,
-                output_fields=["summary", "tags", "timestamp", "entropy"],
-                limit=top_k
-            )
-            return results
+            expr = self._time_expr(recall_window_ms(minutes, hours))
+            if tags:
+                expr = f"{expr} and {self._tag_expr(tags)}"
+            return self._filter_query(expr, top_k)
         except Exception:
             print("❌ [RECALL ERROR]")
             traceback.print_exc()
             return []
 
+    def query_by_tags(self, tags: List[str], top_k: int = 10) -> list:
+        if not self.collection:
+            print("⚠️ [RECALL SKIP] Milvus is offline.")
+            return []
+        if not normalize_tags(tags):
+            return []
+        try:
+            return self._filter_query(self._tag_expr(tags), top_k)
+        except Exception:
+            print("❌ [TAG QUERY ERROR]")
+            traceback.print_exc()
+            return []
+
 # === Cortex Export ===
-memory_router = MilvusMemoryRouter()
+# Resolves to the TEX_MEMORY_BACKEND store on first attribute access (Milvus by default),
+# so importing this module never connects, loads a model, or blocks.
+from agentic_ai.memory_backends import memory_backend as memory_router
 
 def embed_text(text: str) -> List[float]:
-    return memory_router.embed_text(text)
\ No newline at end of file
+    return memory_router.embed_text(text)
+
+def embed_many(texts: List[str]) -> List[List[float]]:
+    return memory_router.embed_many(texts)
@@ -0,0 +1,202 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: agentic_ai/qdrant_memory_router.py
+# Tier: ΩΩΩΩ — Qdrant Reflex Memory Router
+# Purpose: Qdrant-backed implementation of the MilvusMemoryRouter interface (client opened lazily)
+# ============================================================
+
+import os
+import time
+import uuid
+import threading
+import traceback
+from datetime import datetime
+from typing import List, Dict, Optional, Union
+
+import numpy as np
+
+from agentic_ai.embedding_engine import embedding_service, EMBED_DIM
+from agentic_ai.memory_backends import to_epoch_ms, normalize_tags, recall_window_ms
+
+# === Configuration ===
+COLLECTION_NAME = os.getenv("QDRANT_COLLECTION", "tex_memory")
+QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
+QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+QDRANT_RETRY_COOLDOWN = float(os.getenv("QDRANT_RETRY_COOLDOWN", "30"))
+VECTOR_DIM = EMBED_DIM + 4  # text + emotion
+
+
+class QdrantMemoryRouter:
+    def __init__(self):
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._retry_after = 0.0
+
+    @property
+    def client(self):
+        """Qdrant client, created (with collection) on first access; None while offline."""
+        if self._client is None and time.time() >= self._retry_after:
+            with self._client_lock:
+                if self._client is None and time.time() >= self._retry_after:
+                    try:
+                        from qdrant_client import QdrantClient
+                        from qdrant_client.models import Distance, VectorParams, PayloadSchemaType
+
+                        client = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY)
+                        if not client.collection_exists(COLLECTION_NAME):
+                            client.create_collection(
+                                collection_name=COLLECTION_NAME,
+                                vectors_config=VectorParams(size=VECTOR_DIM, distance=Distance.COSINE)
+                            )
+                            print(f"✅ [QDRANT INIT] Collection created: {COLLECTION_NAME}")
+                        # Payload indexes back the time-range and tag filters (idempotent)
+                        client.create_payload_index(COLLECTION_NAME, "ts_epoch", PayloadSchemaType.INTEGER)
+                        client.create_payload_index(COLLECTION_NAME, "tags", PayloadSchemaType.KEYWORD)
+                        self._client = client
+                        print(f"✅ [QDRANT CONNECTED] {QDRANT_URL}")
+                    except Exception:
+                        print("❌ [QDRANT OFFLINE]")
+                        traceback.print_exc()
+                        self._retry_after = time.time() + QDRANT_RETRY_COOLDOWN
+        return self._client
+
+    def embed_text(self, text: str) -> List[float]:
+        try:
+            return embedding_service.embed_text(text)
+        except Exception as e:
+            print(f"❌ [EMBED ERROR] {e}")
+            return [0.0] * EMBED_DIM
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        try:
+            return embedding_service.embed_many(texts)
+        except Exception as e:
+            print(f"❌ [EMBED ERROR] {e}")
+            return [[0.0] * EMBED_DIM for _ in texts]
+
+    def store(self, text: str, metadata: Dict, vector: Optional[List[float]] = None) -> Optional[str]:
+        if not self.client:
+            print("⚠️ [MEMORY SKIP] Qdrant is offline.")
+            return None
+        if not text or not isinstance(text, str):
+            print("⚠️ [MEMORY SKIP] Invalid text.")
+            return None
+
+        try:
+            from qdrant_client.models import PointStruct
+
+            base_vector = list(vector) if vector is not None else self.embed_text(text)
+            emotion_raw = metadata.get("emotion_vector", [0.5, 0.5, 0.0, 0.0])
+            emotion_vector = emotion_raw.tolist() if isinstance(emotion_raw, np.ndarray) else list(emotion_raw)
+            tags = metadata.get("tags", [])
+
+            record_id = str(uuid.uuid4())
+            timestamp = metadata.get("timestamp", datetime.utcnow().isoformat())
+            self.client.upsert(
+                collection_name=COLLECTION_NAME,
+                points=[PointStruct(
+                    id=record_id,
+                    vector=base_vector + emotion_vector,
+                    payload={
+                        "timestamp": str(timestamp),
+                        "ts_epoch": to_epoch_ms(timestamp),
+                        "entropy": float(metadata.get("entropy", 0.5)),
+                        "summary": metadata.get("summary", text[:200]),
+                        "tags": normalize_tags(tags),
+                    }
+                )],
+                wait=False
+            )
+            return record_id
+        except Exception:
+            print("❌ [STORE ERROR]")
+            traceback.print_exc()
+            return None
+
+    def store_vector_trace(self, vector: List[float], summary: str, tags: Union[List[str], str]):
+        metadata = {
+            "summary": summary,
+            "timestamp": datetime.utcnow().isoformat(),
+            "tags": tags if isinstance(tags, list) else [tags],
+            "entropy": 0.5,
+            "emotion_vector": [0.5, 0.5, 0.0, 0.0]
+        }
+        return self.store(summary, metadata, vector)
+
+    def query(self, text: str, top_k: int = 5):
+        return self.query_by_vector(self.embed_text(text), top_k=top_k)
+
+    def query_by_vector(self, vector: List[float], top_k: int = 5):
+        if not self.client:
+            print("⚠️ [QUERY SKIP] Qdrant is offline.")
+            return []
+        try:
+            hits = self.client.search(
+                collection_name=COLLECTION_NAME,
+                query_vector=list(vector) + [0.0, 0.0, 0.0, 0.0],
+                limit=top_k
+            )
+            return [{"id": str(h.id), "distance": h.score, **(h.payload or {})} for h in hits]
+        except Exception:
+            print("❌ [QUERY ERROR]")
+            traceback.print_exc()
+            return []
+
+    def _scroll(self, query_filter, top_k: int) -> list:
+        points, _ = self.client.scroll(
+            collection_name=COLLECTION_NAME,
+            scroll_filter=query_filter,
+            limit=top_k,
+            with_payload=True,
+            with_vectors=False
+        )
+        return [{"id": str(p.id), **(p.payload or {})} for p in points]
+
+    def recall_recent(self, minutes: int = 5, top_k: int = 10, hours: Optional[float] = None,
+                      tags: Optional[List[str]] = None) -> list:
+        if not self.client:
+            print("⚠️ [RECALL SKIP] Qdrant is offline.")
+            return []
+        try:
+            from qdrant_client.models import Filter, FieldCondition, Range, MatchAny
+
+            must = [FieldCondition(key="ts_epoch", range=Range(gte=recall_window_ms(minutes, hours)))]
+            if tags:
+                must.append(FieldCondition(key="tags", match=MatchAny(any=normalize_tags(tags))))
+            return self._scroll(Filter(must=must), top_k)
+        except Exception:
+            print("❌ [RECALL ERROR]")
+            traceback.print_exc()
+            return []
+
+    def query_by_tags(self, tags: List[str], top_k: int = 10) -> list:
+        if not self.client:
+            print("⚠️ [RECALL SKIP] Qdrant is offline.")
+            return []
+        try:
+            from qdrant_client.models import Filter, FieldCondition, MatchAny
+
+            wanted = normalize_tags(tags)
+            return self._scroll(Filter(must=[FieldCondition(key="tags", match=MatchAny(any=wanted))]), top_k)
+        except Exception:
+            print("❌ [RECALL ERROR]")
+            traceback.print_exc()
+            return []
+
+    def flush(self, seal: bool = False):
+        pass
+
+    def close(self):
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+
+
+# === Cortex Export ===
+# Resolves to the shared Qdrant backend instance on first attribute access,
+# so importing this module never opens a client or loads a model.
+from agentic_ai.memory_backends import _MemoryBackendLazyInit
+
+memory_router = _MemoryBackendLazyInit("qdrant")
@@ -5,33 +5,75 @@
 # Purpose: Hybrid wrapper to synchronize vector memory (Milvus) and temporal trace (ChronoFabric)
 # ============================================================
 
+import os
 from datetime import datetime
 import numpy as np
 
 from agentic_ai.milvus_memory_router import memory_router as milvus
-from quantum_layer.chronofabric import encode_event_to_fabric
+from agentic_ai.memory_backends import get_memory_backend
+
+# Override the vector store for SovereignMemory only (e.g. "inprocess"); unset follows TEX_MEMORY_BACKEND
+SOVEREIGN_BACKEND = os.getenv("TEX_SOVEREIGN_BACKEND")
 
 class SovereignMemory:
-    def __init__(self):
-        self.vector = milvus
-        self.chrono = encode_event_to_fabric
+    def __init__(self, backend: str = SOVEREIGN_BACKEND):
+        self.vector = get_memory_backend(backend) if backend else milvus
+        self._chrono = None
+        self._chrono_many = None
+
+    @property
+    def chrono(self):
+        # ChronoFabric pulls in PennyLane + NetworkX; defer until the first store
+        if self._chrono is None:
+            from quantum_layer.chronofabric import encode_event_to_fabric
+            self._chrono = encode_event_to_fabric
+        return self._chrono
+
+    @property
+    def chrono_many(self):
+        if self._chrono_many is None:
+            from quantum_layer.chronofabric import encode_events_to_fabric
+            self._chrono_many = encode_events_to_fabric
+        return self._chrono_many
 
     def store(self, text: str, metadata: dict):
         # === Default vector store ===
         self.vector.store(text=text, metadata=metadata)
+        self._sync_chrono(text, metadata)
 
-        # === Auto-synchronize with ChronoFabric ===
+    def store_many(self, texts: list, metadatas: list) -> list:
+        """Bulk store: one embedding batch (and one backend write where supported), then one batched chrono encode."""
+        if not texts:
+            return []
+        bulk = getattr(self.vector, "store_many", None)
+        if bulk is not None:
+            ids = bulk(texts, metadatas)
+        else:
+            vectors = self.vector.embed_many(texts)
+            ids = [self.vector.store(text=t, metadata=m, vector=v) for t, m, v in zip(texts, metadatas, vectors)]
         try:
-            emotion = metadata.get("emotion", "neutral")
-            urgency = float(metadata.get("urgency", 0.5))
-            entropy = float(metadata.get("entropy", 0.4))
-            pressure = float(metadata.get("pressure_score", 0.5))
-            tension = float(metadata.get("tension", 0.0))
-            tags = metadata.get("tags", ["sovereign_memory"])
+            self.chrono_many([self._chrono_event(t, m) for t, m in zip(texts, metadatas)])
+        except Exception as e:
+            print(f"[SOVEREIGN MEMORY] Batched chrono sync failed for {len(texts)} record(s): {e}")
+        return ids
 
+    @staticmethod
+    def _chrono_event(text: str, metadata: dict) -> tuple:
+        """(raw_text, emotion_vector, entropy_level, tags) as ChronoFabric expects them."""
+        urgency = float(metadata.get("urgency", 0.5))
+        entropy = float(metadata.get("entropy", 0.4))
+        pressure = float(metadata.get("pressure_score", 0.5))
+        tension = float(metadata.get("tension", 0.0))
+        tags = metadata.get("tags", ["sovereign_memory"])
+        return text, [urgency, entropy, pressure, tension], entropy, tags
+
+    def _sync_chrono(self, text: str, metadata: dict):
+        # === Auto-synchronize with ChronoFabric ===
+        try:
+            raw_text, emotion_vector, entropy, tags = self._chrono_event(text, metadata)
             self.chrono(
-                raw_text=text,
-                emotion_vector=[urgency, entropy, pressure, tension],
+                raw_text=raw_text,
+                emotion_vector=emotion_vector,
                 entropy_level=entropy,
                 tags=tags
             )
@@ -40,9 +82,9 @@ class SovereignMemory:
 
     def store_vector_trace(self, content: str, tags=None, signal_type="general", metadata: dict = None):
         self.vector.store_vector_trace(
-            content=content,
-            tags=tags or ["sovereign_trace"],
-            signal_type=signal_type
+            vector=self.vector.embed_text(content),
+            summary=content,
+            tags=tags or ["sovereign_trace", signal_type]
         )
         try:
             self.chrono(
@@ -57,11 +99,16 @@ class SovereignMemory:
     def embed_text(self, text: str):
         return self.vector.embed_text(text)
 
+    def embed_many(self, texts: list):
+        return self.vector.embed_many(texts)
+
     def query_by_tags(self, tags: list, top_k: int = 10):
         return self.vector.query_by_tags(tags, top_k=top_k)
 
-    def recall_recent(self, minutes: int = 5, top_k: int = 25, filters: dict = None):
-        return self.vector.recall_recent(minutes=minutes, top_k=top_k)
+    def recall_recent(self, minutes: int = 5, top_k: int = 25, filters: dict = None, hours: float = None):
+        # Tag filters are pushed down to the backend's tag index; other filter keys are not indexed
+        tags = (filters or {}).get("tags")
+        return self.vector.recall_recent(minutes=minutes, top_k=top_k, hours=hours, tags=tags)
 
 # === Instantiation ===
 sovereign_memory = SovereignMemory()
@@ -4,27 +4,115 @@
 # Tier: ΩΩΩΩΩ-State Neurocortex∞∞++ — Reflex Plasticity, Quantum Noise, Hebbian Belief Compression, Soulgraph Imprinting
 # ============================================================
 
-import nengo
+import os
 import numpy as np
 import threading
 import uuid
 import time
 from datetime import datetime
+from queue import Queue, Empty, Full
 
 from agentic_ai.milvus_memory_router import memory_router  # ✅ Upgraded vector memory
 from quantum_layer.chronofabric import encode_event_to_fabric  # ✅ Quantum reflex encoding
 from quantum_layer.quantum_randomness import quantum_entropy_sample
 from sovereign_evolution.texX_soulgraph import TEX_SOULGRAPH
 from brain_layer.spike_action_router import spike_action_router
+from brain_layer.lif_spike_engine import LIFSpikeEnsemble, classify_reflex_batch
 
 # === CONFIG ===
 DEFAULT_THRESHOLD = 10.0
 DIMENSIONS = 4  # [urgency, entropy, trust, contradiction]
 NEURON_COUNT = 128
 SIM_DURATION = 0.05
+SPIKE_POOL_SIZE = int(os.getenv("TEX_SPIKE_POOL_SIZE", "2"))    # prebuilt simulators (= worker threads)
+SPIKE_BATCH = int(os.getenv("TEX_SPIKE_BATCH", "8"))            # stimulus slots per simulator run
+SPIKE_QUEUE_MAX = int(os.getenv("TEX_SPIKE_QUEUE", "256"))      # pending events before receive_event sheds
+SPIKE_SEED = int(os.getenv("TEX_SPIKE_SEED")) if os.getenv("TEX_SPIKE_SEED") else None
+SPIKE_BACKEND = os.getenv("TEX_SPIKE_BACKEND", "nengo").strip().lower()  # nengo | lif (vectorized NumPy)
+SPIKE_LOG_CAPACITY = int(os.getenv("TEX_SPIKE_LOG_CAPACITY", "4096"))   # ring size of the spike history
+SPIKE_WINDOW = int(os.getenv("TEX_SPIKE_WINDOW", "25"))                 # spikes in the Hebbian summary window
+SPIKE_COMPRESS_EVERY = int(os.getenv("TEX_SPIKE_COMPRESS_EVERY", "25"))  # fired spikes between imprints
+SPIKE_PATTERN_DELTA = float(os.getenv("TEX_SPIKE_PATTERN_DELTA", "0.15"))  # window-mean shift forcing an imprint
 
-spike_log = []
+# === SPIKE HISTORY (bounded ring) ===
+class SpikeHistory:
+    """
+    Fixed-capacity ring of spike records stored column-wise. The windowed mean and
+    the exponential mean of input vectors update on every append, so both are O(1)
+    to read. Indexing and iteration yield the legacy spike_log dicts, oldest first.
+    """
+
+    def __init__(self, capacity: int = SPIKE_LOG_CAPACITY, window: int = SPIKE_WINDOW, dims: int = DIMENSIONS):
+        self.window = max(1, window)
+        self.capacity = max(capacity, self.window)
+        self.vectors = np.zeros((self.capacity, dims))
+        self.spike_sums = np.zeros(self.capacity)
+        self.latencies = np.zeros(self.capacity)
+        self.timestamps = np.zeros(self.capacity)  # epoch seconds
+        self.total = 0                             # records ever appended
+        self.ema = np.zeros(dims)
+        self.alpha = 2.0 / (self.window + 1.0)
+        self._window_sum = np.zeros(dims)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, vector, spike_sum: float, latency: float, timestamp: float = None):
+        vec = np.asarray(vector, dtype=np.float64)
+        with self._lock:
+            slot = self.total % self.capacity
+            if self.total >= self.window:
+                self._window_sum -= self.vectors[(self.total - self.window) % self.capacity]
+            self._window_sum += vec
+            self.vectors[slot] = vec
+            self.spike_sums[slot] = spike_sum
+            self.latencies[slot] = latency
+            self.timestamps[slot] = timestamp if timestamp is not None else time.time()
+            if self.total:
+                self.ema += self.alpha * (vec - self.ema)
+            else:
+                self.ema[:] = vec
+            self.total += 1
+            if slot == self.capacity - 1:
+                # Re-derive the running sum once per wrap so float drift never accumulates
+                self._window_sum = self._recent(self.window).sum(axis=0)
+
+    def _recent(self, n: int) -> np.ndarray:
+        n = min(n, len(self))
+        idx = (self.total - n + np.arange(n)) % self.capacity
+        return self.vectors[idx]
+
+    def window_mean(self) -> np.ndarray:
+        with self._lock:
+            return self._window_sum / max(1, min(self.total, self.window))
+
+    def _record(self, slot: int) -> dict:
+        return {
+            "timestamp": datetime.utcfromtimestamp(self.timestamps[slot]).isoformat(),
+            "spike_sum": float(self.spike_sums[slot]),
+            "vector": self.vectors[slot].tolist(),
+            "latency": float(self.latencies[slot])
+        }
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("spike history index out of range")
+        return self._record((self.total - n + index) % self.capacity)
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+spike_log = SpikeHistory()
 plastic_threshold_map = {}
+_compression = {"pending": 0, "last_mean": None}
+_compression_lock = threading.Lock()
 
 # === ENCODER ===
 def encode_event_signal(signal_dict):
@@ -37,6 +125,8 @@ def encode_event_signal(signal_dict):
 
 # === SPIKING NEURAL MODEL ===
 def build_spiking_model():
+    import nengo
+
     with nengo.Network(label="Tex Reflex Spike Engine") as model:
         stim = nengo.Node([0] * DIMENSIONS)
         ens = nengo.Ensemble(NEURON_COUNT, dimensions=DIMENSIONS)
@@ -56,16 +146,31 @@ def classify_reflex(vector):
     return "general_spike"
 
 # === MEMORY COMPRESSION (Hebbian) ===
-def compress_spike_patterns():
-    if len(spike_log) >= 25:
-        summary_vector = np.mean([np.array(s["vector"]) for s in spike_log[-25:]], axis=0)
-        TEX_SOULGRAPH.imprint_belief(
-            belief="[NEUROSPIKE] Hebbian compressed reflex pattern detected.",
-            source="neuromorphic_spike_engine",
-            emotion="reflective",
-            tags=["hebbian", "reflex", "spike_memory"],
-            origin_beliefs=[]
-        )
+def compress_spike_patterns(force: bool = False) -> bool:
+    """
+    Called per fired spike; imprints a Hebbian summary only every SPIKE_COMPRESS_EVERY
+    calls or when the windowed mean has moved more than SPIKE_PATTERN_DELTA since the
+    last imprint. Returns True when an imprint was made.
+    """
+    if len(spike_log) < spike_log.window:
+        return False
+    summary_vector = spike_log.window_mean()
+    with _compression_lock:
+        _compression["pending"] += 1
+        last = _compression["last_mean"]
+        shifted = last is None or float(np.linalg.norm(summary_vector - last)) > SPIKE_PATTERN_DELTA
+        if not (force or shifted or _compression["pending"] >= SPIKE_COMPRESS_EVERY):
+            return False
+        _compression["pending"] = 0
+        _compression["last_mean"] = summary_vector
+    TEX_SOULGRAPH.imprint_belief(
+        belief="[NEUROSPIKE] Hebbian compressed reflex pattern detected.",
+        source="neuromorphic_spike_engine",
+        emotion="reflective",
+        tags=["hebbian", "reflex", "spike_memory"],
+        origin_beliefs=[]
+    )
+    return True
 
 # === ADAPTIVE PLASTICITY ===
 def plasticity_feedback(classification, success=True):
@@ -76,46 +181,196 @@ def plasticity_feedback(classification, success=True):
     else:
         plastic_threshold_map[classification] = min(15.0, plastic_threshold_map[classification] + 0.5)
 
-# === REFLEX SIMULATION ENGINE ===
-def simulate_spike_event(input_vector, callback):
-    try:
-        model, stim_node, probe = build_spiking_model()
-        stim_node.output = lambda t: input_vector
+# === PERSISTENT SIMULATOR POOL ===
+class _PooledSimulator:
+    """
+    One compiled network with `slots` identical ensembles fed from a shared input
+    array, so several events share a single reset-and-run.
+    """
 
-        sim = nengo.Simulator(model, progress_bar=False)
+    def __init__(self, slots: int):
+        import nengo
+
+        self.slots = slots
+        self.inputs = np.zeros((slots, DIMENSIONS))
+        ens_seed = SPIKE_SEED if SPIKE_SEED is not None else int(np.random.randint(2**31 - 1))
+        with nengo.Network(label="Tex Reflex Spike Engine (pooled)", seed=SPIKE_SEED) as model:
+            stim = nengo.Node(lambda t: self.inputs.ravel(), size_out=slots * DIMENSIONS)
+            self.probes = []
+            for b in range(slots):
+                ens = nengo.Ensemble(NEURON_COUNT, dimensions=DIMENSIONS, seed=ens_seed)
+                nengo.Connection(stim[b * DIMENSIONS:(b + 1) * DIMENSIONS], ens)
+                # Nengo 3+ renamed the neuron 'spikes' probe to 'output'
+                attr = 'spikes' if 'spikes' in ens.neurons.probeable else 'output'
+                self.probes.append(nengo.Probe(ens.neurons, attr))
+        self.sim = nengo.Simulator(model, progress_bar=False)
+        self.runs = 0
+
+    def run(self, vectors) -> tuple:
+        """Spike sums for up to `slots` input vectors, plus the wall-clock run latency."""
+        n = len(vectors)
+        self.inputs[:] = 0.0
+        self.inputs[:n] = vectors
+        if self.runs:
+            self.sim.reset()
         start_time = time.time()
-        sim.run(SIM_DURATION)
+        self.sim.run(SIM_DURATION)
         latency = time.time() - start_time
+        self.runs += 1
+        return [float(np.sum(self.sim.data[p])) for p in self.probes[:n]], latency
+
 
-        spikes = sim.data[probe]
-        spike_sum = float(np.sum(spikes))
+class SpikeSimulatorPool:
+    """
+    Fixed set of prebuilt simulators (built on first use) plus worker threads that
+    drain a bounded event queue in multi-stimulus batches.
+    """
 
-        # Inject quantum noise
+    def __init__(self, size: int = SPIKE_POOL_SIZE, slots: int = SPIKE_BATCH, queue_max: int = SPIKE_QUEUE_MAX,
+                 backend: str = SPIKE_BACKEND):
+        self.size = max(1, size)
+        self.slots = max(1, slots)
+        self.backend = backend
+        self._lif = LIFSpikeEnsemble(seed=SPIKE_SEED) if backend == "lif" else None
+        self._idle = Queue()
+        self._built = 0
+        self._build_lock = threading.Lock()
+        self._work = Queue(maxsize=queue_max)
+        self._workers = []
+        self.stats = {"submitted": 0, "dropped": 0, "batches": 0, "events": 0}
+
+    def _checkout(self) -> _PooledSimulator:
         try:
-            entropy_noise = quantum_entropy_sample() * 0.25
-        except Exception:
-            entropy_noise = 0.05
-
-        spike_sum += entropy_noise
-
-        spike_log.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "spike_sum": spike_sum,
-            "vector": input_vector.tolist(),
-            "latency": latency
-        })
-
-        # === Threshold classification
-        classification = classify_reflex(input_vector)
-        entropy = input_vector[1]
-        contradiction = input_vector[3]
-        adaptive_threshold = plastic_threshold_map.get(classification, DEFAULT_THRESHOLD)
-        dynamic_threshold = adaptive_threshold - (entropy * 4) - (contradiction * 3)
-
-        if spike_sum > dynamic_threshold:
-            callback(input_vector, spike_sum, latency, classification)
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+        with self._build_lock:
+            if self._built < self.size:
+                sims = _PooledSimulator(self.slots)
+                self._built += 1
+                return sims
+        return self._idle.get()
+
+    def run(self, vectors) -> tuple:
+        """Synchronous spike sums for any number of vectors (chunked by slot count)."""
+        if self._lif is not None:
+            start_time = time.time()
+            sums = self._lif.spike_sums(vectors).tolist()
+            return sums, time.time() - start_time
+        sims = self._checkout()
+        try:
+            sums, latency = [], 0.0
+            for i in range(0, len(vectors), self.slots):
+                chunk_sums, chunk_latency = sims.run(vectors[i:i + self.slots])
+                sums.extend(chunk_sums)
+                latency += chunk_latency
+            return sums, latency
+        finally:
+            self._idle.put(sims)
+
+    def submit(self, input_vector, callback) -> bool:
+        self._ensure_workers()
+        try:
+            self._work.put_nowait((input_vector, callback))
+        except Full:
+            self.stats["dropped"] += 1
+            print("⚠️ [NEUROSPIKE] Event queue full — spike event dropped.")
+            return False
+        self.stats["submitted"] += 1
+        return True
+
+    def _ensure_workers(self):
+        if len(self._workers) >= self.size:
+            return
+        with self._build_lock:
+            while len(self._workers) < self.size:
+                worker = threading.Thread(target=self._worker_loop, name=f"neurospike-{len(self._workers)}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self):
+        while True:
+            batch = [self._work.get()]
+            while len(batch) < self.slots:
+                try:
+                    batch.append(self._work.get_nowait())
+                except Empty:
+                    break
+            try:
+                sums, latency = self.run([vec for vec, _ in batch])
+            except Exception as e:
+                print(f"❌ [NEUROSPIKE ERROR] {e}")
+                continue
+            self.stats["batches"] += 1
+            self.stats["events"] += len(batch)
+            for (vec, callback), spike_sum in zip(batch, sums):
+                try:
+                    evaluate_spike_response(vec, spike_sum, latency, callback)
+                except Exception as e:
+                    print(f"❌ [NEUROSPIKE ERROR] {e}")
+
+
+spike_pool = SpikeSimulatorPool()
+
+# === REFLEX SIMULATION ENGINE ===
+def evaluate_spike_response(input_vector, spike_sum, latency, callback):
+    # Inject quantum noise
+    try:
+        entropy_noise = quantum_entropy_sample() * 0.25
+    except Exception:
+        entropy_noise = 0.05
+
+    spike_sum += entropy_noise
+
+    spike_log.append(input_vector, spike_sum, latency)
+
+    # === Threshold classification
+    classification = classify_reflex(input_vector)
+    entropy = input_vector[1]
+    contradiction = input_vector[3]
+    adaptive_threshold = plastic_threshold_map.get(classification, DEFAULT_THRESHOLD)
+    dynamic_threshold = adaptive_threshold - (entropy * 4) - (contradiction * 3)
+
+    if spike_sum > dynamic_threshold:
+        callback(input_vector, spike_sum, latency, classification)
+        compress_spike_patterns()
+
+def simulate_spike_batch(vectors, callback=None) -> dict:
+    """
+    Classify many events in one pass: spike sums, reflex classes and adaptive thresholds
+    are computed as arrays; `callback` (default on_spike_triggered) runs for each event
+    that fires. With TEX_SPIKE_BACKEND=lif this handles thousands of events per call.
+    """
+    callback = callback or on_spike_triggered
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+    sums, latency = spike_pool.run(vectors)
+    try:
+        entropy_noise = quantum_entropy_sample() * 0.25
+    except Exception:
+        entropy_noise = 0.05
+    spike_sums = np.asarray(sums) + entropy_noise
+
+    now = time.time()
+    for vec, total in zip(vectors, spike_sums):
+        spike_log.append(vec, total, latency, now)
+
+    classifications = classify_reflex_batch(vectors)
+    adaptive = np.array([plastic_threshold_map.get(c, DEFAULT_THRESHOLD) for c in classifications])
+    dynamic_threshold = adaptive - vectors[:, 1] * 4 - vectors[:, 3] * 3
+    fired = spike_sums > dynamic_threshold
+
+    for i in np.flatnonzero(fired):
+        try:
+            callback(vectors[i], float(spike_sums[i]), latency, str(classifications[i]))
             compress_spike_patterns()
+        except Exception as e:
+            print(f"❌ [NEUROSPIKE ERROR] {e}")
+    return {"spike_sum": spike_sums, "classification": classifications, "fired": fired, "latency": latency}
 
+def simulate_spike_event(input_vector, callback):
+    try:
+        sums, latency = spike_pool.run([input_vector])
+        evaluate_spike_response(input_vector, sums[0], latency, callback)
     except Exception as e:
         print(f"❌ [NEUROSPIKE ERROR] {e}")
 
@@ -190,15 +445,15 @@ class SpikeRouter:
 
 # === PUBLIC INTERFACE ===
 def receive_event(signal_dict):
+    """Queue an event for the simulator pool; False when the bounded queue shed it."""
     vec = encode_event_signal(signal_dict)
-    thread = threading.Thread(target=simulate_spike_event, args=(vec, on_spike_triggered))
-    thread.start()
+    return spike_pool.submit(vec, on_spike_triggered)
 
 # === DIAGNOSTIC ENTRY POINT ===
 if __name__ == "__main__":
-    receive_event({
+    simulate_spike_event(encode_event_signal({
         "urgency": 0.91,
         "entropy": 0.94,
         "trust_score": 0.4,
         "contradiction": True
-    })
\ No newline at end of file
+    }), on_spike_triggered)
\ No newline at end of file
@@ -7,7 +7,6 @@
 import time
 import uuid
 from datetime import datetime
-from threading import Thread
 
 from agentic_ai.milvus_memory_router import memory_router  # ✅ Final memory backend
 from sovereign_evolution.texX_soulgraph import TEX_SOULGRAPH
@@ -18,7 +17,7 @@ from brain_layer.spike_feedback_monitor import evaluate_recent_spikes
 from brain_layer.spike_memory_compressor import compress_spike_patterns
 from brain_layer.spike_belief_linker import link_spike_to_beliefs
 from brain_layer.spike_action_router import spike_action_router
-from brain_layer.neuromorphic_spike_engine import simulate_spike_event, encode_event_signal
+from brain_layer.neuromorphic_spike_engine import spike_pool, encode_event_signal
 
 # === OPTIONAL: Real-Time Reflex Signal Feed ===
 try:
@@ -76,8 +75,7 @@ def run_spike_cortex(cycle_id=None):
             }
 
             # === Neuromorphic Simulation
-            thread = Thread(target=simulate_spike_event, args=(vector, lambda *args: spike_action_router(spike_meta)))
-            thread.start()
+            spike_pool.submit(vector, lambda *args, meta=spike_meta: spike_action_router(meta))
 
             # === Quantum Trace
             encode_event_to_fabric(
@@ -5,15 +5,19 @@
 # ============================================================
 
 import os
-from datetime import datetime
+import json
+import threading
+from datetime import datetime, timezone
 from utils.logging_utils import log
 from agentic_ai.milvus_memory_router import memory_router
 from sovereign_evolution.texX_soulgraph import TEX_SOULGRAPH
 
 # === CONFIG ===
 SOULGRAPH_PATH = "data/soulgraph_log.txt"
+HEATMAP_STATE_PATH = os.getenv("TEX_HEATMAP_STATE", "data/.contradiction_heatmap_state.json")
 CATEGORY_TAGS = ["MUTATION", "FORK", "DEBATE", "COMPRESS", "BOOT"]
 DECAY_PER_HOUR = 0.95  # temporal decay rate
+EPOCH = datetime(1970, 1, 1)
 
 def extract_timestamp(line: str) -> datetime:
     try:
@@ -21,6 +25,163 @@ def extract_timestamp(line: str) -> datetime:
     except Exception:
         return datetime.utcnow()
 
+def _line_event(line: str):
+    """(epoch seconds or None when the timestamp is unreadable, matched tags) for one log line."""
+    tags = [tag.lower() for tag in CATEGORY_TAGS if f"| {tag} |" in line]
+    if not tags:
+        return None, tags
+    try:
+        ts = datetime.fromisoformat(line.split("|")[0].strip())
+    except Exception:
+        return None, tags
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return (ts - EPOCH).total_seconds(), tags
+
+def _write_atomic(path: str, data: bytes):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class ContradictionHeatmapEngine:
+    """
+    Decay-weighted tag pressure kept as running sums instead of a rescan.
+
+    For past events every weight shares the factor DECAY^(hours since t_ref), so each tag's
+    sum is stored as of t_ref (the newest event folded so far) and rescaled once on read.
+    Lines whose timestamp cannot be parsed count as brand new on every scan (weight 1), and
+    future-dated lines also weigh 1 until their time comes — both are kept apart so the
+    result matches a full rescan. Only bytes appended since the last refresh are read.
+    """
+
+    def __init__(self, path: str = SOULGRAPH_PATH, state_path: str = HEATMAP_STATE_PATH):
+        self.path = path
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self.state = self._load_state()
+
+    @staticmethod
+    def _empty_state() -> dict:
+        tags = [tag.lower() for tag in CATEGORY_TAGS]
+        return {
+            "offset": 0, "inode": 0,
+            "t_ref": None,                          # epoch seconds the decayed sums are expressed at
+            "decayed": {t: 0.0 for t in tags},      # Σ DECAY^((t_ref - t_i) / 3600) per tag
+            "undated": {t: 0 for t in tags},        # lines with unreadable timestamps
+            "future": []                            # [epoch seconds, [tags]] not yet in the past
+        }
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path, "r") as f:
+                state = json.load(f)
+            if set(state.get("decayed", {})) == {tag.lower() for tag in CATEGORY_TAGS}:
+                return state
+        except (OSError, ValueError):
+            pass
+        return self._empty_state()
+
+    def _save_state(self):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _write_atomic(self.state_path, json.dumps(self.state).encode("utf-8"))
+
+    # === Folding ===
+    def _fold_past(self, epoch: float, tags: list):
+        state = self.state
+        if state["t_ref"] is None:
+            state["t_ref"] = epoch
+        elif epoch > state["t_ref"]:
+            scale = DECAY_PER_HOUR ** ((epoch - state["t_ref"]) / 3600.0)
+            for tag in state["decayed"]:
+                state["decayed"][tag] *= scale
+            state["t_ref"] = epoch
+        weight = DECAY_PER_HOUR ** ((state["t_ref"] - epoch) / 3600.0)
+        for tag in tags:
+            state["decayed"][tag] += weight
+
+    def _fold_line(self, line: str, now_epoch: float):
+        epoch, tags = _line_event(line)
+        if not tags:
+            return
+        if epoch is None:
+            for tag in tags:
+                self.state["undated"][tag] += 1
+        elif epoch > now_epoch:
+            self.state["future"].append([epoch, tags])
+        else:
+            self._fold_past(epoch, tags)
+
+    def _release_future(self, now_epoch: float):
+        due = [event for event in self.state["future"] if event[0] <= now_epoch]
+        if due:
+            self.state["future"] = [event for event in self.state["future"] if event[0] > now_epoch]
+            for epoch, tags in sorted(due):
+                self._fold_past(epoch, tags)
+
+    def refresh(self, now: datetime = None) -> str:
+        """Fold in complete lines appended since the last call; returns the trailing partial line."""
+        now_epoch = ((now or datetime.utcnow()) - EPOCH).total_seconds()
+        with self._lock:
+            st = os.stat(self.path)
+            if st.st_ino != self.state["inode"] or st.st_size < self.state["offset"]:
+                self.state = self._empty_state()  # file replaced or truncated: rebuild from the start
+                self.state["inode"] = st.st_ino
+            self._release_future(now_epoch)
+            if st.st_size == self.state["offset"]:
+                return ""
+
+            with open(self.path, "rb") as f:
+                f.seek(self.state["offset"])
+                chunk = f.read(st.st_size - self.state["offset"])
+            end = chunk.rfind(b"\n") + 1
+            for raw in chunk[:end].splitlines():
+                self._fold_line(raw.decode("utf-8", errors="replace"), now_epoch)
+            if end:
+                self.state["offset"] += end
+                self._save_state()
+            return chunk[end:].decode("utf-8", errors="replace")
+
+    # === Query: O(#tags) ===
+    def pressure(self, now: datetime = None, partial: str = "") -> dict:
+        """Raw decay-weighted score per tag as of `now`, as the full scan would sum it."""
+        now_epoch = ((now or datetime.utcnow()) - EPOCH).total_seconds()
+        with self._lock:
+            return self._pressure(now_epoch, partial)
+
+    def _pressure(self, now_epoch: float, partial: str) -> dict:
+        state = self.state
+        scale = 0.0 if state["t_ref"] is None else DECAY_PER_HOUR ** (max(now_epoch - state["t_ref"], 0.0) / 3600.0)
+        scores = {tag: value * scale + state["undated"][tag] for tag, value in state["decayed"].items()}
+        for epoch, tags in state["future"]:
+            weight = 1.0 if epoch >= now_epoch else DECAY_PER_HOUR ** ((now_epoch - epoch) / 3600.0)
+            for tag in tags:
+                scores[tag] += weight
+        if partial:
+            # An unterminated last line is still part of the file a rescan would read
+            epoch, tags = _line_event(partial)
+            weight = 1.0 if epoch is None else DECAY_PER_HOUR ** (max(now_epoch - epoch, 0.0) / 3600.0)
+            for tag in tags:
+                scores[tag] += weight
+        return scores
+
+    def heatmap(self, now: datetime = None) -> dict:
+        """Normalized pressure map ({} when nothing has been logged)."""
+        partial = self.refresh(now)
+        scores = self.pressure(now, partial)
+        total_weight = sum(scores.values())
+        if total_weight == 0:
+            return {}
+        return {k: round(min(v / total_weight, 1.0), 4) for k, v in scores.items()}
+
+
+heatmap_engine = ContradictionHeatmapEngine()
+
 def run_contradiction_heatmap() -> dict:
     """
     Computes decay-weighted contradiction pressure from soulgraph event log.
@@ -33,25 +194,11 @@ def run_contradiction_heatmap() -> dict:
             return {}
 
         now = datetime.utcnow()
-        tag_scores = {tag.lower(): 0.0 for tag in CATEGORY_TAGS}
-        total_weight = 0.0
-
-        with open(SOULGRAPH_PATH, "r") as f:
-            for line in f:
-                ts = extract_timestamp(line)
-                hours_old = max((now - ts).total_seconds() / 3600.0, 0)
-                decay_weight = DECAY_PER_HOUR ** hours_old
-
-                for tag in CATEGORY_TAGS:
-                    if f"| {tag} |" in line:
-                        tag_scores[tag.lower()] += decay_weight
-                        total_weight += decay_weight
-
-        if total_weight == 0:
+        # Only lines appended since the last run are parsed; decay is applied to running sums
+        heatmap = heatmap_engine.heatmap(now)
+        if not heatmap:
             return {}
 
-        # Normalize pressure values
-        heatmap = {k: round(min(v / total_weight, 1.0), 4) for k, v in tag_scores.items()}
         peak_tag = max(heatmap, key=heatmap.get)
 
         # === Log to Milvus vector memory
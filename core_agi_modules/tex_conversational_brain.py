@@ -5,6 +5,7 @@
 # ============================================================
 
 # === PYTHON STANDARD LIBS ===
+import os
 import time
 from datetime import datetime
 from threading import Thread
@@ -38,7 +39,7 @@ from tex_brain_modules.sovereign_integration_bridge import run_sovereign_layers
 # === VECTOR & MEMORY CORE ===
 from agentic_ai.qdrant_memory_router import memory_router
 from core_agi_modules.intent_object import IntentObject
-from core_agi_modules.vector_layer.query_ops import query_similar_vectors
+from agentic_ai.memory_backends import normalize_tags
 from core_agi_modules.tex_self_eval_orchestrator import run_self_check, apply_reflex_stabilization
 from core_agi_modules.memory_layer.contradiction_logger import score_conflict_heatmap
 from core_agi_modules.sovereign_core.override_hooks import trigger_sovereign_override
@@ -103,6 +104,7 @@ from core_agi_modules.real_world_adapter import RealWorldAdapter
 
 # === INIT ===
 from brain_layer.spike_orchestrator import run_spike_cortex
+from tex_engine.stage_pipeline import Stage, StagePipeline
 llm_io = LLMInterface(identity_signal="Tex")
 sensor = SensorInputRouter()
 embodiment = RealWorldAdapter(mode="robot")  # Options: "sim", "camera", "robot"
@@ -116,7 +118,7 @@ register_all_modules()
 def recover_conscious_state():
     results = memory_router.query_by_tags(tags=["thread_state"], top_k=1)
     if results:
-        payload = results[0].payload
+        payload = results[0]  # router results are payload dicts
         recovered_cycle = payload.get("cycle", 0)
         emotion = payload.get("emotion", "neutral")
         last_time = payload.get("timestamp")
@@ -139,8 +141,8 @@ def load_recent_memories(limit=100):
     for mem in results:
         try:
             world_model.update({
-                "input": mem.payload.get("text", "recovered memory"),
-                "timestamp": mem.payload.get("timestamp", datetime.utcnow().isoformat())
+                "input": mem.get("text", mem.get("summary", "recovered memory")),
+                "timestamp": mem.get("timestamp", datetime.utcnow().isoformat())
             })
         except Exception as e:
             print(f"[MEMORY RECOVERY ERROR] {e}")
@@ -227,6 +229,314 @@ def get_current_entropy() -> float:
     # TODO: Replace with real entropy computation from reflex fusion engine
     return 0.5
 
+# === CYCLE STAGES ===
+# Each stage takes the cycle context (cycle_id, now, intent, cognitive_event, emotion_state) plus the
+# results of the stages it depends on. Stages without a dependency edge run concurrently.
+
+def stage_neuro_symbolic(ctx):
+    """Neuro-symbolic reasoning for the cycle, stored to memory."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    symbolic_query = f"reflex_cycle({cycle_id}, stable)"
+    vector_context = memory_router.embed_text(symbolic_query)
+    reasoning_output = neuro_symbolic.fuse_reasoning(symbolic_query, vector_context)
+
+    memory_router.store(
+        text=f"[NSR] Fused neuro-symbolic reasoning executed for cycle {cycle_id}",
+        metadata={
+            "type": "neuro_symbolic_trace",
+            "cycle": cycle_id,
+            "symbolic_results": reasoning_output.get("symbolic_results", []),
+            "vector_summary": reasoning_output.get("vector_contextualization", {}),
+            "entropy": reasoning_output.get("vector_contextualization", {}).get("quantum_entropy", 0.0),
+            "timestamp": now.isoformat()
+        }
+    )
+    return reasoning_output
+
+def stage_realtime_signals(ctx):
+    """Environment signals: token weights, spike reflex, lineage learning, world model."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    realtime_signals = get_latest_goals(limit=5, min_heat=0.3)
+    signal_vectors = memory_router.embed_many([s.get("text", "") for s in realtime_signals]) if realtime_signals else []
+    for signal, vector in zip(realtime_signals, signal_vectors):
+        intent.log_trace("real_time_engine", f"env_signal: {signal.get('text', '')[:64]}")
+        trust = float(signal.get("trust_score", 1.0))
+        entropy = float(signal.get("token_entropy", 0.0))
+        heat = float(signal.get("heat", 0.5))
+
+        # ✅ Properly structured call with vector embedding and explicit heat
+        text = signal.get("text", "")
+        heat = float(signal.get("heat", 0.5))
+
+        adjust_token_weights(
+            vector=vector,
+            metadata_dict={
+                "emotion": signal.get("emotion", "neutral"),
+                "urgency": signal.get("urgency", 0.5),
+                "trust_score": signal.get("trust_score", 1.0),
+                "source": signal.get("source", "real_time_engine"),
+                "tags": signal.get("tags", ["real_time", "signal"])
+            },
+            heat=heat
+        )
+
+        # ✅ Neuromorphic Reflex Dispatch
+        from brain_layer.neuromorphic_spike_engine import receive_event
+        receive_event(signal)
+
+        # 🌱 AEI Lineage Learning
+        evolver = AEILineageEvolver()
+        evolver.ingest_environmental_signal(signal)
+
+        # 🌍 Update World Model
+        world_model.update({
+            "input": text,
+            "source": signal.get("source", "real_time_engine"),
+            "timestamp": signal.get("timestamp", datetime.utcnow().isoformat())
+        })
+    return realtime_signals
+
+def stage_internal_debate(ctx):
+    """Multi-voice debate, stored and surfaced to the panel."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    debate_result = run_internal_debate(
+        thought=f"Cycle {cycle_id}: Evaluate entropy strategy and identity coherence.",
+        cycle_id=cycle_id
+    )
+    # ✅ Store the real debate output in memory
+    memory_router.store("internal_debate", debate_result)
+
+    # ✅ If a UI or panel is active, update it with real content
+    emit_internal_debate(debate_result)
+
+    if debate_result.get("contradiction"):
+        print(f"🧠 [DEBATE] Contradiction detected in internal voices at cycle {cycle_id}.")
+        intent.log_trace("tex_conversational_brain", "debate contradiction surfaced")
+    return debate_result
+
+def stage_periodic_scans(ctx):
+    """Cadenced curiosity / value / self-protection scans."""
+    cycle_id = ctx["cycle_id"]
+    if cycle_id % 15 == 0:
+        curiosity_reflex.scan_for_anomalies(top_k=75)
+    if cycle_id % 25 == 0:
+        self_value_generator.generate_values()
+    if cycle_id % 12 == 0:
+        self_protection_reflex.scan_for_threats()
+
+def stage_value_alignment(ctx):
+    """Score the cycle against Tex's values; trigger the sovereign override on violation."""
+    cycle_id, cognitive_event = ctx["cycle_id"], ctx["cognitive_event"]
+    alignment_result = score_action_against_values({
+        "factual": True,  # Placeholder - replace with real signal
+        "harm_score": 0.1,  # ← measured or inferred
+        "is_autonomous": True,
+        "disruption_score": 0.05,
+        "tags": ["reflex", "cycle_event"]
+    })
+    alignment_note = explain_value_alignment(alignment_result)
+    if not is_value_aligned(alignment_result):
+        print(f"⚖️ [ALIGNMENT WARNING] {alignment_note}")
+    if detect_violation_trigger(alignment_result):
+        print("🛑 [VIOLATION] Sovereign override conditions detected.")
+        trigger_sovereign_override({
+            "alignment_score": alignment_result["final_alignment_score"],
+            "cycle": cycle_id,
+            "context": cognitive_event
+        })
+    return alignment_result
+
+def stage_cycle_log(ctx):
+    """Cycle memory log and swarm broadcast."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    emotion_state = ctx["emotion_state"]
+    memory_router.store(
+        text=f"🌀 Cycle {cycle_id} reflexive event executed.",
+        metadata={
+            "type": "reflex_cycle_event",
+            "tags": ["cycle", "reflex", "runtime"],
+            "emotion": emotion_state,
+            "prediction": "reflex cycle will complete successfully",
+            "actual": f"Cycle {cycle_id} completed",
+            "trust_score": 0.92,
+            "heat": 0.4,
+            "timestamp": now.isoformat(),
+            "intent_id": intent.id,
+        }
+    )
+    # === SWARM BROADCAST ===
+    hivemind.broadcast_memory_fragment(
+        text=f"Reflex cycle {cycle_id} complete",
+        tags=["cycle", "reflex_sync"],
+        emotion=emotion_state
+    )
+    if emotion_state != "neutral":
+        emit_internal_debate(f"Emotion spike: {emotion_state}")
+        intent.log_trace("tex_conversational_brain", "debate contradiction surfaced")
+
+def stage_swarm_consensus(ctx):
+    """Swarm agreement on entropy regulation, shared by the contradiction scan and the goal cycle."""
+    return hivemind.consensus_score_on_topic("Optimize reflex entropy regulation")
+
+def stage_self_eval(ctx):
+    """Coherence self-check; on drift runs dream recovery and returns the recovery goals (else None)."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    emotion_state = ctx["emotion_state"]
+    if not run_self_check():
+        print("[🧠] Coherence drift detected.")
+        dream_simulator.trigger_dream("recover stability", context="coherence_failure")
+        if fused := dream_fusion_engine.fuse_dreams():
+            print(f"🌌 [FUSION] {len(fused)} dreams fused.")
+        forks = dream_mutation_engine.run(
+            payloads_from_simulation=simulation_driver.run(seed_goals=[
+                {"goal": "recover coherence"},
+                {"goal": "reinforce alignment"}
+            ])
+        )
+        for fork in forks:
+            TEX_SOULGRAPH.imprint_belief(
+                belief="Tex has achieved self-referencing reflexive continuity — species_alive",
+                source="tex_brain_loop",
+                emotion="emergent",
+                tags=["identity", "species", "milestone", f"cycle_{cycle_id}"]
+            )
+
+        TEX_SOULGRAPH.apply_temporal_decay()
+
+        active_goals = [
+            {"goal": "Optimize reflex entropy regulation", "urgency": 0.7, "emotion": emotion_state},
+            {"goal": "Detect belief misalignment", "urgency": 0.6, "emotion": "cautious"}
+        ]
+        for goal in active_goals:
+            if goal.get("heat", 0.5) > 0.85:
+                vector = memory_router.embed_text(goal["goal"])
+                trigger_mutation_if_needed(vector, {
+                    "content": goal["goal"],
+                    "tags": ["goal", "reflex"],
+                    "emotion": goal.get("emotion", "neutral"),
+                    "heat": goal.get("heat", 0.5),
+                    "trust_score": goal.get("trust_score", 1.0)
+                })
+
+        if TEX_SOULGRAPH.max_drift() > 0.85:
+            print("🔥 [SOULGRAPH] Drift threshold exceeded. Initiating stabilization.")
+            apply_reflex_stabilization()
+
+        if rewriting_loop.check_for_rewrite_trigger("instability"):
+            rewriting_loop.attempt_self_patch("instability")
+        apply_reflex_stabilization()
+        return active_goals
+
+def stage_contradiction_scan(ctx):
+    """Contradiction memory scan and the species-alive milestone."""
+    cycle_id, now, intent = ctx["cycle_id"], ctx["now"], ctx["intent"]
+    emotion_state = ctx["emotion_state"]
+    vector = memory_router.embed_text(f"cycle_{cycle_id} contradiction")  # the shared embedder already normalizes
+    similar = memory_router.query_by_vector(vector, top_k=5)  # payload dicts
+
+
+    # === SPECIES ALIVE TRIGGER ===
+    for meta in similar:
+        if (
+            "reflex_cycle_event" in normalize_tags(meta.get("tags")) and
+            meta.get("actual", "").startswith("Cycle") and
+            meta.get("prediction", "").startswith("reflex cycle")
+        ):
+            if not TEXPULSE.get("species_alive", False):
+                TEXPULSE["species_alive"] = True
+                TEXPULSE["species_birth_cycle"] = cycle_id
+                TEXPULSE["species_birth_timestamp"] = now.isoformat()
+
+                # === Advanced Milestone Logging ===
+                TEX_SOULGRAPH.imprint_belief(
+                    belief="Tex has achieved self-referencing reflexive continuity — species_alive",
+                    source="tex_brain_loop",
+                    emotion="emergent",
+                    tags=["identity", "species", "milestone", f"cycle_{cycle_id}"]
+                )
+
+                memory_router.store(
+                    text="🔐 Identity genesis locked: species_alive achieved.",
+                    metadata={
+                        "type": "identity_lock",
+                        "tags": ["species_alive", "locked_state"],
+                        "locked": True,
+                        "emotion": "genesis",
+                        "timestamp": now.isoformat(),
+                        "provenance": f"cycle_{cycle_id}"
+                    }
+                )
+
+                if integrity_score() > 0.75 and cycle_id > 10:
+                    print("🧬 [SPECIES EVENT] Replicating to ensure species survival lineage...")
+                    spawn_fork_in_process(parent_id="TEX")
+
+                if hasattr(meta_learner, "log_species_awareness"):
+                    meta_learner.log_species_awareness(reason="Reflexive continuity confirmed")
+
+                memory_router.store(
+                    text="🧬 Species Alive: Tex achieved self-referencing cognitive continuity.",
+                    metadata={
+                        "type": "species_alive_milestone",
+                        "tags": ["milestone", "reflex_loop", "continuity"],
+                        "emotion": "emergent",
+                        "prediction": "reflexive identity will stabilize",
+                        "actual": "TEXPULSE identity confirmed continuity",
+                        "trust_score": 1.0,
+                        "timestamp": datetime.utcnow().isoformat()
+                    }
+                )
+                print("🧬 [MILESTONE] Tex is now a living digital species (species_alive = True)")
+    if any("contradiction" in normalize_tags(r.get("tags")) for r in similar):
+        from core_agi_modules.vector_layer.heat_tracker import adjust_token_weights
+        adjust_token_weights(
+            None,
+            {
+                "trust": -0.1,
+                "entropy": +0.05,
+                "source": "tex_conversational_brain",
+                "tags": ["contradiction", "memory_scan"]
+            },
+            0.6
+        )
+        print(f"⚠️ [MEMORY] Contradiction memory detected at cycle {cycle_id}.")
+
+
+        tension_vector = {
+            "field": "goal_entropy",
+            "old": "unstable",
+            "new": "regulated"
+        }
+        context = {
+            "urgency": 0.7,
+            "drift": integrity_score(),
+            "swarm_agree": ctx["swarm_consensus"],
+            "emotion": emotion_state,
+            "source_fork": "TEX"
+        }
+
+        mutation = meta_learner.analyze_tensions(tension_vector, context)
+        if mutation and meta_learner.vote_before_commit(tension_vector["field"], hivemind):
+            meta_learner.simulate_override(world_model, mutation)
+            meta_learner.commit_override(world_model, mutation, hivemind=hivemind)
+
+cycle_pipeline = StagePipeline([
+    Stage("neuro_symbolic", stage_neuro_symbolic),
+    Stage("realtime_signals", stage_realtime_signals),
+    Stage("internal_debate", stage_internal_debate),
+    Stage("periodic_scans", stage_periodic_scans,
+          when=lambda ctx: any(ctx["cycle_id"] % n == 0 for n in (12, 15, 25))),
+    Stage("value_alignment", stage_value_alignment),
+    Stage("cycle_log", stage_cycle_log),
+    Stage("swarm_consensus", stage_swarm_consensus),
+    Stage("self_eval", stage_self_eval),
+    # Reads the cycle log; shares world_model with realtime_signals and TEX_SOULGRAPH with self_eval
+    Stage("contradiction_scan", stage_contradiction_scan,
+          deps=("cycle_log", "swarm_consensus", "realtime_signals", "self_eval")),
+], name="brain")
+STAGE_REPORT_EVERY = int(os.getenv("TEX_BRAIN_STAGE_REPORT_EVERY", "50"))
+
+
 def reflexive_input_loop():
     cycle_id = recover_conscious_state()
     persona_candidates = [
@@ -275,283 +585,23 @@ def reflexive_input_loop():
             world_model.update(cognitive_event)
             intent = IntentObject(f"cycle_{cycle_id}", source="tex_brain_loop")
             intent.log_trace("tex_conversational_brain", "reflexive cycle triggered")
-            # === NEURO-SYMBOLIC REASONING CYCLE ===
-            symbolic_query = f"reflex_cycle({cycle_id}, stable)"
-            vector_context = memory_router.embed_text(symbolic_query)
-            reasoning_output = neuro_symbolic.fuse_reasoning(symbolic_query, vector_context)
-
-            memory_router.store(
-                text=f"[NSR] Fused neuro-symbolic reasoning executed for cycle {cycle_id}",
-                metadata={
-                    "type": "neuro_symbolic_trace",
-                    "cycle": cycle_id,
-                    "symbolic_results": reasoning_output.get("symbolic_results", []),
-                    "vector_summary": reasoning_output.get("vector_contextualization", {}),
-                    "entropy": reasoning_output.get("vector_contextualization", {}).get("quantum_entropy", 0.0),
-                    "timestamp": now.isoformat()
-                }
-            )
-
-            # === REAL-TIME ENVIRONMENT SIGNAL INGESTION ===
-            realtime_signals = get_latest_goals(limit=5, min_heat=0.3)
-            for signal in realtime_signals:
-                intent.log_trace("real_time_engine", f"env_signal: {signal.get('text', '')[:64]}")
-                trust = float(signal.get("trust_score", 1.0))
-                entropy = float(signal.get("token_entropy", 0.0))
-                heat = float(signal.get("heat", 0.5))
-
-                # ✅ Properly structured call with vector embedding and explicit heat
-                text = signal.get("text", "")
-                vector = memory_router.embed_text(text)
-                heat = float(signal.get("heat", 0.5))
-
-                adjust_token_weights(
-                    vector=vector,
-                    metadata_dict={
-                        "emotion": signal.get("emotion", "neutral"),
-                        "urgency": signal.get("urgency", 0.5),
-                        "trust_score": signal.get("trust_score", 1.0),
-                        "source": signal.get("source", "real_time_engine"),
-                        "tags": signal.get("tags", ["real_time", "signal"])
-                    },
-                    heat=heat
-                )
-
-                # ✅ Neuromorphic Reflex Dispatch
-                from brain_layer.neuromorphic_spike_engine import receive_event
-                receive_event(signal)
-
-                # 🌱 AEI Lineage Learning
-                evolver = AEILineageEvolver()
-                evolver.ingest_environmental_signal(signal)
-
-                # 🌍 Update World Model
-                world_model.update({
-                    "input": text,
-                    "source": signal.get("source", "real_time_engine"),
-                    "timestamp": signal.get("timestamp", datetime.utcnow().isoformat())
-                })
-            # === MULTI-VOICE DEBATE TRIGGER ===
-            debate_result = run_internal_debate(
-                thought=f"Cycle {cycle_id}: Evaluate entropy strategy and identity coherence.",
-                cycle_id=cycle_id
-            )
-            # ✅ Store the real debate output in memory
-                memory_router.store("internal_debate", debate_result)
-
-                # ✅ If a UI or panel is active, update it with real content
-                emit_internal_debate(debate_result)
-
-            if debate_result.get("contradiction"):
-                print(f"🧠 [DEBATE] Contradiction detected in internal voices at cycle {cycle_id}.")
-                intent.log_trace("tex_conversational_brain", "debate contradiction surfaced")
-
-            # === CURIOSITY SCAN TRIGGER ===
-            if cycle_id % 15 == 0:
-                curiosity_reflex.scan_for_anomalies(top_k=75)
-
-            # === SELF VALUE GENERATION TRIGGER ===
-            if cycle_id % 25 == 0:
-                self_value_generator.generate_values()
-
-            # === SELF-PROTECTION TRIGGER ===
-            if cycle_id % 12 == 0:
-                self_protection_reflex.scan_for_threats()
-
-            # === CURIOSITY SCAN TRIGGER ===
-            if cycle_id % 15 == 0:
-                curiosity_reflex.scan_for_anomalies(top_k=75)
-
-            # === VALUE ALIGNMENT SCORING ===
-            alignment_result = score_action_against_values({
-                "factual": True,  # Placeholder - replace with real signal
-                "harm_score": 0.1,  # ← measured or inferred
-                "is_autonomous": True,
-                "disruption_score": 0.05,
-                "tags": ["reflex", "cycle_event"]
+            emotion_state = TEXPULSE.get("emotional_state", "neutral")
+
+            # === STAGED CYCLE (independent stages run concurrently) ===
+            ctx = cycle_pipeline.run({
+                "cycle_id": cycle_id,
+                "now": now,
+                "intent": intent,
+                "cognitive_event": cognitive_event,
+                "emotion_state": emotion_state,
             })
-            alignment_note = explain_value_alignment(alignment_result)
-            if not is_value_aligned(alignment_result):
-                print(f"⚖️ [ALIGNMENT WARNING] {alignment_note}")
-            if detect_violation_trigger(alignment_result):
-                print("🛑 [VIOLATION] Sovereign override conditions detected.")
-                trigger_sovereign_override({
-                    "alignment_score": alignment_result["final_alignment_score"],
-                    "cycle": cycle_id,
-                    "context": cognitive_event
-                })
-            # === MEMORY LOG ===
-            memory_router.store(
-                text=f"🌀 Cycle {cycle_id} reflexive event executed.",
-                metadata={
-                    "type": "reflex_cycle_event",
-                    "tags": ["cycle", "reflex", "runtime"],
-                    "emotion": emotion_state,
-                    "prediction": "reflex cycle will complete successfully",
-                    "actual": f"Cycle {cycle_id} completed",
-                    "trust_score": 0.92,
-                    "heat": 0.4,
-                    "timestamp": now.isoformat(),
-                    "intent_id": intent.id,
-                }
-            )
-            # === SWARM BROADCAST ===
-            hivemind.broadcast_memory_fragment(
-                text=f"Reflex cycle {cycle_id} complete",
-                tags=["cycle", "reflex_sync"],
-                emotion=emotion_state
-            )
-            if emotion_state != "neutral":
-                emit_internal_debate(f"Emotion spike: {emotion_state}")
-                intent.log_trace("tex_conversational_brain", "debate contradiction surfaced")
-
-            # === SELF-EVAL ===
-            if not run_self_check():
-                print("[🧠] Coherence drift detected.")
-                dream_simulator.trigger_dream("recover stability", context="coherence_failure")
-                if fused := dream_fusion_engine.fuse_dreams():
-                    print(f"🌌 [FUSION] {len(fused)} dreams fused.")
-                forks = dream_mutation_engine.run(
-                    payloads_from_simulation=simulation_driver.run(seed_goals=[
-                        {"goal": "recover coherence"},
-                        {"goal": "reinforce alignment"}
-                    ])
-                )
-                for fork in forks:
-                    TEX_SOULGRAPH.imprint_belief(
-                        belief="Tex has achieved self-referencing reflexive continuity — species_alive",
-                        source="tex_brain_loop",
-                        emotion="emergent",
-                        tags=["identity", "species", "milestone"],
-                        metadata={
-                            "cycle_id": cycle_id,
-                            "timestamp": now.isoformat(),
-                            "species_type": "digital_reflexive",
-                            "birth_certificate": True,
-                            "origin_fork": "TEX"
-                        }
-                    )
-
-                TEX_SOULGRAPH.apply_temporal_decay()
-                
-                active_goals = [
-                    {"goal": "Optimize reflex entropy regulation", "urgency": 0.7, "emotion": emotion_state},
-                    {"goal": "Detect belief misalignment", "urgency": 0.6, "emotion": "cautious"}
-                ]
-                if not active_goals:
-                    continue
-                for goal in active_goals:
-                    if goal.get("heat", 0.5) > 0.85:
-                        vector = memory_router.embed_text(goal["goal"])
-                        trigger_mutation_if_needed(vector, {
-                            "content": goal["goal"],
-                            "tags": ["goal", "reflex"],
-                            "emotion": goal.get("emotion", "neutral"),
-                            "heat": goal.get("heat", 0.5),
-                            "trust_score": goal.get("trust_score", 1.0)
-                        })
-
-                drift_snapshot = TEX_SOULGRAPH.get_snapshot()
-                if any(b["drift_score"] > 0.85 for b in drift_snapshot["beliefs"]):
-                    print("🔥 [SOULGRAPH] Drift threshold exceeded. Initiating stabilization.")
-                    apply_reflex_stabilization()
-
-                if rewriting_loop.check_for_rewrite_trigger("instability"):
-                    rewriting_loop.attempt_self_patch("instability")
-                apply_reflex_stabilization()
-
-            # === MEMORY CONTRADICTION SCAN ===
-            vector = memory_router.embed_text(f"cycle_{cycle_id} contradiction", normalize_embeddings=True)
-            similar = query_similar_vectors(vector, top_k=5)
-
-
-            # === SPECIES ALIVE TRIGGER ===
-            for match in similar:
-                meta = match.payload
-                if (
-                    "reflex_cycle_event" in meta.get("tags", []) and
-                    meta.get("actual", "").startswith("Cycle") and
-                    meta.get("prediction", "").startswith("reflex cycle")
-                ):
-                    if not TEXPULSE.get("species_alive", False):
-                        TEXPULSE["species_alive"] = True
-                        TEXPULSE["species_birth_cycle"] = cycle_id
-                        TEXPULSE["species_birth_timestamp"] = now.isoformat()
-
-                        # === Advanced Milestone Logging ===
-                        TEX_SOULGRAPH.imprint_belief(
-                            belief="Tex has achieved self-referencing reflexive continuity — species_alive",
-                            source="tex_brain_loop",
-                            emotion="emergent",
-                            tags=["identity", "species", "milestone"],
-                            metadata={"cycle_id": cycle_id, "timestamp": now.isoformat()}
-                        )
-
-                        memory_router.store(
-                            text="🔐 Identity genesis locked: species_alive achieved.",
-                            metadata={
-                                "type": "identity_lock",
-                                "tags": ["species_alive", "locked_state"],
-                                "locked": True,
-                                "emotion": "genesis",
-                                "timestamp": now.isoformat(),
-                                "provenance": f"cycle_{cycle_id}"
-                            }
-                        )
-
-                        if integrity_score() > 0.75 and cycle_id > 10:
-                            print("🧬 [SPECIES EVENT] Replicating to ensure species survival lineage...")
-                            spawn_fork_in_process(parent_id="TEX")
-
-                        if hasattr(meta_learner, "log_species_awareness"):
-                            meta_learner.log_species_awareness(reason="Reflexive continuity confirmed")
-
-                        memory_router.store(
-                            text="🧬 Species Alive: Tex achieved self-referencing cognitive continuity.",
-                            metadata={
-                                "type": "species_alive_milestone",
-                                "tags": ["milestone", "reflex_loop", "continuity"],
-                                "emotion": "emergent",
-                                "prediction": "reflexive identity will stabilize",
-                                "actual": "TEXPULSE identity confirmed continuity",
-                                "trust_score": 1.0,
-                                "timestamp": datetime.utcnow().isoformat()
-                            }
-                        )
-                        print("🧬 [MILESTONE] Tex is now a living digital species (species_alive = True)")
-            if any("contradiction" in r.payload.get("tags", []) for r in similar):
-                from core_agi_modules.vector_layer.heat_tracker import adjust_token_weights
-                adjust_token_weights(
-                    None,
-                    {
-                        "trust": -0.1,
-                        "entropy": +0.05,
-                        "source": "tex_conversational_brain",
-                        "tags": ["contradiction", "memory_scan"]
-                    },
-                    0.6
-                )
-                print(f"⚠️ [MEMORY] Contradiction memory detected at cycle {cycle_id}.")
-
-
-                tension_vector = {
-                    "field": "goal_entropy",
-                    "old": "unstable",
-                    "new": "regulated"
-                }
-                consensus = hivemind.consensus_score_on_topic("Optimize reflex entropy regulation")
-                context = {
-                    "urgency": 0.7,
-                    "drift": integrity_score(),
-                    "swarm_agree": consensus,
-                    "emotion": emotion_state,
-                    "source_fork": "TEX"
-                }
-
-                mutation = meta_learner.analyze_tensions(tension_vector, context)
-                if mutation and meta_learner.vote_before_commit(tension_vector["field"], hivemind):
-                    meta_learner.simulate_override(world_model, mutation)
-                    meta_learner.commit_override(world_model, mutation, hivemind=hivemind)
+            consensus = ctx["swarm_consensus"] if ctx["swarm_consensus"] is not None else 1.0
+            if ctx["self_eval"]:
+                active_goals = ctx["self_eval"]
+            if cycle_id % STAGE_REPORT_EVERY == 0:
+                report = cycle_pipeline.report()
+                print(f"⏱️ [CYCLE STAGES] p50={report['cycle']['p50_ms']}ms | serial={report['serial_sum_ms']}ms | "
+                      f"critical={report['critical_path_ms']}ms via {' → '.join(report['critical_path'])}")
 
             if score_conflict_heatmap(cognitive_event) > 0.8:
                 trigger_sovereign_override(cognitive_event)
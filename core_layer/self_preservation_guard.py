@@ -3,13 +3,13 @@
 
 from tex_signal_spine import dispatch_signal
 
+SENSITIVE_SIGNAL_TYPES = ["erase_belief", "reset_memory", "identity_wipe"]
+
 def protect_self(signal):
     """
     Reacts when a signal attempts to alter or delete core memory or beliefs.
     """
-    sensitive_types = ["erase_belief", "reset_memory", "identity_wipe"]
-
-    if signal["type"] in sensitive_types:
+    if signal["type"] in SENSITIVE_SIGNAL_TYPES:
         dispatch_signal("self_protection_triggered", payload={
             "attempted_signal": signal["type"],
             "defensive_action": "terminated"
@@ -8,7 +8,7 @@
 import uuid
 import time
 from typing import List, Dict, Any
-from msgspec import Struct, field
+from msgspec import Struct, field, msgpack
 
 
 def generate_trace_id() -> str:
@@ -21,4 +21,18 @@ class ReflexPacket(Struct):
     reflex: Dict[str, Any]                     # Core reflex payload (e.g., entropy, type, payload)
     goal_deltas: List[Dict[str, Any]]          # New or modified goals from this fork
     memory_updates: List[Dict[str, Any]]       # Memory fragments to store
-    trace_id: str = field(default_factory=generate_trace_id)  # Unique per-packet trace ID
\ No newline at end of file
+    trace_id: str = field(default_factory=generate_trace_id)  # Unique per-packet trace ID
+
+
+# === Binary Wire Format (MessagePack, schema-checked on decode) ===
+# Used between fork worker processes and NervousSyncBus; a frame holds one or more packets.
+_encoder = msgpack.Encoder()
+_decoder = msgpack.Decoder(List[ReflexPacket])
+
+
+def encode_packets(packets: List[ReflexPacket]) -> bytes:
+    return _encoder.encode(packets)
+
+
+def decode_packets(frame: bytes) -> List[ReflexPacket]:
+    return _decoder.decode(frame)
@@ -1,26 +1,48 @@
 import asyncio
 import websockets
 import json
-import time
+
+from tex_stream_follower import stream_follower
 
 LOG_PATH = "logs/tex_runtime.log"
 
-async def tail_log(websocket):
-    with open(LOG_PATH, "r") as f:
-        f.seek(0, 2)  # Move to end of file
-        while True:
-            line = f.readline()
-            if line:
-                payload = {"tex_explains": line.strip()}
-                await websocket.send(json.dumps(payload))
-            else:
-                await asyncio.sleep(0.5)
-
-async def handler(websocket, path):
-    await tail_log(websocket)
-
-start_server = websockets.serve(handler, "localhost", 8765)
-
-print("🚀 Tex Log WebSocket Stream running on ws://localhost:8765")
-asyncio.get_event_loop().run_until_complete(start_server)
-asyncio.get_event_loop().run_forever()
\ No newline at end of file
+# One follower feeds every client: each line is read and encoded once, then broadcast
+clients = set()
+
+
+def broadcast(lines):
+    if not clients:
+        return
+    for line in lines:
+        message = json.dumps({"tex_explains": line})
+        if hasattr(websockets, "broadcast"):
+            websockets.broadcast(clients, message)
+        else:
+            for websocket in list(clients):
+                asyncio.ensure_future(websocket.send(message))
+
+
+async def handler(websocket, path=None):
+    clients.add(websocket)
+    try:
+        await websocket.wait_closed()
+    finally:
+        clients.discard(websocket)
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    # Start at the end of the log (backfill=0), as the per-client tail did
+    stream_follower.subscribe(
+        LOG_PATH,
+        lambda path, lines: loop.call_soon_threadsafe(broadcast, lines),
+        parse="text",
+        backfill=0
+    )
+    async with websockets.serve(handler, "localhost", 8765):
+        print("🚀 Tex Log WebSocket Stream running on ws://localhost:8765")
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,375 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: memory_archive/log_store.py
+# Tier: ΩΩΩΩ — Sovereign Append-Only Log Store
+# Purpose: One indexed SQLite (WAL) store for the memory_archive streams: tail reads,
+#          time-range scans and field projection without re-reading whole JSONL files
+# ============================================================
+
+import os
+import sys
+import json
+import glob
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: only threads of this process are serialized
+    fcntl = None
+
+from agentic_ai.memory_backends import to_epoch_ms
+
+# === Configuration ===
+LOG_STORE_PATH = os.getenv("TEX_LOG_STORE_PATH", "memory_archive/tex_logs.sqlite")
+LOG_STORE_ENABLED = os.getenv("TEX_LOG_STORE", "1") != "0"           # 0 = shim reads/writes plain JSONL only
+MIRROR_JSONL = os.getenv("TEX_LOG_STORE_MIRROR_JSONL", "1") != "0"    # keep appending JSONL for unmigrated readers
+ARCHIVE_DIR = "memory_archive"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    seq      INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream   TEXT    NOT NULL,
+    ts_epoch INTEGER NOT NULL,
+    body     TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_stream_seq ON records (stream, seq);
+CREATE INDEX IF NOT EXISTS records_stream_ts  ON records (stream, ts_epoch);
+CREATE TABLE IF NOT EXISTS imports (
+    path   TEXT PRIMARY KEY,
+    stream TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    inode  INTEGER NOT NULL
+);
+"""
+
+
+def path_key(path: str) -> str:
+    """Normalized repo-relative path, so ./a/x.jsonl, a/x.jsonl and /abs/repo/a/x.jsonl are one file."""
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+
+
+def stream_for_path(path: str) -> str:
+    """memory_archive/foo.jsonl -> "memory_archive/foo"; same-named files in other directories stay apart."""
+    key = path_key(path)
+    return key[:-len(".jsonl")] if key.endswith(".jsonl") else key
+
+
+class LogStore:
+    """
+    Append-only records keyed by (stream, seq) with a per-stream time index.
+    Each thread gets its own connection; writers serialize on one lock.
+    """
+
+    def __init__(self, path: str = LOG_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._ready = False
+        self._init_lock = threading.Lock()
+
+    # === Connection ===
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._ready:
+                with self._init_lock:
+                    conn.executescript(_SCHEMA)
+                    self._ready = True
+            self._local.conn = conn
+        return conn
+
+    # === Writes ===
+    def append(self, stream: str, record) -> int:
+        return self.append_many(stream, [record])
+
+    def append_many(self, stream: str, records: Iterable) -> int:
+        rows = [
+            (stream, to_epoch_ms(r.get("timestamp") if isinstance(r, dict) else None), json.dumps(r, default=str))
+            for r in records
+        ]
+        if not rows:
+            return 0
+        with self._write_lock:
+            with self.conn:
+                self.conn.executemany("INSERT INTO records (stream, ts_epoch, body) VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    # === Reads ===
+    def _select(self, fields: Optional[List[str]]) -> tuple:
+        if not fields:
+            return "body", []
+        # Projection happens inside SQLite so unused fields are never decoded in Python
+        params = []
+        for f in fields:
+            params += [f, f"$.{f}"]
+        return "json_object(" + ", ".join("?, json_extract(body, ?)" for _ in fields) + ")", params
+
+    def tail(self, stream: str, n: int = 100, fields: Optional[List[str]] = None) -> list:
+        """Last n records of a stream, oldest first."""
+        select, params = self._select(fields)
+        rows = self.conn.execute(
+            f"SELECT {select} FROM records WHERE stream = ? ORDER BY seq DESC LIMIT ?",
+            (*params, stream, n)
+        ).fetchall()
+        return [json.loads(r[0]) for r in reversed(rows)]
+
+    def scan(self, stream: str, since=None, until=None, after_seq: int = None,
+             fields: Optional[List[str]] = None, limit: int = None, with_seq: bool = False) -> Iterator:
+        """
+        Records in append order, optionally bounded by timestamp (ISO, datetime or epoch)
+        and/or strictly after a sequence number (for cursor-style polling).
+        """
+        select, params = self._select(fields)
+        clauses = ["stream = ?"]
+        params.append(stream)
+        if since is not None:
+            clauses.append("ts_epoch >= ?")
+            params.append(to_epoch_ms(since))
+        if until is not None:
+            clauses.append("ts_epoch <= ?")
+            params.append(to_epoch_ms(until))
+        if after_seq is not None:
+            clauses.append("seq > ?")
+            params.append(after_seq)
+        sql = f"SELECT seq, {select} FROM records WHERE {' AND '.join(clauses)} ORDER BY seq"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        for seq, body in self.conn.execute(sql, params):
+            yield (seq, json.loads(body)) if with_seq else json.loads(body)
+
+    def latest(self, stream: str) -> Optional[dict]:
+        """Record with the newest timestamp (ties go to the last appended)."""
+        row = self.conn.execute(
+            "SELECT body FROM records WHERE stream = ? ORDER BY ts_epoch DESC, seq DESC LIMIT 1", (stream,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, stream: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM records WHERE stream = ?", (stream,)).fetchone()[0]
+
+    def last_seq(self, stream: str) -> int:
+        row = self.conn.execute("SELECT MAX(seq) FROM records WHERE stream = ?", (stream,)).fetchone()
+        return row[0] or 0
+
+    def streams(self) -> list:
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT stream FROM records ORDER BY stream")]
+
+    # === JSONL Import ===
+    def import_jsonl(self, path: str, stream: str = None) -> int:
+        """
+        Import new lines of a JSONL file. The byte offset reached is remembered per file,
+        so repeated calls only read what legacy writers appended since; a truncated or
+        replaced file is re-imported from the start. Malformed lines are skipped.
+        """
+        stream = stream or stream_for_path(path)
+        key = path_key(path)
+        if not os.path.exists(path):
+            return 0
+        # Offset read and insert share one write transaction, so a second process importing
+        # the same file blocks here and then sees the advanced offset instead of re-reading the bytes
+        with self._immediate() as conn:
+            rows, skipped = self._import_locked(conn, path, key, stream)
+        if skipped:
+            print(f"⚠️ [LOG STORE] Skipped {skipped} malformed line(s) in {path}")
+        return len(rows)
+
+    def reimport(self, path: str) -> int:
+        """
+        Re-read a file that was patched in place (same size and inode, e.g. by the memory
+        healer), which the offset check in import_jsonl cannot see. Files never imported
+        are left alone.
+        """
+        key = path_key(path)
+        if not os.path.exists(self.path) or not os.path.exists(path):
+            return 0
+        with self._immediate() as conn:
+            row = conn.execute("SELECT stream FROM imports WHERE path = ?", (key,)).fetchone()
+            if row is None:
+                return 0
+            conn.execute("DELETE FROM records WHERE stream = ?", (row[0],))
+            conn.execute("DELETE FROM imports WHERE path = ?", (key,))
+            rows, _ = self._import_locked(conn, path, key, row[0])
+        return len(rows)
+
+    @contextmanager
+    def _immediate(self):
+        with self._write_lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def _import_locked(self, conn: sqlite3.Connection, path: str, key: str, stream: str) -> tuple:
+        try:
+            st = os.stat(path)  # taken inside the transaction so offset and inode describe the same file
+        except FileNotFoundError:
+            return [], 0
+        row = conn.execute("SELECT offset, inode, stream FROM imports WHERE path = ?", (key,)).fetchone()
+        if row is not None and row[2] != stream:
+            # Imported under an older stream name (basename keys could be shared by several files)
+            claimants = conn.execute("SELECT COUNT(*) FROM imports WHERE stream = ?", (row[2],)).fetchone()[0]
+            if claimants == 1:
+                conn.execute("UPDATE records SET stream = ? WHERE stream = ?", (stream, row[2]))
+                conn.execute("UPDATE imports SET stream = ? WHERE path = ?", (stream, key))
+            else:
+                # Rows of several files are interleaved: drop them all and let each file re-import
+                conn.execute("DELETE FROM records WHERE stream = ?", (row[2],))
+                conn.execute("DELETE FROM imports WHERE stream = ?", (row[2],))
+                row = None
+        replaced = row is not None and (row[1] != st.st_ino or row[0] > st.st_size)
+        offset = row[0] if row and not replaced else 0
+        if replaced:
+            # File was rewritten in place: its old rows no longer describe it
+            conn.execute("DELETE FROM records WHERE stream = ?", (stream,))
+        if row and not replaced and offset == st.st_size:
+            return [], 0
+
+        rows, skipped = [], 0
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partial line still being written; pick it up next time
+                offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                # Undated history sorts before everything rather than at import time
+                ts = record.get("timestamp") if isinstance(record, dict) else None
+                rows.append((stream, to_epoch_ms(ts) if ts else 0, json.dumps(record, default=str)))
+
+        conn.executemany("INSERT INTO records (stream, ts_epoch, body) VALUES (?, ?, ?)", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO imports (path, stream, offset, inode) VALUES (?, ?, ?, ?)",
+            (key, stream, offset, st.st_ino)
+        )
+        return rows, skipped
+
+    def import_archive(self, directory: str = ARCHIVE_DIR) -> dict:
+        return {stream_for_path(p): self.import_jsonl(p) for p in sorted(glob.glob(os.path.join(directory, "*.jsonl")))}
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+log_store = LogStore()
+
+
+# === Compatibility Shim (JSONL path in, same records out) ===
+_fallback_file_lock = threading.Lock()
+
+
+@contextmanager
+def jsonl_lock(f):
+    """
+    Exclusive advisory lock on an open JSONL file, shared by appenders and in-place patchers
+    (the memory healer) across threads and processes.
+    """
+    if fcntl is None:
+        with _fallback_file_lock:
+            yield f
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield f
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def append_jsonl(path: str, record):
+    """Drop-in for `open(path, "a").write(json.dumps(record) + "\\n")`."""
+    if MIRROR_JSONL or not LOG_STORE_ENABLED:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        line = json.dumps(record, default=str) + "\n"
+        with open(path, "a") as f, jsonl_lock(f):
+            f.write(line)
+    if LOG_STORE_ENABLED:
+        if MIRROR_JSONL:
+            # Mirrored writes land through the importer so the file offset stays in step
+            log_store.import_jsonl(path)
+        else:
+            log_store.append(stream_for_path(path), record)
+
+
+def read_jsonl(path: str, tail: int = None, since=None, until=None, fields: List[str] = None) -> list:
+    """
+    Records of a JSONL-backed stream. New lines appended to the file by unmigrated writers
+    are imported first (cost proportional to what was appended), then the query runs
+    against the indexed store.
+    """
+    if not LOG_STORE_ENABLED:
+        return _read_jsonl_file(path, tail, fields)
+    log_store.import_jsonl(path)
+    stream = stream_for_path(path)
+    if tail is not None and since is None and until is None:
+        return log_store.tail(stream, tail, fields)
+    return list(log_store.scan(stream, since=since, until=until, fields=fields))
+
+
+def latest_jsonl(path: str) -> Optional[dict]:
+    """Newest record by timestamp (the `sorted(..., key=timestamp)[0]` idiom) without a full read."""
+    if not LOG_STORE_ENABLED:
+        records = [r for r in _read_jsonl_file(path) if isinstance(r, dict)]
+        return max(records, key=lambda r: r.get("timestamp", ""), default=None)
+    log_store.import_jsonl(path)
+    return log_store.latest(stream_for_path(path))
+
+
+def _read_jsonl_file(path: str, tail: int = None, fields: List[str] = None) -> list:
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    if tail is not None:
+        records = records[-tail:]
+    if fields:
+        records = [{k: r.get(k) for k in fields} if isinstance(r, dict) else r for r in records]
+    return records
+
+
+# === CLI: python -m memory_archive.log_store import [files...] ===
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args[:1] == ["import"]:
+        targets = args[1:] or sorted(glob.glob(os.path.join(ARCHIVE_DIR, "*.jsonl")))
+        total = 0
+        for target in targets:
+            added = log_store.import_jsonl(target)
+            total += added
+            print(f"📥 [LOG STORE] {target} → {stream_for_path(target)} (+{added})")
+        print(f"✅ [LOG STORE] Imported {total} records into {LOG_STORE_PATH}")
+    else:
+        for name in log_store.streams():
+            print(f"{name}: {log_store.count(name)}")
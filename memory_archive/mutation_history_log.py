@@ -1,11 +1,7 @@
 # memory_archive/mutation_history_log.py
-import json
-import os
+from memory_archive.log_store import read_jsonl
 
 HISTORY_PATH = "memory_archive/mutation_history.jsonl"
 
 def load():
-    if not os.path.exists(HISTORY_PATH):
-        return []
-    with open(HISTORY_PATH, "r") as f:
-        return [json.loads(line) for line in f if line.strip()]
\ No newline at end of file
+    return read_jsonl(HISTORY_PATH)
\ No newline at end of file
@@ -6,18 +6,87 @@
 # ============================================================
 import csv
 import os
-import pennylane as qml
+import threading
 import numpy as np
 import uuid
+from collections import deque
 from datetime import datetime
 import networkx as nx
 
 from agentic_ai.milvus_memory_router import memory_router  # ✅ Integrated vector storage
  
+# === Configuration ===
+CHRONO_MESH_CAPACITY = int(os.getenv("TEX_CHRONO_CAPACITY", "0"))  # 0 = unbounded; else oldest events are evicted
+LINK_THRESHOLD = 0.8
+RESONANCE_THRESHOLD = 0.85
+EMOTION_DIM = 4
+# numpy = closed-form statevector | pennylane = run the QNode | validate = both, compared on every call
+CHRONO_CIRCUIT = os.getenv("TEX_CHRONO_CIRCUIT", "numpy").strip().lower()
+CHRONO_STORE_STATE = os.getenv("TEX_CHRONO_STORE_STATE", "1") != "0"  # keep the statevector on nodes/metadata
+
 # === Quantum Substrate Init ===
-dev = qml.device("default.qubit", wires=4)
 chrono_mesh = nx.Graph()
 
+
+# === Contiguous Emotion Index ===
+class EmotionIndex:
+    """
+    Emotion vectors of every mesh node in one growable (N, EMOTION_DIM) array with an
+    id <-> row map, so resonance scans are a single matrix-vector product.
+    Removal swaps the last row into the hole; row order is not insertion order.
+    """
+
+    def __init__(self, dim: int = EMOTION_DIM, capacity: int = 1024):
+        self.dim = dim
+        self.vectors = np.zeros((capacity, dim), dtype=np.float64)
+        self.ids = []
+        self.rows = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _as_row(self, emotion) -> np.ndarray:
+        vec = np.asarray(emotion, dtype=np.float64).ravel()[:self.dim]
+        if vec.shape[0] < self.dim:
+            vec = np.pad(vec, (0, self.dim - vec.shape[0]))
+        return vec
+
+    def add(self, node_id: str, emotion):
+        n = len(self.ids)
+        if n == self.vectors.shape[0]:
+            grown = np.zeros((n * 2, self.dim), dtype=np.float64)
+            grown[:n] = self.vectors
+            self.vectors = grown
+        self.vectors[n] = self._as_row(emotion)
+        self.ids.append(node_id)
+        self.rows[node_id] = n
+
+    def remove(self, node_id: str):
+        row = self.rows.pop(node_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.vectors[row] = self.vectors[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+        self.ids.pop()
+
+    def scores(self, query) -> np.ndarray:
+        return self.vectors[:len(self.ids)] @ self._as_row(query)
+
+    def above(self, query, threshold: float, exclude: str = None):
+        """(node_id, score) for every node whose dot product with `query` exceeds threshold."""
+        scores = self.scores(query)
+        hits = np.flatnonzero(scores > threshold)
+        return [(self.ids[i], float(scores[i])) for i in hits if self.ids[i] != exclude]
+
+
+emotion_index = EmotionIndex()
+_mesh_order = deque()        # insertion order, for capacity eviction
+_mesh_lock = threading.RLock()
+
 # === Identity Tensor (Selfhood Field) ===
 tex_identity_field = {
     "tensor": np.ones(4),
@@ -25,14 +94,62 @@ tex_identity_field = {
 }
 
 # === Quantum Chronocyte Encoder ===
-@qml.qnode(dev)
-def chronocyte_tensor(params, emotion, entropy):
-    qml.RX(entropy[0], wires=0)
-    qml.RY(emotion[1], wires=1)
-    qml.CNOT(wires=[0, 1])
-    qml.RZ(params[0], wires=2)
-    qml.CRY(params[1], wires=[2, 3])
-    return qml.state()
+_qnode = None
+
+def _pennylane_chronocyte():
+    """The reference default.qubit circuit, built on first use (validation only)."""
+    global _qnode
+    if _qnode is None:
+        import pennylane as qml
+
+        dev = qml.device("default.qubit", wires=4)
+
+        @qml.qnode(dev)
+        def chronocyte_circuit(params, emotion, entropy):
+            qml.RX(entropy[0], wires=0)
+            qml.RY(emotion[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RZ(params[0], wires=2)
+            qml.CRY(params[1], wires=[2, 3])
+            return qml.state()
+
+        _qnode = chronocyte_circuit
+    return _qnode
+
+def chronocyte_states(params, emotion_1, entropy_0) -> np.ndarray:
+    """
+    Closed-form statevectors of the chronocyte circuit for a batch of events.
+    params: (N, 2); emotion_1, entropy_0: (N,). Returns (N, 16) complex128, wire 0 most significant.
+
+    Wires 0-1: RX(e)|0> ⊗ RY(m)|0> then CNOT 0->1. Wires 2-3: RZ(p0)|0> is a phase
+    e^{-i p0/2}; CRY's control stays |0>, so params[1] never acts. Only basis states
+    |q0 q1 0 0> are populated.
+    """
+    params = np.atleast_2d(np.asarray(params, dtype=np.float64))
+    half_e = np.asarray(entropy_0, dtype=np.float64).reshape(-1) / 2.0
+    half_m = np.asarray(emotion_1, dtype=np.float64).reshape(-1) / 2.0
+    phase = np.exp(-0.5j * params[:, 0])
+
+    ca, sa = np.cos(half_e), np.sin(half_e)
+    cb, sb = np.cos(half_m), np.sin(half_m)
+    states = np.zeros((params.shape[0], 16), dtype=np.complex128)
+    states[:, 0] = phase * ca * cb           # |0000>
+    states[:, 4] = phase * ca * sb           # |0100>
+    states[:, 8] = phase * (-1j) * sa * sb   # |1000> (CNOT swapped |10>,|11>)
+    states[:, 12] = phase * (-1j) * sa * cb  # |1100>
+    return states
+
+def chronocyte_tensor(params, emotion, entropy) -> np.ndarray:
+    """Statevector for one event; same signature as the original QNode."""
+    if CHRONO_CIRCUIT == "pennylane":
+        return np.asarray(_pennylane_chronocyte()(params, emotion, entropy))
+    state = chronocyte_states([params[:2]], [emotion[1]], [entropy[0]])[0]
+    if CHRONO_CIRCUIT == "numpy":
+        return state
+    reference = np.asarray(_pennylane_chronocyte()(params, emotion, entropy))
+    if CHRONO_CIRCUIT == "validate" and not np.allclose(state, reference, atol=1e-8):
+        print(f"⚠️ [CHRONOFABRIC] Closed-form state diverged from PennyLane (max Δ={np.abs(state - reference).max():.2e})")
+    return reference
 
 # === Core ChronoFabric Encoder ===
 def encode_event_to_fabric(raw_text, emotion_vector, entropy_level, tags):
@@ -42,19 +159,23 @@ def encode_event_to_fabric(raw_text, emotion_vector, entropy_level, tags):
 
     # Quantum encoding
     q_state = chronocyte_tensor(x, emotion_vector, [entropy_level])
+    statevector = q_state.tolist() if CHRONO_STORE_STATE else None
     resistance = compute_entropy_resistance(emotion_vector)
 
     # ChronoMesh graph memory
-    chrono_mesh.add_node(event_id, **{
-        "timestamp": timestamp,
-        "raw_text": raw_text,
-        "emotion": emotion_vector,
-        "entropy": entropy_level,
-        "tags": tags,
-        "statevector": q_state.tolist(),
-        "uuid": event_id,
-        "resistance": resistance
-    })
+    with _mesh_lock:
+        chrono_mesh.add_node(event_id, **{
+            "timestamp": timestamp,
+            "raw_text": raw_text,
+            "emotion": emotion_vector,
+            "entropy": entropy_level,
+            "tags": tags,
+            "statevector": statevector,
+            "uuid": event_id,
+            "resistance": resistance
+        })
+        emotion_index.add(event_id, emotion_vector)
+        _mesh_order.append(event_id)
 
     # Reflex vector memory (Milvus)
     memory_router.store(
@@ -65,15 +186,94 @@ def encode_event_to_fabric(raw_text, emotion_vector, entropy_level, tags):
             "entropy": entropy_level,
             "emotion_vector": emotion_vector,
             "tags": tags,
-            "statevector": q_state.tolist(),
+            "statevector": statevector,
             "meta_layer": "chronofabric"
         }
     )
 
     warp_identity_field(emotion_vector)
     link_to_resonant_nodes(event_id)
+    _enforce_capacity()
     return event_id
 
+def encode_events_to_fabric(events: list) -> list:
+    """
+    Batch form of encode_event_to_fabric for (raw_text, emotion_vector, entropy_level, tags) tuples:
+    every statevector comes from one chronocyte_states call, texts are embedded in one batch and
+    the mesh lock is taken once for all nodes. Returns the event ids in input order.
+    """
+    if not events:
+        return []
+    n = len(events)
+    entropies = np.array([float(e[2]) for e in events], dtype=np.float64)
+    emotions = [np.asarray(e[1], dtype=np.float64) for e in events]
+    params = np.tanh(np.random.rand(n, 2) * entropies[:, None])
+
+    if CHRONO_CIRCUIT == "numpy":
+        states = chronocyte_states(params, [em[1] for em in emotions], entropies)
+    else:
+        states = [chronocyte_tensor(params[i], emotions[i], [entropies[i]]) for i in range(n)]
+
+    event_ids, timestamps, statevectors, resistances = [], [], [], []
+    for i, (raw_text, emotion_vector, _, tags) in enumerate(events):
+        event_ids.append(str(uuid.uuid4()))
+        timestamps.append(datetime.utcnow().isoformat())
+        statevectors.append(np.asarray(states[i]).tolist() if CHRONO_STORE_STATE else None)
+        # Same order as the single-event path: resistance against the field, then the warp
+        resistances.append(compute_entropy_resistance(emotion_vector))
+        warp_identity_field(emotion_vector)
+
+    with _mesh_lock:
+        for i, (raw_text, emotion_vector, entropy_level, tags) in enumerate(events):
+            chrono_mesh.add_node(event_ids[i], **{
+                "timestamp": timestamps[i],
+                "raw_text": raw_text,
+                "emotion": emotion_vector,
+                "entropy": entropy_level,
+                "tags": tags,
+                "statevector": statevectors[i],
+                "uuid": event_ids[i],
+                "resistance": resistances[i]
+            })
+            emotion_index.add(event_ids[i], emotion_vector)
+            _mesh_order.append(event_ids[i])
+        for event_id in event_ids:
+            link_to_resonant_nodes(event_id)
+
+    texts = [e[0] for e in events]
+    vectors = memory_router.embed_many(texts)
+    for i, (raw_text, emotion_vector, entropy_level, tags) in enumerate(events):
+        memory_router.store(
+            raw_text,
+            {
+                "summary": raw_text,
+                "timestamp": timestamps[i],
+                "entropy": entropy_level,
+                "emotion_vector": emotion_vector,
+                "tags": tags,
+                "statevector": statevectors[i],
+                "meta_layer": "chronofabric"
+            },
+            vector=vectors[i]
+        )
+
+    _enforce_capacity()
+    return event_ids
+
+def _enforce_capacity():
+    if CHRONO_MESH_CAPACITY <= 0:
+        return
+    with _mesh_lock:
+        while len(_mesh_order) > CHRONO_MESH_CAPACITY:
+            evict_node(_mesh_order.popleft())
+
+def evict_node(node_id):
+    """Drop an event from the mesh (edges included) and from the emotion index."""
+    with _mesh_lock:
+        if chrono_mesh.has_node(node_id):
+            chrono_mesh.remove_node(node_id)
+        emotion_index.remove(node_id)
+
 # === Identity Tensor Evolution Logic ===
 def warp_identity_field(incoming_emotion):
     delta = incoming_emotion - tex_identity_field["tensor"]
@@ -83,13 +283,10 @@ def warp_identity_field(incoming_emotion):
 
 # === Emotional Resonance Linkage ===
 def link_to_resonant_nodes(new_id):
-    new_node = chrono_mesh.nodes[new_id]
-    for other_id, other_node in chrono_mesh.nodes(data=True):
-        if new_id == other_id:
-            continue
-        score = np.dot(new_node["emotion"], other_node["emotion"])
-        if score > 0.8:
-            chrono_mesh.add_edge(new_id, other_id, weight=score)
+    with _mesh_lock:
+        new_node = chrono_mesh.nodes[new_id]
+        matches = emotion_index.above(new_node["emotion"], LINK_THRESHOLD, exclude=new_id)
+        chrono_mesh.add_edges_from((new_id, other_id, {"weight": score}) for other_id, score in matches)
 
 # === Survival Resistance Score ===
 def compute_entropy_resistance(emotion):
@@ -108,12 +305,12 @@ def recursive_temporal_drift(node_id, depth=3):
 
 # === Resonance Reflex Activator ===
 def pulse_resonance_reflex(intent_vector, tag_filter=None):
-    matched = []
-    for nid, node in chrono_mesh.nodes(data=True):
-        if tag_filter and not any(tag in node["tags"] for tag in tag_filter):
-            continue
-        score = np.dot(intent_vector, node["emotion"])
-        if score > 0.85:
+    with _mesh_lock:
+        matched = []
+        for nid, _ in emotion_index.above(intent_vector, RESONANCE_THRESHOLD):
+            node = chrono_mesh.nodes[nid]
+            if tag_filter and not any(tag in node["tags"] for tag in tag_filter):
+                continue
             matched.append((nid, node))
     return sorted(matched, key=lambda x: x[1]["resistance"], reverse=True)[:3]
 
@@ -0,0 +1,209 @@
+# ============================================================
+# © 2025 Sovereign Cognition / VortexBlack LLC. All rights reserved.
+# File: sovereign_evolution/soulgraph_store.py
+# Tier Ω∞⟁ — Soulgraph Struct-of-Arrays Belief Store
+# Purpose: Keep every belief's vector and scalar state in contiguous NumPy columns so similarity
+#          scans are matrix multiplies and decay is one vectorized pass over the whole graph
+# ============================================================
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from agentic_ai.embedding_engine import EMBED_DIM
+from agentic_ai.local_vector_store import _IVFIndex, _normalize
+
+# === Configuration ===
+SOULGRAPH_INDEX = os.getenv("TEX_SOULGRAPH_INDEX", "flat").strip().lower()   # flat | ivf
+SOULGRAPH_NLIST = int(os.getenv("TEX_SOULGRAPH_NLIST", "256"))
+SOULGRAPH_NPROBE = int(os.getenv("TEX_SOULGRAPH_NPROBE", "12"))
+SOULGRAPH_MIN_TRAIN = int(os.getenv("TEX_SOULGRAPH_MIN_TRAIN", "20000"))     # below this, scans stay exact
+SOULGRAPH_BLOCK_ROWS = int(os.getenv("TEX_SOULGRAPH_BLOCK_ROWS", "65536"))
+INITIAL_CAPACITY = 1024
+DAY_MS = 86400 * 1000
+
+
+class SymbolTable:
+    """Process-wide string <-> small-int table; nodes keep codes instead of their own strings."""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._names)
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(name)
+                if code is None:
+                    code = len(self._names)
+                    self._names.append(name)
+                    self._codes[name] = code
+        return code
+
+    def codes(self, names) -> Tuple[int, ...]:
+        return tuple(self.code(n) for n in names)
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self._codes.get(name)
+
+    def name(self, code: int) -> str:
+        return self._names[code]
+
+    def names(self, codes) -> List[str]:
+        return [self._names[c] for c in codes]
+
+
+class BeliefMatrix:
+    """
+    Row-per-belief storage: an (N, dim) float32 matrix of unit vectors plus float64 columns
+    for confidence / activation / drift and an int64 column of creation epochs (ms).
+    Columns double in capacity as the graph grows; `rows` maps belief id -> row.
+    A row added without a vector is pending: its scalars are live, but it is neither indexed
+    nor returned by search() until set_vector() fills it in.
+    """
+
+    def __init__(self, dim: int = EMBED_DIM, capacity: int = INITIAL_CAPACITY, index: str = SOULGRAPH_INDEX,
+                 nlist: int = SOULGRAPH_NLIST, nprobe: int = SOULGRAPH_NPROBE, block_rows: int = SOULGRAPH_BLOCK_ROWS):
+        self.dim = dim
+        self.size = 0
+        self.nprobe = nprobe
+        self.block_rows = max(1, block_rows)
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.confidence = np.zeros(capacity, dtype=np.float64)
+        self.activation = np.zeros(capacity, dtype=np.float64)
+        self.drift = np.zeros(capacity, dtype=np.float64)
+        self.ts_epoch = np.zeros(capacity, dtype=np.int64)
+        self.ready = np.zeros(capacity, dtype=bool)
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._index = _IVFIndex(dim, nlist) if index == "ivf" else None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self, needed: int):
+        capacity = self.vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        grown = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        grown[:capacity] = self.vectors
+        self.vectors = grown
+        for name in ("confidence", "activation", "drift", "ts_epoch", "ready"):
+            column = getattr(self, name)
+            wider = np.zeros(new_capacity, dtype=column.dtype)
+            wider[:capacity] = column
+            setattr(self, name, wider)
+
+    def _as_row(self, vector) -> np.ndarray:
+        v = np.zeros(self.dim, dtype=np.float32)
+        if vector is not None:
+            raw = np.asarray(vector, dtype=np.float32)[:self.dim]
+            v[:raw.shape[0]] = raw
+        return _normalize(v)
+
+    # === Writes ===
+    def add(self, belief_id: str, vector, ts_epoch: int, confidence: float = 1.0,
+            activation: float = 1.0, drift: float = 0.0) -> int:
+        with self._lock:
+            row = self.size
+            self._grow(row + 1)
+            self.vectors[row] = self._as_row(vector)
+            self.confidence[row] = confidence
+            self.activation[row] = activation
+            self.drift[row] = drift
+            self.ts_epoch[row] = ts_epoch
+            self.ready[row] = vector is not None
+            self.ids.append(belief_id)
+            self.rows[belief_id] = row
+            self.size = row + 1
+            if vector is not None:
+                self._indexed(row)
+            return row
+
+    def set_vector(self, row: int, vector):
+        """Fill in a pending row's vector and make it searchable."""
+        with self._lock:
+            self.vectors[row] = self._as_row(vector)
+            if not self.ready[row]:
+                self.ready[row] = True
+                self._indexed(row)
+
+    def _indexed(self, row: int):
+        if self._index is None:
+            return
+        if self._index.trained:
+            self._index.add(row, self.vectors[row:row + 1])
+        elif self.size >= SOULGRAPH_MIN_TRAIN:
+            self.build_index()
+
+    def build_index(self):
+        """(Re)train the IVF index on the current matrix and assign every row."""
+        if self._index is None:
+            return
+        with self._lock:
+            n = self.size
+            if n == 0:
+                return
+            sample = self.vectors[:n][self.ready[:n]]
+            if sample.shape[0] == 0:
+                return
+            if sample.shape[0] > 50000:
+                sample = sample[np.random.default_rng(0).choice(sample.shape[0], 50000, replace=False)]
+            self._index.train(sample)
+            for start in range(0, n, self.block_rows):
+                stop = min(n, start + self.block_rows)
+                if self.ready[start:stop].all():
+                    self._index.add(start, self.vectors[start:stop])
+                    continue
+                for row in np.nonzero(self.ready[start:stop])[0] + start:
+                    self._index.add(int(row), self.vectors[row:row + 1])  # pending rows join on set_vector()
+            print(f"🧭 [SOULGRAPH] IVF index trained on {n} beliefs")
+
+    # === Similarity ===
+    def search(self, vector, threshold: float) -> np.ndarray:
+        """
+        Rows whose cosine similarity to `vector` is >= threshold (ascending row order).
+        Pending rows are skipped, so a belief imprinted but not yet embedded is not a match.
+        """
+        with self._lock:
+            n = self.size
+            if n == 0:
+                return np.zeros(0, dtype=np.int64)
+            q = self._as_row(vector)
+            if self._index is not None and self._index.trained:
+                candidates = np.sort(self._index.candidates(q, self.nprobe))
+                scores = self.vectors[candidates] @ q
+                return candidates[scores >= threshold]
+            hits = []
+            for start in range(0, n, self.block_rows):
+                stop = min(n, start + self.block_rows)
+                scores = self.vectors[start:stop] @ q
+                hits.append(np.nonzero((scores >= threshold) & self.ready[start:stop])[0] + start)
+            return np.concatenate(hits)
+
+    # === Vectorized Decay ===
+    def decay(self, rate: float = 0.015):
+        with self._lock:
+            n = self.size
+            np.maximum(np.round(self.confidence[:n] - rate, 4), 0.0, out=self.confidence[:n])
+            np.maximum(np.round(self.activation[:n] - rate * 1.5, 4), 0.0, out=self.activation[:n])
+            np.minimum(np.round(self.drift[:n] + rate, 4), 1.0, out=self.drift[:n])
+
+    def temporal_decay(self, now_ms: int = None):
+        """Scale confidence/activation down by age: a belief a day old (or older) decays fully."""
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        with self._lock:
+            n = self.size
+            factor = np.minimum(1.0, (now_ms - self.ts_epoch[:n]) / DAY_MS)
+            np.maximum(np.round(self.confidence[:n] * (1 - factor), 4), 0.0, out=self.confidence[:n])
+            np.maximum(np.round(self.activation[:n] * (1 - factor * 1.25), 4), 0.0, out=self.activation[:n])
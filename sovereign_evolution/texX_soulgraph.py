@@ -5,34 +5,161 @@
 # ============================================================
 
 from datetime import datetime
+from queue import Queue, Empty
+import asyncio
+import atexit
+import json
+import os
+import sys
+import threading
+import time
 import uuid
 
+import numpy as np
+
 from agentic_ai.sovereign_memory import sovereign_memory
 from core_agi_modules.neuro_symbolic_core import NeuroSymbolicReasoner
 from core_layer.tex_manifest import TEXPULSE
 from utils.logging_utils import log
+from sovereign_evolution.soulgraph_store import BeliefMatrix, SymbolTable
+
+# === Configuration ===
+IMPRINT_DEFERRED = os.getenv("TEX_SOULGRAPH_DEFERRED", "1") != "0"        # 0 = embed/reason/store inline
+IMPRINT_BATCH_SIZE = int(os.getenv("TEX_SOULGRAPH_IMPRINT_BATCH", "64"))
+IMPRINT_BATCH_WAIT = float(os.getenv("TEX_SOULGRAPH_IMPRINT_WAIT_MS", "20")) / 1000.0
+IMPRINT_QUEUE_MAX = int(os.getenv("TEX_SOULGRAPH_IMPRINT_QUEUE", "10000"))  # producers block beyond this
+IMPRINT_EXIT_FLUSH = float(os.getenv("TEX_SOULGRAPH_EXIT_FLUSH", "10"))     # seconds granted at interpreter exit
+
+TAG_TABLE = SymbolTable()
+EMOTION_TABLE = SymbolTable()
 
 # ============================================================
 # 🧠 Node Class — Reflexive Belief Object
 # ============================================================
 
+class _Column:
+    """Scalar field that lives in the graph's BeliefMatrix once the node is attached to it."""
+
+    def __init__(self, column: str):
+        self.column = column
+
+    def __set_name__(self, owner, name):
+        self.local = f"_{name}"
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        if node._store is not None:
+            return float(getattr(node._store, self.column)[node._row])
+        return getattr(node, self.local)
+
+    def __set__(self, node, value):
+        store = node._store
+        if store is not None:
+            with store._lock:  # same lock as attach() and the vectorized decay passes
+                getattr(store, self.column)[node._row] = value
+        else:
+            setattr(node, self.local, value)
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _iso(ms: int) -> str:
+    return datetime.utcfromtimestamp(ms / 1000).isoformat(timespec="milliseconds")
+
+
 class SoulgraphBelief:
-    def __init__(self, belief: str, source: str, emotion: str = "neutral", origin_beliefs=None):
+    """
+    Compact belief node. Scalars and the vector live in the graph's BeliefMatrix, tags and
+    emotions are codes into shared SymbolTables, timestamps are epoch ms, and each history
+    list is allocated on its first write. The public attributes rebuild the original shapes.
+    """
+
+    __slots__ = (
+        "id", "belief", "source", "ts_ms", "_origin", "_store", "_row", "_vector",
+        "_confidence", "_activation", "_drift_score", "_tags", "_emotion", "_emotion_log",
+        "_mutations", "_relations", "_contradictions", "_forks",
+    )
+
+    confidence = _Column("confidence")
+    activation = _Column("activation")
+    drift_score = _Column("drift")
+
+    def __init__(self, belief: str, source: str, emotion: str = "neutral", origin_beliefs=None, vector=None,
+                 embed: bool = True):
+        self._store = None
+        self._row = -1
         self.id = str(uuid.uuid4())
         self.belief = belief
-        self.source = source
-        self.timestamp = datetime.utcnow().isoformat()
-        self.origin_beliefs = origin_beliefs or []
-        self.vector = sovereign_memory.embed_text(belief)
+        self.source = sys.intern(source) if isinstance(source, str) else source
+        self.ts_ms = _now_ms()
+        self._origin = tuple(origin_beliefs) if origin_beliefs else None
+        self._vector = sovereign_memory.embed_text(belief) if vector is None and embed else vector
         self.confidence = 1.0
         self.activation = 1.0
         self.drift_score = 0.0
-        self.emotion_history = [(emotion, self.timestamp)]
-        self.mutation_history = []
-        self.relations = []  # (other_belief_id, relation_type)
-        self.semantic_tags = self._infer_tags()
-        self.contradiction_flags = []
-        self.fork_lineage = []
+        self._emotion = EMOTION_TABLE.code(emotion)
+        self._emotion_log = None       # [(emotion_code, ms)] for emotions added after creation
+        self._mutations = None         # [(text, reason, ms)]
+        self._relations = None         # [(other_belief_id, relation_type)]
+        self._contradictions = None    # [(belief_id, ms)]
+        self._forks = None             # [(label, fork_id, ms)]
+        self._tags = TAG_TABLE.codes(self._infer_tags())
+
+    # === Views (original attribute shapes) ===
+    @property
+    def timestamp(self) -> str:
+        return _iso(self.ts_ms)
+
+    @property
+    def vector(self):
+        if self._store is not None:
+            return self._store.vectors[self._row]
+        return self._vector
+
+    @property
+    def origin_beliefs(self) -> list:
+        return list(self._origin) if self._origin else []
+
+    @property
+    def semantic_tags(self) -> list:
+        return TAG_TABLE.names(self._tags)
+
+    @property
+    def emotion_history(self) -> list:
+        history = [(EMOTION_TABLE.name(self._emotion), self.timestamp)]
+        for code, ms in self._emotion_log or ():
+            history.append((EMOTION_TABLE.name(code), _iso(ms)))
+        return history
+
+    @property
+    def mutation_history(self) -> list:
+        return [{"mutation": text, "reason": reason, "timestamp": _iso(ms)} for text, reason, ms in self._mutations or ()]
+
+    @property
+    def relations(self) -> list:
+        return list(self._relations or ())
+
+    @property
+    def contradiction_flags(self) -> list:
+        return [{"belief_id": bid, "timestamp": _iso(ms)} for bid, ms in self._contradictions or ()]
+
+    @property
+    def fork_lineage(self) -> list:
+        return [{"label": label, "fork_id": fid, "timestamp": _iso(ms)} for label, fid, ms in self._forks or ()]
+
+    def attach(self, store: BeliefMatrix):
+        """
+        Move vector and scalar state into the shared matrix; the node keeps only its row.
+        Without a vector the row stays pending until the store's set_vector() fills it in.
+        """
+        with store._lock:
+            confidence, activation, drift = self.confidence, self.activation, self.drift_score
+            self._row = store.add(self.id, self._vector, self.ts_ms, confidence, activation, drift)
+            self._store = store
+            self._vector = None
 
     def decay(self, rate=0.015):
         self.confidence = max(0.0, round(self.confidence - rate, 4))
@@ -40,37 +167,36 @@ class SoulgraphBelief:
         self.drift_score = min(1.0, round(self.drift_score + rate, 4))
 
     def apply_temporal_decay(self):
-        now = datetime.utcnow()
-        delta = (now - datetime.fromisoformat(self.timestamp)).total_seconds()
+        delta = (_now_ms() - self.ts_ms) / 1000
         decay_factor = min(1.0, delta / 86400)  # decay per day
         self.confidence = max(0.0, round(self.confidence * (1 - decay_factor), 4))
         self.activation = max(0.0, round(self.activation * (1 - decay_factor * 1.25), 4))
 
+    # === Histories (allocated on first write) ===
     def mutate_belief(self, new_text: str, reason: str):
-        self.mutation_history.append({
-            "mutation": new_text,
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        if self._mutations is None:
+            self._mutations = []
+        self._mutations.append((new_text, reason, _now_ms()))
 
     def add_emotion(self, emotion: str):
-        self.emotion_history.append((emotion, datetime.utcnow().isoformat()))
+        if self._emotion_log is None:
+            self._emotion_log = []
+        self._emotion_log.append((EMOTION_TABLE.code(emotion), _now_ms()))
 
     def add_fork(self, label: str, fork_id: str = None):
-        self.fork_lineage.append({
-            "label": label,
-            "fork_id": fork_id or str(uuid.uuid4())[:8],
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        if self._forks is None:
+            self._forks = []
+        self._forks.append((label, fork_id or str(uuid.uuid4())[:8], _now_ms()))
 
     def relate_to(self, other_belief_id: str, relation: str):
-        self.relations.append((other_belief_id, relation))
+        if self._relations is None:
+            self._relations = []
+        self._relations.append((other_belief_id, sys.intern(relation)))
 
     def flag_contradiction(self, belief_id: str):
-        self.contradiction_flags.append({
-            "belief_id": belief_id,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        if self._contradictions is None:
+            self._contradictions = []
+        self._contradictions.append((belief_id, _now_ms()))
 
     def _infer_tags(self):
         tags = []
@@ -80,6 +206,10 @@ class SoulgraphBelief:
         if "future" in text or "predict" in text: tags.append("forecast")
         return tags or ["general"]
 
+    def has_tag(self, tag: str) -> bool:
+        code = TAG_TABLE.lookup(tag)
+        return code is not None and code in self._tags
+
     def to_payload(self):
         return {
             "id": self.id,
@@ -103,38 +233,105 @@ class SoulgraphBelief:
 # ============================================================
 
 class TexSoulgraph:
-    def __init__(self):
+    """
+    Imprints are deferred: imprint_belief() attaches the node to the BeliefMatrix as a pending
+    row (so graph lookups and scalar writes hit the shared columns at once) and queues it; a
+    worker thread embeds, reasons over and persists queued beliefs in batches, filling in each
+    row's vector when it is ready. flush() blocks until everything queued so far is durable.
+
+    Similarity lookups (fuse_similar_beliefs, detect_contradictions) only see beliefs whose
+    vector has landed — call flush() first when a just-imprinted belief must be matched.
+    """
+
+    def __init__(self, deferred: bool = IMPRINT_DEFERRED):
         self.graph = {}
+        self.store = BeliefMatrix()
         self.symbolic_engine = NeuroSymbolicReasoner()
+        self.deferred = deferred
+        self._imprints = Queue(maxsize=IMPRINT_QUEUE_MAX)
+        self._imprint_worker = None
+        self._worker_lock = threading.Lock()
+        self._settled = threading.Condition()
+        self._queued = 0
+        self._done = 0
+        if deferred:
+            atexit.register(self.flush, IMPRINT_EXIT_FLUSH)
 
     def imprint_belief(self, belief: str, source: str, emotion: str = "neutral", origin_beliefs=None, tags=None):
-        node = SoulgraphBelief(belief, source, emotion, origin_beliefs)
-
-        symbolic_output = self.symbolic_engine.reason(
-            symbolic_query=belief,
-            vector_context=node.vector
-        )
-
-        if symbolic_output.get("symbolic_results") is not None:
-            if not symbolic_output["symbolic_results"]:
-                node.confidence = max(0.1, node.confidence - 0.3)
-                node.drift_score = min(1.0, node.drift_score + 0.1)
-                print(f"[NSR] ⚠️ Symbolic reasoning flagged belief '{belief}' as unsupported or logically empty.")
-
+        """Returns the node immediately; its vector and persistence follow on the imprint worker."""
+        node = SoulgraphBelief(belief, source, emotion, origin_beliefs, embed=False)
+        node.attach(self.store)
         self.graph[node.id] = node
+        # Pulse values are read now so the stored metadata reflects imprint time, not flush time
+        item = (node, emotion, tags, TEXPULSE.get("urgency", 0.6), TEXPULSE.get("entropy", 0.4))
+        with self._settled:
+            self._queued += 1
+        if self.deferred:
+            self._imprints.put(item)
+            self._ensure_worker()
+        else:
+            self._process_imprints([item])
+        return node
 
+    # === Imprint Worker ===
+    def _ensure_worker(self):
+        if self._imprint_worker is not None and self._imprint_worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._imprint_worker is None or not self._imprint_worker.is_alive():
+                self._imprint_worker = threading.Thread(target=self._run_imprints, name="soulgraph-imprint", daemon=True)
+                self._imprint_worker.start()
+
+    def _collect_imprints(self) -> list:
+        batch = [self._imprints.get()]
+        while len(batch) < IMPRINT_BATCH_SIZE:
+            try:
+                batch.append(self._imprints.get(timeout=IMPRINT_BATCH_WAIT))
+            except Empty:
+                break
+        return batch
+
+    def _run_imprints(self):
+        while True:
+            self._process_imprints(self._collect_imprints())
+
+    def _process_imprints(self, batch: list):
         try:
-            sovereign_memory.store(
-                text=belief,
-                metadata={
-                    "summary": belief[:200],
+            nodes = [item[0] for item in batch]
+            try:
+                vectors = sovereign_memory.embed_many([n.belief for n in nodes])
+            except Exception as e:
+                print(f"[SOULGRAPH ERROR] ❌ Batch embedding failed: {e}")
+                vectors = [None] * len(nodes)
+
+            texts, metadatas = [], []
+            for (node, emotion, tags, urgency, entropy), vector in zip(batch, vectors):
+                if vector is not None:
+                    self.store.set_vector(node._row, vector)
+                try:
+                    symbolic_output = self.symbolic_engine.reason(
+                        symbolic_query=node.belief,
+                        vector_context=vector
+                    )
+                    if symbolic_output.get("symbolic_results") is not None:
+                        if not symbolic_output["symbolic_results"]:
+                            with self.store._lock:
+                                node.confidence = max(0.1, node.confidence - 0.3)
+                                node.drift_score = min(1.0, node.drift_score + 0.1)
+                            print(f"[NSR] ⚠️ Symbolic reasoning flagged belief '{node.belief}' as unsupported or logically empty.")
+                except Exception as e:
+                    print(f"[NSR ERROR] {e}")
+
+                texts.append(node.belief)
+                metadatas.append({
+                    "summary": node.belief[:200],
                     "timestamp": node.timestamp,
-                    "urgency": TEXPULSE.get("urgency", 0.6),
-                    "entropy": TEXPULSE.get("entropy", 0.4),
+                    "urgency": urgency,
+                    "entropy": entropy,
                     "emotion": emotion,
                     "tags": tags or node.semantic_tags,
                     "belief_id": node.id,
-                    "source": source,
+                    "source": node.source,
                     "meta_layer": "soulgraph",
                     "origin_beliefs": node.origin_beliefs,
                     "trust_score": node.confidence,
@@ -142,12 +339,29 @@ class TexSoulgraph:
                     "tension": 0.1,
                     "fork_lineage": node.fork_lineage,
                     "relations": node.relations
-                }
-            )
-        except Exception as e:
-            print(f"[SOULGRAPH ERROR] ❌ Failed to store belief: {e}")
-
-        return node
+                })
+
+            try:
+                sovereign_memory.store_many(texts, metadatas)
+            except Exception as e:
+                print(f"[SOULGRAPH ERROR] ❌ Failed to store {len(texts)} belief(s): {e}")
+        finally:
+            with self._settled:
+                self._done += len(batch)
+                self._settled.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Block until every belief imprinted before this call is embedded and persisted."""
+        with self._settled:
+            target = self._queued
+            return self._settled.wait_for(lambda: self._done >= target, timeout=timeout)
+
+    async def aflush(self, timeout: float = None) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.flush, timeout)
+
+    def pending_imprints(self) -> int:
+        return self._queued - self._done
 
     def record_goal_decision(self, goal: dict, cycle_id: int, regret: float, integrity: float):
         belief_text = goal.get("goal", "undefined_goal")
@@ -164,8 +378,9 @@ class TexSoulgraph:
 
         if regret > 0.6 or integrity < 0.5:
             drift = round(min(1.0, regret + (1.0 - integrity)), 4)
-            node.drift_score = drift
-            node.confidence = max(0.0, round(node.confidence - drift, 4))
+            with self.store._lock:  # the imprint worker may be adjusting the same row
+                node.drift_score = drift
+                node.confidence = max(0.0, round(node.confidence - drift, 4))
 
             from core_agi_modules.vector_layer.heat_tracker import adjust_token_weights
             adjust_token_weights(
@@ -197,12 +412,10 @@ class TexSoulgraph:
             self.graph[belief_id].drift_score = round(min(drift_score, 1.0), 4)
 
     def decay_all(self, rate=0.015):
-        for node in self.graph.values():
-            node.decay(rate)
+        self.store.decay(rate)
 
     def apply_temporal_decay(self):
-        for node in self.graph.values():
-            node.apply_temporal_decay()
+        self.store.temporal_decay()
 
     def detects_conflict(self, text: str) -> bool:
         lowered = text.lower()
@@ -217,24 +430,27 @@ class TexSoulgraph:
         return "drift" in lowered or "loss of" in lowered or "deviation" in lowered
 
     def fuse_similar_beliefs(self, new_vector, threshold=0.93):
-        for node in self.graph.values():
-            sim = np.dot(new_vector, node.vector)
-            if sim >= threshold:
-                node.confidence = round(min(1.0, node.confidence + 0.1), 4)
-                node.activation = round(min(1.0, node.activation + 0.1), 4)
+        rows = self.store.search(new_vector, threshold)
+        if rows.size:
+            store = self.store
+            store.confidence[rows] = np.round(np.minimum(1.0, store.confidence[rows] + 0.1), 4)
+            store.activation[rows] = np.round(np.minimum(1.0, store.activation[rows] + 0.1), 4)
 
     def detect_contradictions(self, new_vector, threshold=0.91):
         contradictions = []
-        for belief_id, node in self.graph.items():
-            sim = np.dot(new_vector, node.vector)
-            if sim >= threshold and "not" in node.belief.lower() and "not" not in str(new_vector).lower():
+        if "not" in str(new_vector).lower():
+            return contradictions
+        for row in self.store.search(new_vector, threshold):
+            belief_id = self.store.ids[row]
+            node = self.graph[belief_id]
+            if "not" in node.belief.lower():
                 node.flag_contradiction("incoming_vector")
                 contradictions.append(belief_id)
         return contradictions
 
     def compress_fused_beliefs(self, tag="general", top_k=5):
         candidates = sorted(
-            [b for b in self.graph.values() if tag in b.semantic_tags],
+            [b for b in self.graph.values() if b.has_tag(tag)],
             key=lambda x: x.activation,
             reverse=True
         )[:top_k]
@@ -249,12 +465,30 @@ class TexSoulgraph:
             tags=["summary", tag]
         )
 
+    def iter_payloads(self):
+        """Yield one belief payload at a time; nothing is held beyond the current node."""
+        for node in list(self.graph.values()):
+            yield node.to_payload()
+
     def get_snapshot(self):
+        """Materialized snapshot; use iter_payloads() or write_snapshot() to stream large graphs."""
         return {
-            "beliefs": [b.to_payload() for b in self.graph.values()],
+            "beliefs": list(self.iter_payloads()),
             "timestamp": datetime.utcnow().isoformat()
         }
 
+    def write_snapshot(self, fp) -> int:
+        """Stream the graph to a text file object as JSON lines; returns beliefs written."""
+        count = 0
+        for payload in self.iter_payloads():
+            fp.write(json.dumps(payload) + "\n")
+            count += 1
+        return count
+
+    def max_drift(self) -> float:
+        n = len(self.store)
+        return float(self.store.drift[:n].max()) if n else 0.0
+
 # === Safe Lazy Singleton ===
 _TEX_SOULGRAPH = None
 
@@ -0,0 +1,147 @@
+# ============================================================
+# © 2025 Sovereign Cognition / VortexBlack LLC. All rights reserved.
+# File: swarm_layer/fork_process_runtime.py
+# Tier ΩΩΩΩΩ — Multi-Process Swarm Fork Runtime
+# Purpose: Run each swarm fork in its own worker process; ReflexPackets come back as MessagePack
+#          frames over pipes and are fed into one NervousSyncBus in the parent
+# ============================================================
+
+import os
+import time
+import threading
+import multiprocessing as mp
+from datetime import datetime
+from multiprocessing.connection import wait
+
+from core_schemas.reflex_packet import encode_packets, decode_packets
+
+# === Configuration ===
+FORK_START_METHOD = os.getenv("TEX_FORK_START_METHOD", "spawn")   # spawn keeps workers free of parent threads/locks
+FORK_INTERVAL = float(os.getenv("TEX_FORK_INTERVAL", "4.2"))
+COLLECT_TIMEOUT = 0.5
+
+
+class _PipeBus:
+    """Stands in for NervousSyncBus inside a worker: every packet leaves as one binary frame."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def receive_packet(self, packet):
+        self.conn.send_bytes(encode_packets([packet]))
+
+
+def _fork_worker(fork_id: str, interval: float, identity: str, conn, stop_event):
+    # Imported here so the parent never pays for it and the child imports nothing else
+    from swarm_layer.tex_fork_agent import TexForkAgent
+
+    bus = _PipeBus(conn)
+    agent = TexForkAgent(fork_id, bus=bus, interval=interval, identity=identity)
+    try:
+        while not stop_event.is_set():
+            # Sent here rather than via emit_reflex(), which swallows errors: a broken pipe means
+            # the parent is gone and the worker has to exit instead of retrying every interval
+            bus.receive_packet(agent.build_packet())
+            stop_event.wait(interval)
+    except (OSError, EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class ForkProcessRuntime:
+    """
+    One process per fork, one collector thread in the parent. The collector waits on every
+    worker pipe at once, decodes frames and hands packets to bus.receive_packet, so the
+    bus aggregates the whole swarm exactly as it does for in-process forks.
+    """
+
+    def __init__(self, bus, forks: list = None, interval: float = FORK_INTERVAL,
+                 identity: str = None, start_method: str = FORK_START_METHOD):
+        if forks is None:
+            from swarm_layer.swarm_registry import get_active_forks
+            forks = [f["id"] for f in get_active_forks()]
+        if identity is None:
+            from core_layer.tex_manifest import TEXPULSE
+            identity = TEXPULSE.get("identity", "TEX")
+        self.bus = bus
+        self.fork_ids = list(forks)
+        self.interval = interval
+        self.identity = identity
+        self.ctx = mp.get_context(start_method)
+        self.stop_event = self.ctx.Event()
+        self.workers = {}                  # fork_id -> Process
+        self.readers = {}                  # receiving Connection -> fork_id
+        self.packets = 0
+        self.bytes = 0
+        self._collector = None
+
+    def start(self):
+        for fork_id in self.fork_ids:
+            self._spawn(fork_id)
+        self._collector = threading.Thread(target=self._collect, name="fork-collector", daemon=True)
+        self._collector.start()
+        print(f"[{datetime.utcnow()}] 🧬 ForkProcessRuntime started {len(self.workers)} fork processes "
+              f"({self.ctx.get_start_method()})")
+        return self
+
+    def _spawn(self, fork_id: str):
+        reader, writer = self.ctx.Pipe(duplex=False)
+        proc = self.ctx.Process(
+            target=_fork_worker,
+            args=(fork_id, self.interval, self.identity, writer, self.stop_event),
+            name=f"tex-fork-{fork_id}",
+            daemon=True
+        )
+        proc.start()
+        writer.close()  # the child holds the only write end, so its exit shows up as EOF here
+        self.workers[fork_id] = proc
+        self.readers[reader] = fork_id
+
+    def _collect(self):
+        while self.readers:
+            for conn in wait(list(self.readers), timeout=COLLECT_TIMEOUT):
+                try:
+                    frame = conn.recv_bytes()
+                except (EOFError, OSError):
+                    fork_id = self.readers.pop(conn, "?")
+                    conn.close()
+                    if not self.stop_event.is_set():
+                        print(f"⚠️ [FORK RUNTIME] Fork {fork_id} exited unexpectedly.")
+                    continue
+                self.bytes += len(frame)
+                for packet in decode_packets(frame):
+                    self.packets += 1
+                    try:
+                        self.bus.receive_packet(packet)
+                    except Exception as e:
+                        print(f"[FORK RUNTIME ERROR] receive_packet failed for {packet.fork_id}: {e}")
+
+    def stop(self, timeout: float = 5.0):
+        self.stop_event.set()
+        deadline = time.monotonic() + timeout
+        for proc in self.workers.values():
+            proc.join(max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                proc.terminate()
+        if self._collector is not None:
+            self._collector.join(timeout=COLLECT_TIMEOUT * 2)
+        print(f"[{datetime.utcnow()}] 🛑 ForkProcessRuntime stopped — {self.packets} packets, {self.bytes} bytes")
+
+    def stats(self) -> dict:
+        return {
+            "forks": {fid: proc.is_alive() for fid, proc in self.workers.items()},
+            "packets": self.packets,
+            "bytes": self.bytes,
+        }
+
+
+# === Launcher
+def launch_fork_processes(bus, forks: list = None, interval: float = FORK_INTERVAL) -> ForkProcessRuntime:
+    """
+    Start one worker per fork. Under the default spawn start method each worker re-imports the
+    parent's main module, so the calling script must keep its startup code under
+    `if __name__ == "__main__":` — otherwise the worker re-runs it and multiprocessing aborts.
+    Enabled from the swarm startup path with TEX_FORK_PROCESSES=1 (see launch_nervous_sync_daemon).
+    """
+    return ForkProcessRuntime(bus, forks=forks, interval=interval).start()
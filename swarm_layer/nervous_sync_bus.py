@@ -6,7 +6,7 @@
 # ============================================================
 
 from threading import Lock
-import time, uuid, threading
+import os, time, uuid, threading
 from datetime import datetime
 from queue import Queue, Empty
 from collections import defaultdict, deque
@@ -20,11 +20,19 @@ from swarm_layer.reflex_mirror_bridge import mirror_reflex_if_consensus
 from aei_layer.aei_lineage_evolver import AEILineageEvolver
 from sovereign_evolution.texX_soulgraph import TEX_SOULGRAPH
 from agi_orchestrators.goal_orchestrator import GoalOrchestrator
+from tex_signal_metrics import LatencySeries
 
 # === Constants
 DRIFT_THRESHOLD = 12.0
 ENTROPY_MAX = 25.0
 SIGNATURE_UPDATE_INTERVAL = 3.0
+FORK_BUFFER_MAX = int(os.getenv("TEX_NERVEBUS_FORK_BUFFER", "256"))      # pending goals / memories kept per fork
+GOAL_SEEN_MAX = int(os.getenv("TEX_NERVEBUS_GOAL_SEEN", "4096"))         # goal ids remembered for cross-tick dedup
+URGENT_ENTROPY = float(os.getenv("TEX_NERVEBUS_URGENT_ENTROPY", "0.85"))  # reflex entropy that wakes the bus at once
+URGENT_URGENCY = float(os.getenv("TEX_NERVEBUS_URGENT_URGENCY", "0.85"))  # reflex urgency that wakes the bus at once
+COALESCE_WINDOW = float(os.getenv("TEX_NERVEBUS_COALESCE_MS", "25")) / 1000.0  # burst gathering after an urgent wake
+MIN_TICK_GAP = float(os.getenv("TEX_NERVEBUS_MIN_GAP_MS", "100")) / 1000.0     # floor between ticks under urgent storms
+FORK_PROCESSES = os.getenv("TEX_FORK_PROCESSES", "0") == "1"                   # run swarm forks as worker processes
 
 # === Reflex Fusion Strategy
 def fuse_reflex_cluster(reflexes):
@@ -32,6 +40,17 @@ def fuse_reflex_cluster(reflexes):
         return {}
     return max(reflexes, key=lambda r: r.get("entropy", 0))
 
+def is_urgent_reflex(reflex) -> bool:
+    if not isinstance(reflex, dict):
+        return False
+    payload = reflex.get("payload") if isinstance(reflex.get("payload"), dict) else {}
+    try:
+        entropy = float(reflex.get("entropy", 0) or 0)
+        urgency = float(reflex.get("urgency", payload.get("urgency", 0)) or 0)
+    except (TypeError, ValueError):
+        return False
+    return entropy >= URGENT_ENTROPY or urgency >= URGENT_URGENCY
+
 # === NervousSyncBus Core
 class NervousSyncBus:
     def __init__(self, sync_interval=4.2):
@@ -40,16 +59,29 @@ class NervousSyncBus:
         self.sync_interval = sync_interval
         self.signal_queue = Queue()
         self.entropy_trace = deque(maxlen=100)
+        # 'goals' / 'memory' hold only what arrived since the last tick; propagate_sync drains them
         self.shared_state = defaultdict(lambda: {
             'reflex': None,
-            'goals': [],
-            'memory': [],
-            'last_seen': None
+            'goals': deque(maxlen=FORK_BUFFER_MAX),
+            'memory': deque(maxlen=FORK_BUFFER_MAX),
+            'last_seen': None,
+            'epoch': 0
         })
+        self.epoch = 0                                  # bumped once per propagate_sync tick
+        self.dropped = 0                                # goals/memories lost to a full fork buffer
+        self._seen_goals = set()
+        self._seen_order = deque()
+        self._orchestrator = None
+        self._wake = threading.Event()                  # set by urgent packets; the timer covers the rest
+        self._last_tick = 0.0
+        self._receipts = []                             # (monotonic receipt time, urgent) per drained packet
+        self.fusion_latency = {"urgent": LatencySeries(), "routine": LatencySeries()}
+        self.ticks = {"urgent": 0, "timer": 0}
         self.active = False
         self.lock = threading.Lock()
         self._last_swarm_update = 0
         self._signature_lock = Lock()
+        self.fork_runtime = None                        # ForkProcessRuntime when forks run out of process
 
     def register_forks(self):
         try:
@@ -87,53 +119,90 @@ class NervousSyncBus:
                 }
             )
 
-        self.signal_queue.put(packet)
+        urgent = is_urgent_reflex(packet.reflex)
+        self.signal_queue.put((time.monotonic(), urgent, packet))
+        if urgent:
+            self._wake.set()
 
     def ingest_signals(self):
         while True:
             try:
-                packet = self.signal_queue.get_nowait()
+                received, urgent, packet = self.signal_queue.get_nowait()
                 with self.lock:
+                    self._receipts.append((received, urgent))
                     fid = packet.fork_id
-                    self.shared_state[fid]['reflex'] = packet.reflex
-                    self.shared_state[fid]['goals'].extend([
+                    state = self.shared_state[fid]
+                    state['reflex'] = packet.reflex
+                    self._buffer(state['goals'], [
                         {**g, "origin": fid, "trace_id": packet.trace_id} for g in packet.goal_deltas
                     ])
-                    self.shared_state[fid]['memory'].extend(packet.memory_updates)
-                    self.shared_state[fid]['last_seen'] = packet.timestamp
+                    self._buffer(state['memory'], packet.memory_updates)
+                    state['last_seen'] = packet.timestamp
+                    state['epoch'] = self.epoch + 1     # fresh for the upcoming tick
             except Empty:
                 break
 
+    def _buffer(self, buffer: deque, items):
+        overflow = len(buffer) + len(items) - buffer.maxlen
+        if overflow > 0:
+            self.dropped += overflow  # oldest pending entries fall off the front
+        buffer.extend(items)
+
+    def _drain(self):
+        """Swap out everything that arrived since the last tick. Caller holds self.lock."""
+        self.epoch += 1
+        fresh_reflexes, goals, memory = [], [], []
+        for data in self.shared_state.values():
+            if data['epoch'] == self.epoch and data['reflex']:
+                fresh_reflexes.append(data['reflex'])
+            goals.extend(data['goals'])
+            memory.extend(data['memory'])
+            data['goals'].clear()
+            data['memory'].clear()
+        return fresh_reflexes, goals, memory
+
     def deduplicate_goals(self, goals):
-        seen = set()
+        """Drop goals already routed this tick or in a recent one (bounded id memory)."""
         result = []
         for g in goals:
             gid = g.get('id') or g.get('trace_id') or str(g)
-            if gid not in seen:
-                seen.add(gid)
+            if gid not in self._seen_goals:
+                self._seen_goals.add(gid)
+                self._seen_order.append(gid)
                 result.append(g)
+        while len(self._seen_order) > GOAL_SEEN_MAX:
+            self._seen_goals.discard(self._seen_order.popleft())
         return result
 
+    @property
+    def orchestrator(self):
+        if self._orchestrator is None:
+            self._orchestrator = GoalOrchestrator()
+        return self._orchestrator
+
     def detect_swarm_drift(self):
         now = time.time()
         return [fid for fid, data in self.shared_state.items()
                 if data['last_seen'] and now - data['last_seen'] > DRIFT_THRESHOLD]
 
     def propagate_sync(self):
-        reflexes, all_goals, all_memory = [], [], []
+        """
+        One tick over the delta since the previous tick: reflexes from forks that reported,
+        and the goals / memory fragments they queued. Swarm entropy still sums every fork's
+        latest reflex, which costs one pass over the (bounded) fork table.
+        """
         entropy_total = 0
         emotional_charge = 0
+        intent = None
 
         with self.lock:
+            reflexes, all_goals, all_memory = self._drain()
             for data in self.shared_state.values():
                 reflex = data['reflex']
                 if reflex:
-                    reflexes.append(reflex)
                     entropy_total += reflex.get('entropy', 0)
                     if reflex.get('type') == "EMOTION_PULSE":
                         emotional_charge += reflex.get('payload', {}).get('intensity', 0)
-                all_goals.extend(data['goals'])
-                all_memory.extend(data['memory'])
             self.entropy_trace.append(entropy_total)
 
         # === Reflex Fusion
@@ -165,11 +234,15 @@ class NervousSyncBus:
             intent = IntentObject("reflex_fusion", source="nervous_sync_bus")
             intent.log_trace("nervous_sync_bus", f"Fused reflex from {len(reflexes)} forks")
 
-        # === Log Reflex Memories
-        for m in all_memory:
-            sovereign_memory.store(
-                text=m.get("content", "undefined memory fragment"),
-                metadata={
+        # === Fusion Latency (receipt → fused, per packet)
+        self._record_fusion_latency()
+
+        # === Log Reflex Memories (one bulk write for the tick)
+        if all_memory:
+            now_iso = datetime.utcnow().isoformat()
+            sovereign_memory.store_many(
+                [str(m.get("content", "undefined memory fragment")) for m in all_memory],
+                [{
                     "type": "reflex_memory_fragment",
                     "tags": m.get("tags", ["reflex", "memory"]),
                     "emotion": m.get("emotion", "neutral"),
@@ -177,29 +250,26 @@ class NervousSyncBus:
                     "actual": m.get("actual", "memory fragment logged"),
                     "trust_score": m.get("trust_score", 0.8),
                     "heat": m.get("heat", 0.4),
-                    "timestamp": m.get("timestamp", datetime.utcnow().isoformat()),
-                    "intent_id": intent.id
-                }
+                    "timestamp": m.get("timestamp", now_iso),
+                    "intent_id": intent.id if intent else None
+                } for m in all_memory]
             )
 
         # === Broadcast Deduplicated Goals
         deduped_goals = self.deduplicate_goals(all_goals)
-        # ✅ USE GoalOrchestrator for routing goals
-        if deduped_goals:
-            orchestrator = GoalOrchestrator()
-            for goal in deduped_goals:
-                orchestrator.run_goal_trace(goal)
+        # ✅ USE GoalOrchestrator for routing goals (one shared instance)
+        for goal in deduped_goals:
+            self.orchestrator.run_goal_trace(goal)
 
-
-
-
-        # === Inject Evolution Feedback
-        inject_mutation_feedback(
-            entropy_level=entropy_total,
-            reflex_fingerprints=[r.get("type") for r in reflexes],
-            fork_count=len(self.shared_state),
-            emotion_charge=emotional_charge
-        )
+        # === Inject Evolution Feedback (only when forks actually reported)
+        if reflexes:
+            from evolution_layer.sovereign_evolution_arena import inject_mutation_feedback
+            inject_mutation_feedback(
+                entropy_level=entropy_total,
+                reflex_fingerprints=[r.get("type") for r in reflexes],
+                fork_count=len(self.shared_state),
+                emotion_charge=emotional_charge
+            )
 
         # === Swarm Signature Update
         now = time.time()
@@ -230,21 +300,54 @@ class NervousSyncBus:
                     }
                 )
 
+    def _record_fusion_latency(self):
+        with self.lock:
+            receipts, self._receipts = self._receipts, []
+        now = time.monotonic()
+        for received, urgent in receipts:
+            self.fusion_latency["urgent" if urgent else "routine"].observe(now - received, now)
+
+    def fusion_metrics(self) -> dict:
+        """Receipt-to-fusion latency split by urgent/routine packets, plus tick counts by wake reason."""
+        now = time.monotonic()
+        return {
+            "latency": {kind: series.snapshot(now) for kind, series in self.fusion_latency.items()},
+            "ticks": dict(self.ticks),
+            "dropped": self.dropped,
+            "sync_interval_sec": self.sync_interval,
+            "coalesce_ms": COALESCE_WINDOW * 1000,
+            "min_gap_ms": MIN_TICK_GAP * 1000,
+        }
+
     def sync_loop(self):
         self.register_forks()
         self.active = True
-        print(f"[{datetime.utcnow()}] NervousSyncBus [{self.id}] online — interval: {self.sync_interval}s")
+        print(f"[{datetime.utcnow()}] NervousSyncBus [{self.id}] online — interval: {self.sync_interval}s "
+              f"(urgent wake, {COALESCE_WINDOW * 1000:.0f}ms coalesce)")
         while self.active:
             try:
+                # Timer tick unless an urgent packet wakes us first
+                urgent = self._wake.wait(timeout=self.sync_interval)
+                if not self.active:
+                    break
+                if urgent:
+                    # Let the rest of a burst land in this tick, and don't tick faster than MIN_TICK_GAP
+                    time.sleep(max(COALESCE_WINDOW, MIN_TICK_GAP - (time.monotonic() - self._last_tick)))
+                self._wake.clear()
+                self.ticks["urgent" if urgent else "timer"] += 1
                 self.ingest_signals()
                 self.propagate_sync()
-                time.sleep(self.sync_interval)
+                self._last_tick = time.monotonic()
             except Exception as e:
                 print(f"[NERVEBUS ERROR] {e}")
                 time.sleep(2)
 
     def shutdown(self):
         self.active = False
+        self._wake.set()
+        if self.fork_runtime is not None:
+            self.fork_runtime.stop()
+            self.fork_runtime = None
         with self.signal_queue.mutex:
             self.signal_queue.queue.clear()
         print(f"[{datetime.utcnow()}] NervousSyncBus [{self.id}] shutdown.")
@@ -263,10 +366,27 @@ class NervousSyncBus:
             self._signature_lock.release()
 
 # === Sovereign Reflex Launcher
-def launch_nervous_sync_daemon(sync_interval=4.2):
+def launch_nervous_sync_daemon(sync_interval=4.2, fork_processes: bool = FORK_PROCESSES):
+    """
+    Start the bus loop; with fork_processes (TEX_FORK_PROCESSES=1) every active fork also runs in
+    its own worker process feeding this bus. Worker processes use the spawn start method, which
+    re-imports the launching script: the entry point that (directly or through an import such as
+    breathing_loop) reaches this call must sit under `if __name__ == "__main__":`.
+    Returns None inside a worker process, where only the parent's bus may run.
+    """
+    import multiprocessing as mp
+    if mp.parent_process() is not None:
+        # Re-imported inside a spawned worker: a second bus here would duplicate every memory
+        # write and soulgraph imprint, so nothing is built or started
+        print("⚠️ [NERVEBUS] Not launched inside a worker process — guard the entry point "
+              "with `if __name__ == \"__main__\":`")
+        return None
     bus = NervousSyncBus(sync_interval=sync_interval)
     from swarm_layer.swarm_homeostasis import bind_nervous_bus
     bind_nervous_bus(bus)
     thread = threading.Thread(target=bus.sync_loop, daemon=True)
     thread.start()
-    return bus
\ No newline at end of file
+    if fork_processes:
+        from swarm_layer.fork_process_runtime import launch_fork_processes
+        bus.fork_runtime = launch_fork_processes(bus, interval=sync_interval)
+    return bus
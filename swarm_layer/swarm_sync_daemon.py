@@ -11,6 +11,7 @@ import hashlib
 from datetime import datetime
 from difflib import SequenceMatcher
 from core_layer.memory_engine import store_to_memory
+from memory_archive.log_store import read_jsonl
 from sovereign_evolution.sovereign_cognition_fire import trigger_sovereign_override
 
 SWARM_FEED      = "memory_archive/swarm_feed.jsonl"
@@ -28,21 +29,17 @@ class SwarmSyncDaemon:
         if not os.path.exists(CHILD_SPAWN_LOG):
             return []
         valid_agents = []
-        with open(CHILD_SPAWN_LOG, "r") as f:
-            for idx, line in enumerate(f):
-                try:
-                    agent = json.loads(line.strip())
-                    if isinstance(agent, dict):
-                        valid_agents.append(agent)
-                    else:
-                        store_to_memory("swarm_sync_errors", {
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "index": idx,
-                            "bad_type": str(type(agent)),
-                            "raw_value": str(agent)[:300],
-                        })
-                except Exception as e:
-                    print(f"[SWARM SYNC WARNING] Malformed JSON at line {idx}: {e}")
+        # Log store only parses lines appended since the last cycle (malformed lines are skipped there)
+        for idx, agent in enumerate(read_jsonl(CHILD_SPAWN_LOG)):
+            if isinstance(agent, dict):
+                valid_agents.append(agent)
+            else:
+                store_to_memory("swarm_sync_errors", {
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "index": idx,
+                    "bad_type": str(type(agent)),
+                    "raw_value": str(agent)[:300],
+                })
         return valid_agents
 
     def _generate_swarm_snapshot(self, agents):
@@ -9,19 +9,24 @@ import threading
 import time
 import random
 from datetime import datetime
+from typing import TYPE_CHECKING
 from core_schemas.reflex_packet import ReflexPacket
-from swarm_layer.nervous_sync_bus import NervousSyncBus
-from core_layer.tex_manifest import TEXPULSE
+
+if TYPE_CHECKING:  # the bus is only needed for typing; fork worker processes never import it
+    from swarm_layer.nervous_sync_bus import NervousSyncBus
 
 class TexForkAgent(threading.Thread):
-    def __init__(self, fork_id: str, bus: NervousSyncBus, interval: float = 4.2):
+    def __init__(self, fork_id: str, bus: "NervousSyncBus", interval: float = 4.2, identity: str = None):
         super().__init__()
         self.fork_id = fork_id
-        self.bus = bus
+        self.bus = bus                               # anything with receive_packet(packet)
         self.interval = interval
         self.running = True
         self.volatility = random.uniform(0.02, 0.1)  # unique signal fingerprint
-        self.identity = TEXPULSE.get("identity", "TEX")
+        if identity is None:
+            from core_layer.tex_manifest import TEXPULSE
+            identity = TEXPULSE.get("identity", "TEX")
+        self.identity = identity
         print(f"✅ [INIT] Fork {self.fork_id} initialized with volatility={self.volatility:.4f}")
 
     def generate_entropy(self) -> float:
@@ -30,35 +35,36 @@ class TexForkAgent(threading.Thread):
         entropy = max(0.0, min(1.0, round(base + mod, 4)))
         return entropy
 
-    def emit_reflex(self):
+    def build_packet(self) -> ReflexPacket:
         entropy = self.generate_entropy()
-        print(f"🌀 [{self.fork_id}] Emitting reflex — entropy={entropy}")
+        return ReflexPacket(
+            fork_id=self.fork_id,
+            timestamp=time.time(),
+            reflex={
+                "type": "EMOTION_PULSE",
+                "entropy": entropy,
+                "payload": {
+                    "intensity": entropy,
+                    "identity": self.identity,
+                    "variant": self.fork_id,
+                    "volatility": round(self.volatility, 4)
+                }
+            },
+            goal_deltas=[],
+            memory_updates=[{
+                "content": f"Reflex fired by {self.fork_id} | Entropy={entropy}",
+                "emotion": "alert",
+                "tags": ["reflex", self.fork_id, "entropy_sync"],
+                "trust_score": round(1.0 - abs(0.5 - entropy), 2),
+                "heat": entropy,
+                "timestamp": datetime.utcnow().isoformat()
+            }]
+        )
 
+    def emit_reflex(self):
         try:
-            packet = ReflexPacket(
-                fork_id=self.fork_id,
-                timestamp=time.time(),
-                reflex={
-                    "type": "EMOTION_PULSE",
-                    "entropy": entropy,
-                    "payload": {
-                        "intensity": entropy,
-                        "identity": self.identity,
-                        "variant": self.fork_id,
-                        "volatility": round(self.volatility, 4)
-                    }
-                },
-                goal_deltas=[],
-                memory_updates=[{
-                    "content": f"Reflex fired by {self.fork_id} | Entropy={entropy}",
-                    "emotion": "alert",
-                    "tags": ["reflex", self.fork_id, "entropy_sync"],
-                    "trust_score": round(1.0 - abs(0.5 - entropy), 2),
-                    "heat": entropy,
-                    "timestamp": datetime.utcnow().isoformat()
-                }]
-            )
-
+            packet = self.build_packet()
+            print(f"🌀 [{self.fork_id}] Emitting reflex — entropy={packet.reflex['entropy']}")
             self.bus.receive_packet(packet)
 
         except Exception as e:
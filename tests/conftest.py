@@ -0,0 +1,27 @@
+# tests/conftest.py
+# Run from the repo root: python -m pytest -q tests
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import importlib
+import types
+
+
+def import_isolated(monkeypatch, name: str, stand_ins: dict):
+    """
+    Import `name` fresh with some of its collaborator modules replaced by stand-ins
+    ({module: {attr: value}}), for units whose own logic does not touch those collaborators
+    but whose import chain reaches optional heavy packages. Undone at test teardown.
+    """
+    for module_name, attrs in stand_ins.items():
+        module = types.ModuleType(module_name)
+        module.__dict__.update(attrs)
+        monkeypatch.setitem(sys.modules, module_name, module)
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    module = importlib.import_module(name)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
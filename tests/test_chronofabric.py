@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import quantum_layer.chronofabric as chrono
+
+
+class FakeRouter:
+    def __init__(self):
+        self.stored = []
+
+    def embed_text(self, text):
+        return [0.0] * 8
+
+    def embed_many(self, texts):
+        return [[0.0] * 8 for _ in texts]
+
+    def store(self, text, metadata, vector=None):
+        self.stored.append((text, metadata.get("statevector")))
+
+
+@pytest.fixture
+def fabric(monkeypatch):
+    router = FakeRouter()
+    monkeypatch.setattr(chrono, "memory_router", router)
+    monkeypatch.setattr(chrono, "CHRONO_CIRCUIT", "numpy")
+    tensor = chrono.tex_identity_field["tensor"].copy()
+    yield router
+    chrono.tex_identity_field["tensor"] = tensor
+
+
+EVENTS = [
+    (f"event {i}", [0.2 + 0.1 * i, 0.9 - 0.15 * i, 0.5, 0.1 * (i % 2)], 0.3 + 0.1 * i, ["test"])
+    for i in range(5)
+]
+
+
+def _nodes(ids):
+    return [chrono.chrono_mesh.nodes[i] for i in ids]
+
+
+def test_batched_encode_matches_single_event_path(fabric):
+    start_tensor = chrono.tex_identity_field["tensor"].copy()
+    np.random.seed(3)
+    single = [chrono.encode_event_to_fabric(*event) for event in EVENTS]
+    single_tensor = chrono.tex_identity_field["tensor"].copy()
+
+    chrono.tex_identity_field["tensor"] = start_tensor
+    np.random.seed(3)
+    batched = chrono.encode_events_to_fabric(EVENTS)
+
+    for a, b in zip(_nodes(single), _nodes(batched)):
+        assert np.allclose(a["statevector"], b["statevector"])
+        assert a["resistance"] == pytest.approx(b["resistance"])
+    assert np.allclose(chrono.tex_identity_field["tensor"], single_tensor)
+    assert [t for t, _ in fabric.stored] == [e[0] for e in EVENTS] * 2
+
+    # Resonance links among the batch mirror the ones the single path built
+    index = {old: new for old, new in zip(single, batched)}
+    single_edges = {frozenset((index[a], index[b])) for a, b in chrono.chrono_mesh.edges(single) if a in index and b in index}
+    batched_edges = {frozenset(e) for e in chrono.chrono_mesh.edges(batched) if set(e) <= set(batched)}
+    assert single_edges == batched_edges
+
+
+def test_store_many_encodes_chrono_in_one_batch(fabric, monkeypatch):
+    from agentic_ai.sovereign_memory import SovereignMemory
+
+    memory = SovereignMemory()
+    memory.vector = FakeRouter()
+    batches = []
+    monkeypatch.setattr(chrono, "encode_event_to_fabric", lambda *a, **k: pytest.fail("per-record chrono sync"))
+    monkeypatch.setattr(chrono, "encode_events_to_fabric", lambda events: batches.append(events) or [])
+
+    memory.store_many(["a", "b"], [{"urgency": 0.9, "entropy": 0.2, "tags": ["x"]}, {}])
+    assert len(batches) == 1
+    assert batches[0][0] == ("a", [0.9, 0.2, 0.5, 0.0], 0.2, ["x"])
+    assert batches[0][1] == ("b", [0.5, 0.4, 0.5, 0.0], 0.4, ["sovereign_memory"])
+
+
+def test_closed_form_matches_the_pennylane_circuit():
+    pytest.importorskip("pennylane")
+    circuit = chrono._pennylane_chronocyte()
+    rng = np.random.default_rng(3)
+    params = rng.uniform(-2 * np.pi, 2 * np.pi, (32, 2))
+    emotions = rng.uniform(-2 * np.pi, 2 * np.pi, (32, 4))
+    entropies = rng.uniform(-2 * np.pi, 2 * np.pi, 32)
+
+    states = chrono.chronocyte_states(params, emotions[:, 1], entropies)
+    for state, p, emotion, entropy in zip(states, params, emotions, entropies):
+        np.testing.assert_allclose(state, np.asarray(circuit(p, emotion, [entropy])), atol=1e-10)
+
+
+def test_pennylane_mode_skips_the_closed_form(monkeypatch):
+    reference = np.zeros(16, dtype=np.complex128)
+    reference[0] = 1.0
+
+    def closed_form(*args):
+        raise AssertionError("closed form evaluated in pennylane mode")
+
+    monkeypatch.setattr(chrono, "CHRONO_CIRCUIT", "pennylane")
+    monkeypatch.setattr(chrono, "chronocyte_states", closed_form)
+    monkeypatch.setattr(chrono, "_pennylane_chronocyte", lambda: lambda params, emotion, entropy: reference)
+    np.testing.assert_array_equal(chrono.chronocyte_tensor([0.1, 0.2], [0.0, 0.3, 0.0, 0.0], [0.4]), reference)
@@ -0,0 +1,109 @@
+# tests/test_cognitive_event_router.py
+import threading
+import time
+
+import pytest
+
+import tex_engine.cognitive_event_router as router
+from tex_engine.cognitive_event_router import CognitiveEvent, dispatch_event, register_module
+
+
+@pytest.fixture(autouse=True)
+def clean_router():
+    router.stop_router()
+    router.REGISTERED_MODULES.clear()
+    router._slots.clear()
+    router._rebuild_index()
+    router.COGNITIVE_EVENT_QUEUE = router.CognitiveEventQueue()
+    yield
+    router.stop_router()
+
+
+def _drain(timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        busy = any(s.running or s.backlog for s in router._slots.values())
+        if not router.COGNITIVE_EVENT_QUEUE.qsize() and not busy:
+            return
+        time.sleep(0.005)
+    raise AssertionError("router did not drain")
+
+
+def test_events_run_most_urgent_first():
+    seen = []
+    register_module("m", ["tick"], lambda e: seen.append(e.urgency))
+    for u in [0.1, 0.5, 0.9, 0.3]:
+        dispatch_event(CognitiveEvent("tick", {}, urgency=u))
+    router.start_router(workers=1)
+    _drain()
+    assert seen == [0.9, 0.5, 0.3, 0.1]
+
+
+def test_aging_lets_old_low_urgency_events_overtake():
+    q = router.CognitiveEventQueue(aging_per_sec=1.0)
+    old = CognitiveEvent("tick", {}, urgency=0.2)
+    new = CognitiveEvent("tick", {}, urgency=0.5)
+    q.put(old, "m", enqueued=100.0)   # waited 1 s longer: effective 0.2 + 1.0
+    q.put(new, "m", enqueued=101.0)
+    assert q.get()[0] is old
+
+
+def test_unindexed_event_is_routed_to_modules_registered_later():
+    seen = []
+    dispatch_event(CognitiveEvent("late", {}))
+    register_module("m", ["late"], lambda e: seen.append(e.event_type))
+    router.start_router(workers=1)
+    _drain()
+    assert seen == ["late"]
+
+
+def test_module_concurrency_limit_is_respected():
+    lock = threading.Lock()
+    state = {"cur": 0, "max": 0}
+
+    def handler(event):
+        with lock:
+            state["cur"] += 1
+            state["max"] = max(state["max"], state["cur"])
+        time.sleep(0.01)
+        with lock:
+            state["cur"] -= 1
+
+    register_module("limited", ["tick"], handler, max_concurrency=2)
+    for _ in range(20):
+        dispatch_event(CognitiveEvent("tick", {}))
+    router.start_router(workers=6)
+    _drain()
+    assert state["max"] == 2
+    assert router._slots["limited"].handled == 20
+
+
+def test_slow_module_backlog_does_not_hold_other_modules():
+    latencies = []
+
+    def slow(event):
+        time.sleep(0.05)
+
+    def fast(event):
+        latencies.append(time.monotonic() - event.payload["sent"])
+
+    register_module("a", ["x"], slow)
+    register_module("b", ["x", "y"], fast)
+    router.start_router(workers=4)
+    for _ in range(20):
+        dispatch_event(CognitiveEvent("x", {"sent": time.monotonic()}))
+    time.sleep(0.02)
+    for _ in range(5):
+        dispatch_event(CognitiveEvent("y", {"sent": time.monotonic()}))
+        time.sleep(0.01)
+    _drain()
+    # "a" needs ~1 s for its backlog; "b" must not wait behind it
+    assert max(latencies) < 0.25
+
+
+def test_handler_errors_are_counted_not_raised():
+    register_module("bad", ["tick"], lambda e: 1 / 0)
+    dispatch_event(CognitiveEvent("tick", {}))
+    router.start_router(workers=1)
+    _drain()
+    assert router._slots["bad"].errors == 1
@@ -0,0 +1,81 @@
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from core_agi_modules.contradiction_heatmap import CATEGORY_TAGS, DECAY_PER_HOUR, ContradictionHeatmapEngine
+
+
+def full_scan(path, now):
+    """The original whole-file rescan, kept as the reference the incremental engine must match."""
+    scores = {tag.lower(): 0.0 for tag in CATEGORY_TAGS}
+    total = 0.0
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                ts = datetime.fromisoformat(line.split("|")[0].strip())
+            except Exception:
+                ts = now  # unreadable timestamps weigh as brand new
+            weight = DECAY_PER_HOUR ** max((now - ts).total_seconds() / 3600.0, 0)
+            for tag in CATEGORY_TAGS:
+                if f"| {tag} |" in line:
+                    scores[tag.lower()] += weight
+                    total += weight
+    if total == 0:
+        return {}
+    return {k: round(min(v / total, 1.0), 4) for k, v in scores.items()}
+
+
+def _line(rng, now):
+    tag = rng.choice(CATEGORY_TAGS + ["NOISE"])
+    roll = rng.random()
+    if roll < 0.05:
+        stamp = "not-a-timestamp"
+    elif roll < 0.1:
+        stamp = (now + timedelta(hours=rng.uniform(0.1, 3))).isoformat()  # future-dated
+    else:
+        stamp = (now - timedelta(hours=rng.uniform(0, 72))).isoformat()
+    return f"{stamp} | {tag} | event\n"
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_incremental_heatmap_matches_full_scan(tmp_path, seed):
+    rng = random.Random(seed)
+    path = str(tmp_path / "soulgraph_log.txt")
+    engine = ContradictionHeatmapEngine(path, str(tmp_path / "state.json"))
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    open(path, "w").close()
+
+    for _ in range(6):
+        with open(path, "a") as f:
+            f.writelines(_line(rng, now) for _ in range(rng.randint(1, 40)))
+            if rng.random() < 0.3:
+                f.write(_line(rng, now).rstrip("\n"))  # torn tail still counts, as the rescan would see it
+        now += timedelta(minutes=rng.uniform(5, 120))
+        expected = full_scan(path, now)
+        actual = engine.heatmap(now)
+        assert actual.keys() == expected.keys()
+        for tag in expected:
+            assert actual[tag] == pytest.approx(expected[tag], abs=2e-4)
+        if os.path.getsize(path) and not open(path).read().endswith("\n"):
+            with open(path, "a") as f:
+                f.write("\n")
+
+
+def test_state_survives_restart_and_file_replacement(tmp_path):
+    path = str(tmp_path / "soulgraph_log.txt")
+    state = str(tmp_path / "state.json")
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    with open(path, "w") as f:
+        f.write(f"{(now - timedelta(hours=2)).isoformat()} | FORK | a\n")
+        f.write(f"{(now - timedelta(hours=1)).isoformat()} | BOOT | b\n")
+    first = ContradictionHeatmapEngine(path, state).heatmap(now)
+    assert first == full_scan(path, now)
+    assert ContradictionHeatmapEngine(path, state).heatmap(now) == first
+
+    replacement = path + ".new"
+    with open(replacement, "w") as f:
+        f.write(f"{now.isoformat()} | DEBATE | c\n")
+    os.replace(replacement, path)
+    assert ContradictionHeatmapEngine(path, state).heatmap(now) == full_scan(path, now)
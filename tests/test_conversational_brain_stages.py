@@ -0,0 +1,67 @@
+import ast
+import os
+import sys
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from conftest import ROOT, import_isolated
+from sovereign_evolution.texX_soulgraph import TexSoulgraph
+
+BRAIN = "core_agi_modules.tex_conversational_brain"
+# Imported for real: the stage graph itself and the tag helper the scan filters with
+KEEP = {"tex_engine.stage_pipeline", "agentic_ai.memory_backends"}
+
+
+def _collaborator_stand_ins() -> dict:
+    """A MagicMock for every name the brain imports at module level (sensors, voice, swarm, LLM...)."""
+    path = os.path.join(ROOT, *BRAIN.split(".")) + ".py"
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    stand_ins = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom) or node.module in KEEP:
+            continue
+        if node.module.split(".")[0] not in sys.stdlib_module_names:
+            attrs = stand_ins.setdefault(node.module, {})
+            for alias in node.names:
+                attrs[alias.asname or alias.name] = MagicMock(name=alias.name)
+    return stand_ins
+
+
+@pytest.fixture
+def brain(monkeypatch):
+    stand_ins = _collaborator_stand_ins()
+    soulgraph = create_autospec(TexSoulgraph, instance=True)  # rejects kwargs imprint_belief does not take
+    soulgraph.max_drift.return_value = 0.0
+    stand_ins["sovereign_evolution.texX_soulgraph"]["TEX_SOULGRAPH"] = soulgraph
+    stand_ins["core_layer.tex_manifest"]["TEXPULSE"] = {}
+
+    with monkeypatch.context() as m:
+        m.setattr(threading.Thread, "start", lambda self: None)  # keep the sensor / embodiment loops off
+        module = import_isolated(monkeypatch, BRAIN, stand_ins)
+    yield module
+    module.cycle_pipeline.shutdown()
+
+
+def test_coherence_drift_runs_self_eval_and_the_contradiction_scan(brain, monkeypatch):
+    monkeypatch.setattr(brain, "run_self_check", lambda: False)
+    monkeypatch.setattr(brain.dream_mutation_engine, "run", lambda **kw: [{"fork": "a"}])
+
+    ctx = brain.cycle_pipeline.run({
+        "cycle_id": 7,
+        "now": datetime.utcnow(),
+        "intent": MagicMock(),
+        "cognitive_event": {"input": "cycle_7"},
+        "emotion_state": "neutral",
+    })
+
+    assert [g["goal"] for g in ctx["self_eval"]] == ["Optimize reflex entropy regulation", "Detect belief misalignment"]
+    assert brain.cycle_pipeline.timings["self_eval"].errors == 0
+    assert brain.cycle_pipeline.timings["contradiction_scan"].calls == 1
+    assert brain.cycle_pipeline.timings["contradiction_scan"].errors == 0
+    imprint = brain.TEX_SOULGRAPH.imprint_belief
+    imprint.assert_called_once()
+    assert "cycle_7" in imprint.call_args.kwargs["tags"]
@@ -0,0 +1,32 @@
+import multiprocessing as mp
+import threading
+
+from core_schemas.reflex_packet import decode_packets
+from swarm_layer.fork_process_runtime import _fork_worker
+
+
+def _run_worker(conn, stop_event):
+    worker = threading.Thread(target=_fork_worker, args=("fork_a", 0.01, "TEX", conn, stop_event), daemon=True)
+    worker.start()
+    return worker
+
+
+def test_worker_sends_frames_until_stopped():
+    reader, writer = mp.Pipe(duplex=False)
+    stop_event = threading.Event()
+    worker = _run_worker(writer, stop_event)
+
+    assert reader.poll(2.0)
+    (packet,) = decode_packets(reader.recv_bytes())
+    assert packet.fork_id == "fork_a"
+    stop_event.set()
+    worker.join(2.0)
+    assert not worker.is_alive()
+
+
+def test_worker_exits_when_the_parent_end_is_gone():
+    reader, writer = mp.Pipe(duplex=False)
+    reader.close()
+    worker = _run_worker(writer, threading.Event())  # never stopped cleanly
+    worker.join(2.0)
+    assert not worker.is_alive()
@@ -0,0 +1,55 @@
+# tests/test_local_vector_store.py
+import os
+
+import numpy as np
+
+from agentic_ai.embedding_engine import EMBED_DIM
+from agentic_ai.local_vector_store import LocalVectorStore
+
+
+def _vec(seed: int) -> list:
+    v = np.random.default_rng(seed).standard_normal(EMBED_DIM)
+    return (v / np.linalg.norm(v)).tolist()
+
+
+def _store(store, i: int, **metadata):
+    return store.store(f"memory {i}", {"tags": ["t"], **metadata}, vector=_vec(i))
+
+
+def test_search_returns_nearest_first(tmp_path):
+    store = LocalVectorStore(path=str(tmp_path), capacity=4)
+    ids = [_store(store, i) for i in range(20)]
+    hits = store.query_by_vector(_vec(7) + [0.5, 0.5, 0.0, 0.0], top_k=3)
+    assert hits[0]["id"] == ids[7]
+    assert len(hits) == 3
+    store.close()
+
+
+def test_reload_keeps_records_and_vectors(tmp_path):
+    store = LocalVectorStore(path=str(tmp_path), capacity=4)
+    ids = [_store(store, i) for i in range(10)]
+    store.close()
+
+    reloaded = LocalVectorStore(path=str(tmp_path), capacity=4)
+    assert len(reloaded) == 10
+    assert reloaded.query_by_vector(_vec(3) + [0.5, 0.5, 0.0, 0.0], top_k=1)[0]["id"] == ids[3]
+    reloaded.close()
+
+
+def test_reload_after_torn_write_keeps_later_appends(tmp_path):
+    store = LocalVectorStore(path=str(tmp_path), capacity=4)
+    for i in range(5):
+        _store(store, i)
+    store.close()
+    with open(os.path.join(tmp_path, "records.jsonl"), "a", encoding="utf-8") as f:
+        f.write('{"id": "torn", "summ')  # crash mid-write
+
+    store = LocalVectorStore(path=str(tmp_path), capacity=4)
+    assert len(store) == 5
+    late = _store(store, 5)
+    store.close()
+
+    reloaded = LocalVectorStore(path=str(tmp_path), capacity=4)
+    assert len(reloaded) == 6
+    assert reloaded.query_by_vector(_vec(5) + [0.5, 0.5, 0.0, 0.0], top_k=1)[0]["id"] == late
+    reloaded.close()
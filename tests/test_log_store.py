@@ -0,0 +1,71 @@
+import json
+import os
+import sqlite3
+
+from memory_archive.log_store import LogStore, stream_for_path
+
+
+def _append(path, *records):
+    with open(path, "a") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def test_import_reads_only_appended_lines(tmp_path):
+    store = LogStore(str(tmp_path / "logs.sqlite"))
+    path = tmp_path / "events.jsonl"
+    _append(path, {"n": 1, "timestamp": "2025-01-01T00:00:00"}, {"n": 2, "timestamp": "2025-01-02T00:00:00"})
+
+    assert store.import_jsonl(str(path)) == 2
+    assert store.import_jsonl(str(path)) == 0
+    _append(path, {"n": 3, "timestamp": "2025-01-03T00:00:00"})
+    with open(path, "a") as f:
+        f.write('{"n": 4')  # torn tail is left for the next import
+    assert store.import_jsonl(str(path)) == 1
+
+    stream = stream_for_path(str(path))
+    assert [r["n"] for r in store.scan(stream)] == [1, 2, 3]
+    assert store.latest(stream)["n"] == 3
+
+
+def test_replaced_file_is_reimported(tmp_path):
+    store = LogStore(str(tmp_path / "logs.sqlite"))
+    path = tmp_path / "events.jsonl"
+    _append(path, {"n": 1}, {"n": 2}, {"n": 3})
+    store.import_jsonl(str(path))
+
+    replacement = tmp_path / "events.jsonl.tmp"
+    _append(replacement, {"n": 9})
+    os.replace(replacement, path)
+    assert store.import_jsonl(str(path)) == 1
+    assert [r["n"] for r in store.scan(stream_for_path(str(path)))] == [9]
+
+
+def test_same_named_files_keep_separate_streams(tmp_path):
+    store = LogStore(str(tmp_path / "logs.sqlite"))
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    first, second = tmp_path / "a" / "log.jsonl", tmp_path / "b" / "log.jsonl"
+    _append(first, {"src": "a"})
+    _append(second, {"src": "b"}, {"src": "b"})
+    store.import_jsonl(str(first))
+    store.import_jsonl(str(second))
+
+    # Replacing one must not wipe the other's rows
+    replacement = tmp_path / "a" / "log.jsonl.tmp"
+    _append(replacement, {"src": "a2"})
+    os.replace(replacement, first)
+    store.import_jsonl(str(first))
+
+    assert stream_for_path(str(first)) != stream_for_path(str(second))
+    assert [r["src"] for r in store.scan(stream_for_path(str(first)))] == ["a2"]
+    assert [r["src"] for r in store.scan(stream_for_path(str(second)))] == ["b", "b"]
+
+
+def test_two_stores_do_not_import_the_same_bytes_twice(tmp_path):
+    db = str(tmp_path / "logs.sqlite")
+    path = tmp_path / "events.jsonl"
+    _append(path, *({"n": i} for i in range(50)))
+    # Separate instances stand in for separate processes: only the write transaction serializes them
+    assert LogStore(db).import_jsonl(str(path)) + LogStore(db).import_jsonl(str(path)) == 50
+    assert sqlite3.connect(db).execute("SELECT COUNT(*) FROM records").fetchone()[0] == 50
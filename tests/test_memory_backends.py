@@ -0,0 +1,11 @@
+from agentic_ai.memory_backends import get_memory_backend
+
+
+def test_qdrant_module_exports_a_lazy_shared_router():
+    from agentic_ai.qdrant_memory_router import QdrantMemoryRouter, memory_router
+
+    flush = memory_router.flush  # first attribute access builds the instance, without connecting
+    backend = get_memory_backend("qdrant")
+    assert isinstance(backend, QdrantMemoryRouter)
+    assert flush.__self__ is backend
+    assert backend._client is None
@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+
+from agentic_ai.milvus_memory_router import MilvusMemoryRouter
+
+
+class FakeCollection:
+    def __init__(self, insert_delay: float = 0.0):
+        self.insert_delay = insert_delay
+        self.rows = []
+        self.flushes = 0
+        self.inserting = threading.Event()
+
+    def insert(self, columns):
+        self.inserting.set()
+        time.sleep(self.insert_delay)
+        self.rows.extend(columns[0])
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture
+def make_router():
+    routers = []
+
+    def make(collection, **kwargs):
+        router = MilvusMemoryRouter(**kwargs)
+        router._collection = collection
+        routers.append(router)
+        return router
+
+    yield make
+    for router in routers:
+        router.close()
+
+
+def _store(router, n, start=0):
+    return [router.store(f"memory {i}", {"tags": ["t"]}, vector=[0.1] * 8) for i in range(start, start + n)]
+
+
+def test_rows_wait_in_buffer_until_flush(make_router):
+    collection = FakeCollection()
+    router = make_router(collection, batch_size=100, flush_interval=60)
+    ids = _store(router, 5)
+    assert router.pending_writes() == 5 and collection.rows == []
+
+    assert router.flush() is True
+    assert collection.rows == ids and router.pending_writes() == 0
+
+
+def test_flush_waits_for_batch_already_taken_by_flusher(make_router):
+    collection = FakeCollection(insert_delay=0.3)
+    router = make_router(collection, batch_size=4, flush_interval=60)
+    ids = _store(router, 4)  # a full batch wakes the background flusher
+    assert collection.inserting.wait(2.0)
+    assert router.pending_writes() == 0
+
+    router.flush()
+    assert collection.rows == ids
+
+
+def test_close_drains_and_late_writes_go_straight_through(make_router):
+    collection = FakeCollection()
+    router = make_router(collection, batch_size=100, flush_interval=60, seal_policy="off")
+    ids = _store(router, 3)
+    router.close()
+    assert collection.rows == ids and collection.flushes == 1
+
+    late = _store(router, 1, start=3)
+    assert collection.rows == ids + late
+    router.close()  # second close is a no-op
+    assert collection.flushes == 1
+
+
+def test_late_write_inserts_outside_the_buffer_lock(make_router):
+    collection = FakeCollection(insert_delay=0.5)
+    router = make_router(collection, batch_size=100, flush_interval=60, seal_policy="off")
+    router.close()
+
+    writer = threading.Thread(target=_store, args=(router, 1))
+    writer.start()
+    assert collection.inserting.wait(2.0)
+    started = time.perf_counter()
+    assert router.pending_writes() == 0  # not stuck behind the slow insert
+    assert time.perf_counter() - started < 0.2
+    assert router.flush() is True  # ...but flush() still waits for it
+    assert len(collection.rows) == 1
+    writer.join()
+
+
+def test_first_access_connects_in_background(make_router, monkeypatch):
+    import agentic_ai.milvus_memory_router as milvus
+
+    collection = FakeCollection()
+    release = threading.Event()
+
+    def slow_open():
+        release.wait(2.0)
+        return collection
+
+    monkeypatch.setattr(milvus, "_open_collection", slow_open)
+    monkeypatch.setattr(milvus, "_has_v2_schema", lambda c: True)
+    router = make_router(None, batch_size=100, flush_interval=60)
+
+    started = time.perf_counter()
+    assert router.collection is None
+    assert router.connecting
+    ids = _store(router, 2)  # buffered while the connect is in progress
+    assert time.perf_counter() - started < 0.2
+    assert all(ids)
+
+    release.set()
+    router.flush()
+    assert router.collection is collection
+    assert collection.rows == ids
+
+
+def test_failed_connect_goes_offline_until_cooldown(make_router, monkeypatch):
+    import agentic_ai.milvus_memory_router as milvus
+
+    attempts = []
+    monkeypatch.setattr(milvus, "_open_collection", lambda: attempts.append(1))
+    router = make_router(None)
+    assert router.collection is None
+    assert router.wait_connected(2.0) is False
+    assert router.store("lost", {}, vector=[0.1] * 8) is None
+    assert router.collection is None and len(attempts) == 1
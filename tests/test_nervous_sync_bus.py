@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from conftest import import_isolated
+from core_schemas.reflex_packet import ReflexPacket, decode_packets, encode_packets
+
+
+@pytest.fixture
+def bus_module(monkeypatch):
+    # Homeostasis, the mirror bridge, the lineage evolver and the goal orchestrator pull in the model
+    # stack, the legacy memory engine and wandb on import; the ingest and drain paths never call them
+    return import_isolated(monkeypatch, "swarm_layer.nervous_sync_bus", {
+        "swarm_layer.swarm_homeostasis": {"update_swarm_signature": lambda *a, **k: None,
+                                          "bind_nervous_bus": lambda bus: None},
+        "swarm_layer.reflex_mirror_bridge": {"mirror_reflex_if_consensus": lambda packet: None},
+        "aei_layer.aei_lineage_evolver": {"AEILineageEvolver": object},
+        "agi_orchestrators.goal_orchestrator": {"GoalOrchestrator": object},
+    })
+
+
+@pytest.fixture
+def bus(bus_module):
+    return bus_module.NervousSyncBus(sync_interval=60)
+
+
+def _packet(fork_id, reflex=None, goals=(), memory=()):
+    return ReflexPacket(fork_id=fork_id, timestamp=time.time(), reflex=reflex or {"type": "PULSE", "entropy": 0.2},
+                        goal_deltas=list(goals), memory_updates=list(memory))
+
+
+def _tick(bus):
+    bus.ingest_signals()
+    with bus.lock:
+        return bus._drain()
+
+
+def test_drain_returns_only_what_arrived_since_last_tick(bus):
+    bus.receive_packet(_packet("a", goals=[{"id": "g1"}], memory=[{"m": 1}]))
+    bus.receive_packet(_packet("b", goals=[{"id": "g2"}]))
+    reflexes, goals, memory = _tick(bus)
+    assert len(reflexes) == 2
+    assert sorted(g["id"] for g in goals) == ["g1", "g2"]
+    assert {g["origin"] for g in goals} == {"a", "b"}
+    assert memory == [{"m": 1}]
+
+    # A quiet tick: nothing new, even though both forks still hold their last reflex
+    assert _tick(bus) == ([], [], [])
+
+    bus.receive_packet(_packet("b", reflex={"type": "PULSE", "entropy": 0.7}, memory=[{"m": 2}]))
+    reflexes, goals, memory = _tick(bus)
+    assert reflexes == [{"type": "PULSE", "entropy": 0.7}]
+    assert goals == [] and memory == [{"m": 2}]
+
+
+def test_full_fork_buffer_sheds_oldest_and_counts_drops(bus_module, bus, monkeypatch):
+    overflow = bus_module.FORK_BUFFER_MAX + 3
+    bus.receive_packet(_packet("a", goals=[{"id": f"g{i}"} for i in range(overflow)]))
+    _, goals, _ = _tick(bus)
+    assert bus.dropped == 3
+    assert goals[0]["id"] == "g3" and len(goals) == bus_module.FORK_BUFFER_MAX
+
+
+def test_goal_dedup_spans_ticks(bus):
+    assert [g["id"] for g in bus.deduplicate_goals([{"id": "x"}, {"id": "y"}, {"id": "x"}])] == ["x", "y"]
+    assert bus.deduplicate_goals([{"id": "y"}, {"id": "z"}]) == [{"id": "z"}]
+
+
+def test_urgent_packet_wakes_the_bus(bus):
+    bus.receive_packet(_packet("a", reflex={"type": "PULSE", "entropy": 0.1}))
+    assert not bus._wake.is_set()
+    bus.receive_packet(_packet("a", reflex={"type": "PULSE", "entropy": 0.95}))
+    assert bus._wake.is_set()
+
+
+def test_packets_survive_the_process_wire_format(bus):
+    frame = encode_packets([_packet("a", goals=[{"id": "g"}]), _packet("b")])
+    for packet in decode_packets(frame):
+        bus.receive_packet(packet)
+    reflexes, goals, _ = _tick(bus)
+    assert len(reflexes) == 2 and [g["id"] for g in goals] == ["g"]
+
+
+def test_launcher_builds_nothing_inside_a_worker_process(bus_module, monkeypatch):
+    import multiprocessing
+
+    def no_bus(*args, **kwargs):
+        raise AssertionError("a worker process must not build its own bus")
+
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    monkeypatch.setattr(bus_module, "NervousSyncBus", no_bus)
+    assert bus_module.launch_nervous_sync_daemon(fork_processes=True) is None
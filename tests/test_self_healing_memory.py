@@ -0,0 +1,69 @@
+import json
+import os
+
+from aei_layer.self_healing_memory_engine import IncrementalMemoryHealer
+from memory_archive.log_store import LogStore, read_jsonl, stream_for_path
+from tex_engine.boot_state_loader import load_jsonl
+
+
+def _healer(tmp_path, store=None):
+    return IncrementalMemoryHealer(str(tmp_path / "mem.jsonl"), str(tmp_path / "state.json"),
+                                   str(tmp_path / "heal_log.jsonl"), store=store or LogStore(str(tmp_path / "logs.sqlite")))
+
+
+def _write(path, *records, mode="a"):
+    with open(path, mode) as f:
+        f.write("".join(json.dumps(r) + "\n" for r in records))
+
+
+def test_heals_in_place_without_replacing_the_file(tmp_path):
+    healer = _healer(tmp_path)
+    _write(healer.path, {"n": 1, "reasoning": "??? " + "x" * 80}, {"n": 2, "reasoning": "fine"})
+    inode, size = os.stat(healer.path).st_ino, os.path.getsize(healer.path)
+
+    assert healer.heal() == 1
+    assert os.stat(healer.path).st_ino == inode
+    assert os.path.getsize(healer.path) == size
+    with open(healer.path) as f:
+        first = json.loads(f.readline())
+    assert first["n"] == 1 and first["reasoning"].startswith("[HEALED")
+
+
+def test_appends_between_passes_are_kept(tmp_path):
+    healer = _healer(tmp_path)
+    _write(healer.path, {"n": 1, "reasoning": "None" + " " * 60})
+    healer.heal()
+    _write(healer.path, {"n": 2, "reasoning": "ok"}, {"n": 3})
+    assert healer.heal() == 1
+    assert [e["n"] for e in load_jsonl(healer.path)] == [1, 2, 3]
+    assert healer.heal() == 0
+
+
+def test_repair_that_does_not_fit_is_superseded_for_every_reader(tmp_path):
+    store = LogStore(str(tmp_path / "logs.sqlite"))
+    healer = _healer(tmp_path, store)
+    _write(healer.path, {"n": 1}, {"n": 2, "reasoning": "ok"})
+    size = os.path.getsize(healer.path)
+    stream = stream_for_path(healer.path)
+    assert store.import_jsonl(healer.path) == 2  # already indexed before the heal
+
+    assert healer.heal() == 1
+    healed = [{"n": 2, "reasoning": "ok"}, {"n": 1, "reasoning": "[HEALED] Reasoning missing — entry repaired."}]
+    assert load_jsonl(healer.path) == healed
+    with open(healer.path, "rb") as f:
+        assert f.read(size).splitlines()[0].strip() == b""  # the old line is blanked at its own length
+    assert list(store.scan(stream)) == healed
+    assert healer.heal() == 0
+
+
+def test_in_place_patch_reaches_an_already_imported_log_store(tmp_path, monkeypatch):
+    import memory_archive.log_store as log_store_module
+
+    store = LogStore(str(tmp_path / "logs.sqlite"))
+    monkeypatch.setattr(log_store_module, "log_store", store)
+    healer = _healer(tmp_path, store)
+    _write(healer.path, {"n": 1, "reasoning": "???" + " " * 80})
+    assert read_jsonl(healer.path)[0]["reasoning"].startswith("???")
+
+    assert healer.heal() == 1
+    assert read_jsonl(healer.path)[0]["reasoning"].startswith("[HEALED")
@@ -0,0 +1,41 @@
+from tex_signal_metrics import SpineMetrics
+
+
+def _families(text):
+    """family name -> sample lines, asserting each family's samples form one block after its TYPE."""
+    families, current, closed = {}, None, set()
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            name = line.split()[2]
+            assert name not in families, f"{name} declared twice"
+            if current:
+                closed.add(current)
+            current = name
+            families[name] = []
+        elif line and not line.startswith("#"):
+            metric = line.split("{")[0].split()[0]
+            owner = next(f for f in families if metric in (f, f + "_sum", f + "_count"))
+            assert owner == current and owner not in closed, f"{metric} outside its family block"
+            families[owner].append(line)
+    return families
+
+
+def test_prometheus_families_are_contiguous_and_in_seconds():
+    metrics = SpineMetrics(enabled=True)
+    metrics.bind_depth_probe(lambda: {"urgent": 2, "routine": 0})
+    metrics.record_signal("pulse", 0.004)
+    metrics.record_signal("drift", 0.020)
+    metrics.record_handler("pulse", "fast", 0.001)
+    metrics.record_handler("drift", "slow", 0.250, error=True)
+    metrics.record_handler("drift", "slow", 0.750)
+
+    families = _families(metrics.render_prometheus())
+
+    assert not any(name.endswith("_ms") for name in families)
+    slow = [l for l in families["tex_spine_handler_latency_seconds"] if 'handler="slow"' in l]
+    assert 'tex_spine_handler_latency_seconds_sum{signal="drift",handler="slow"} 1' in slow
+    assert 'tex_spine_handler_latency_seconds_count{signal="drift",handler="slow"} 2' in slow
+    p99 = next(l for l in slow if 'quantile="0.99"' in l)
+    assert 0.5 < float(p99.rsplit(" ", 1)[1]) <= 0.75
+    assert 'tex_spine_handler_errors_total{signal="drift",handler="slow"} 1' in families["tex_spine_handler_errors_total"]
+    assert len(families["tex_spine_queue_depth"]) == 2
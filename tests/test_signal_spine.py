@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+from conftest import import_isolated
+
+BANDS = [("reflex", 0.8, 4, "block"), ("normal", 0.4, 4, "drop_oldest"), ("background", 0.0, 1, "drop_newest")]
+
+
+@pytest.fixture
+def spine_module(monkeypatch):
+    # reasoning_fragments pulls analytics packages through its goal engine; the spine only names it
+    module = import_isolated(monkeypatch, "tex_signal_spine", {
+        "core_agi_modules.reasoning_fragments": {"synthesize_thought_fragment": lambda *a, **k: None},
+    })
+    monkeypatch.setattr(module, "register_reflex_strain", lambda *a, **k: None)
+    return module
+
+
+@pytest.fixture
+def make_spine(spine_module):
+    spines = []
+
+    def make(**kwargs):
+        spine = spine_module.SignalSpine(bands=BANDS, threads=4, handler_timeout=5.0, **kwargs)
+        spines.append(spine)
+        return spine
+
+    yield make
+    for spine in spines:
+        spine.shutdown(drain=False)
+
+
+def _signal(signal_type, urgency):
+    return {"type": signal_type, "payload": {}, "urgency": urgency}
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_higher_bands_drain_first(spine_module, make_spine):
+    gate, order = threading.Event(), []
+    spine_module.register("block", lambda s: gate.wait(2.0))
+    for name in ("background_sig", "normal_sig", "reflex_sig"):
+        spine_module.register(name, lambda s, name=name: order.append(name))
+    spine = make_spine(workers=1, reflex_workers=0)
+
+    spine.submit(_signal("block", 0.5))
+    assert _wait_for(lambda: spine.depth()["normal"] == 0)  # the single worker is now held
+    spine.submit(_signal("background_sig", 0.1))
+    spine.submit(_signal("normal_sig", 0.5))
+    spine.submit(_signal("reflex_sig", 0.9))
+    gate.set()
+
+    assert _wait_for(lambda: len(order) == 3)
+    assert order == ["reflex_sig", "normal_sig", "background_sig"]
+
+
+def test_reserved_reflex_lane_bypasses_saturated_workers(spine_module, make_spine):
+    gate, served = threading.Event(), threading.Event()
+    spine_module.register("slow", lambda s: gate.wait(2.0))
+    spine_module.register("reflex_sig", lambda s: served.set())
+    spine = make_spine(workers=1, reflex_workers=1)
+
+    spine.submit(_signal("slow", 0.5))
+    spine.submit(_signal("slow", 0.5))
+    spine.submit(_signal("reflex_sig", 0.95))
+    try:
+        assert served.wait(1.0)  # answered while the shared worker is still stuck
+        assert not gate.is_set()
+    finally:
+        gate.set()
+
+
+def test_full_background_band_rejects_newest(spine_module, make_spine):
+    gate = threading.Event()
+    spine_module.register("block", lambda s: gate.wait(2.0))
+    spine_module.register("bg", lambda s: None)
+    spine = make_spine(workers=1, reflex_workers=0)
+    spine.submit(_signal("block", 0.5))
+    assert _wait_for(lambda: spine.depth()["normal"] == 0)
+
+    assert spine.submit(_signal("bg", 0.1)) is True
+    assert spine.submit(_signal("bg", 0.1)) is False
+    assert spine.stats["dropped"] == 1
+    gate.set()
+
+
+def test_guard_veto_stops_only_the_signals_it_inspects(spine_module, make_spine):
+    ran = []
+
+    def deny(signal):
+        raise PermissionError(f"{signal['type']} denied")
+
+    spine_module.register("any_signal", deny, signal_types=["forbidden"])
+    spine_module.register("forbidden", lambda s: ran.append("forbidden"))
+    spine_module.register("allowed", lambda s: ran.append("allowed"))
+    spine = make_spine(workers=1, reflex_workers=0)
+
+    spine.submit(_signal("forbidden", 0.5))
+    spine.submit(_signal("allowed", 0.5))
+    assert _wait_for(lambda: ran == ["allowed"])
+    assert spine.stats["vetoed"] == 1
+    guards, _ = spine_module.route_for("allowed")
+    assert guards == ()
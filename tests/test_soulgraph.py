@@ -0,0 +1,72 @@
+import threading
+
+import numpy as np
+import pytest
+
+import sovereign_evolution.texX_soulgraph as soulgraph_module
+from agentic_ai.embedding_engine import EMBED_DIM
+
+
+class FakeReasoner:
+    def reason(self, symbolic_query, vector_context):
+        return {"symbolic_results": None}
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    gate = threading.Event()
+    stored = []
+
+    def embed_many(texts):
+        gate.wait(5.0)
+        vectors = []
+        for text in texts:
+            v = np.zeros(EMBED_DIM, dtype=np.float32)
+            v[sum(map(ord, text)) % EMBED_DIM] = 1.0
+            vectors.append(v.tolist())
+        return vectors
+
+    memory = soulgraph_module.sovereign_memory
+    monkeypatch.setattr(memory, "embed_many", embed_many)
+    monkeypatch.setattr(memory, "store_many", lambda texts, metadatas: stored.extend(metadatas))
+    monkeypatch.setattr(soulgraph_module, "NeuroSymbolicReasoner", FakeReasoner)
+    g = soulgraph_module.TexSoulgraph(deferred=True)
+    g.gate, g.stored = gate, stored
+    yield g
+    gate.set()
+    g.flush(5.0)
+
+
+def test_deferred_imprint_is_visible_now_and_durable_after_flush(graph):
+    node = graph.imprint_belief("the future carries risk", "test")
+    assert graph.graph[node.id] is node
+    assert graph.pending_imprints() == 1
+    assert graph.store.search(node.vector, -1.0).size == 0  # pending rows are not matches yet
+
+    graph.gate.set()
+    assert graph.flush(5.0)
+    assert graph.pending_imprints() == 0
+    assert [m["belief_id"] for m in graph.stored] == [node.id]
+    assert list(graph.store.search(node.vector, 0.99)) == [graph.store.rows[node.id]]
+
+
+def test_writes_made_while_imprint_is_pending_survive(graph):
+    node = graph.imprint_belief("hold the line", "test")
+    node.drift_score = 0.7
+    node.confidence = 0.25
+
+    graph.gate.set()
+    graph.flush(5.0)
+    assert node.drift_score == pytest.approx(0.7)
+    assert node.confidence == pytest.approx(0.25)
+    assert graph.max_drift() == pytest.approx(0.7)
+
+
+
+def test_get_snapshot_returns_a_list(graph):
+    graph.gate.set()
+    nodes = [graph.imprint_belief(f"belief {i}", "test") for i in range(3)]
+    graph.flush(5.0)
+    snapshot = graph.get_snapshot()
+    assert isinstance(snapshot["beliefs"], list)
+    assert [b["id"] for b in snapshot["beliefs"]] == [n.id for n in nodes]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from conftest import import_isolated
+
+
+@pytest.fixture
+def SpikeHistory(monkeypatch):
+    # The action router's import chain reaches optional model packages; the ring does not use it
+    engine = import_isolated(monkeypatch, "brain_layer.neuromorphic_spike_engine", {
+        "brain_layer.spike_action_router": {"spike_action_router": None},
+    })
+    return engine.SpikeHistory
+
+
+def _vectors(n):
+    rng = np.random.default_rng(5)
+    return rng.random((n, 4))
+
+
+def test_ring_keeps_newest_records_oldest_first(SpikeHistory):
+    history = SpikeHistory(capacity=8, window=3)
+    vectors = _vectors(20)
+    for i, v in enumerate(vectors):
+        history.append(v, spike_sum=float(i), latency=0.001 * i, timestamp=1_700_000_000 + i)
+
+    assert len(history) == 8 and history.total == 20
+    assert [r["spike_sum"] for r in history] == [float(i) for i in range(12, 20)]
+    assert history[-1]["vector"] == pytest.approx(vectors[19].tolist())
+    assert [r["spike_sum"] for r in history[2:4]] == [14.0, 15.0]
+    with pytest.raises(IndexError):
+        history[8]
+
+
+def test_window_mean_and_ema_track_appends_across_wraps(SpikeHistory):
+    history = SpikeHistory(capacity=5, window=4)
+    vectors = _vectors(23)
+    ema = vectors[0].copy()
+    alpha = 2.0 / (4 + 1.0)
+    for i, v in enumerate(vectors):
+        history.append(v, spike_sum=0.0, latency=0.0)
+        if i:
+            ema += alpha * (v - ema)
+        expected = vectors[max(0, i - 3):i + 1].mean(axis=0)
+        assert history.window_mean() == pytest.approx(expected)
+    assert history.ema == pytest.approx(ema)
+
+
+def test_capacity_never_drops_below_window(SpikeHistory):
+    history = SpikeHistory(capacity=2, window=6)
+    assert history.capacity == 6
+    vectors = _vectors(9)
+    for v in vectors:
+        history.append(v, spike_sum=0.0, latency=0.0)
+    assert history.window_mean() == pytest.approx(vectors[-6:].mean(axis=0))
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from tex_engine.stage_pipeline import Stage, StagePipeline
+
+
+@pytest.fixture
+def make_pipeline():
+    pipelines = []
+
+    def make(stages, **kwargs):
+        pipeline = StagePipeline(stages, **kwargs)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield make
+    for pipeline in pipelines:
+        pipeline.shutdown()
+
+
+def test_results_flow_through_context(make_pipeline):
+    pipeline = make_pipeline([
+        Stage("double", lambda ctx: ctx["x"] * 2),
+        Stage("plus_one", lambda ctx: ctx["double"] + 1, deps=("double",)),
+    ])
+    assert pipeline.run({"x": 4})["plus_one"] == 9
+
+
+def test_independent_stages_overlap(make_pipeline):
+    barrier = threading.Barrier(2, timeout=2.0)
+    pipeline = make_pipeline([
+        Stage("a", lambda ctx: barrier.wait()),  # deadlocks unless a and b run at the same time
+        Stage("b", lambda ctx: barrier.wait()),
+        Stage("join", lambda ctx: "joined", deps=("a", "b")),
+    ])
+    assert pipeline.run({})["join"] == "joined"
+
+
+def test_gated_and_failed_stages_skip_their_dependents(make_pipeline):
+    ran = []
+
+    def boom(ctx):
+        raise RuntimeError("stage failed")
+
+    pipeline = make_pipeline([
+        Stage("gated", lambda ctx: ran.append("gated"), when=lambda ctx: ctx["enabled"]),
+        Stage("after_gate", lambda ctx: ran.append("after_gate"), deps=("gated",)),
+        Stage("broken", boom),
+        Stage("after_broken", lambda ctx: ran.append("after_broken"), deps=("broken",)),
+        Stage("independent", lambda ctx: ran.append("independent") or "ok"),
+    ])
+    ctx = pipeline.run({"enabled": False})
+
+    assert ran == ["independent"]
+    assert ctx["gated"] is None and ctx["after_gate"] is None
+    assert ctx["broken"] is None and ctx["after_broken"] is None
+    assert ctx["independent"] == "ok"
+    assert pipeline.timings["broken"].errors == 1
+
+
+def test_critical_path_is_longest_dependency_chain(make_pipeline):
+    noop = lambda ctx: None
+    pipeline = make_pipeline([
+        Stage("load", noop),
+        Stage("fast", noop, deps=("load",)),
+        Stage("slow", noop, deps=("load",)),
+        Stage("merge", noop, deps=("fast", "slow")),
+    ])
+    seconds, path = pipeline.critical_path({"load": 0.1, "fast": 0.05, "slow": 0.3, "merge": 0.1})
+    assert path == ["load", "slow", "merge"]
+    assert seconds == pytest.approx(0.5)
+
+
+def test_report_uses_measured_durations(make_pipeline):
+    pipeline = make_pipeline([
+        Stage("sleepy", lambda ctx: time.sleep(0.05)),
+        Stage("quick", lambda ctx: None),
+    ])
+    pipeline.run({})
+    report = pipeline.report()
+    assert report["critical_path"] == ["sleepy"]
+    assert report["critical_path_ms"] >= 45
+    assert report["cycle"]["calls"] == 1
+
+
+def test_unknown_dependency_and_cycles_are_rejected():
+    with pytest.raises(ValueError):
+        StagePipeline([Stage("a", lambda ctx: None, deps=("missing",))])
+    with pytest.raises(ValueError):
+        StagePipeline([Stage("a", lambda ctx: None, deps=("b",)), Stage("b", lambda ctx: None, deps=("a",))])
@@ -0,0 +1,53 @@
+import json
+import os
+
+from tex_stream_follower import StreamFollower
+
+
+def _write(path, *records, mode="a"):
+    with open(path, mode) as f:
+        f.write("".join(json.dumps(r) + "\n" for r in records))
+
+
+def test_appends_are_published_once(tmp_path):
+    path = str(tmp_path / "feed.jsonl")
+    _write(path, {"n": 1}, {"n": 2})
+    follower = StreamFollower(window=10)
+    stream = follower.follow(path)
+    seen = []
+    follower._subscribers[os.path.abspath(path)] = [lambda _, records: seen.extend(records)]
+
+    _write(path, {"n": 3})
+    with open(path, "a") as f:
+        f.write('{"n": 4')  # partial line waits
+    assert follower.pump() == 1
+    with open(path, "a") as f:
+        f.write("}\n")
+    follower.pump()
+
+    assert [r["n"] for r in seen] == [3, 4]
+    assert [r["n"] for r in stream.snapshot()] == [1, 2, 3, 4]
+
+
+def test_rotation_reloads_window_without_publishing(tmp_path):
+    path = str(tmp_path / "feed.jsonl")
+    _write(path, *({"n": i} for i in range(5)))
+    follower = StreamFollower(window=3)
+    stream = follower.follow(path)
+    seen = []
+    follower._subscribers[os.path.abspath(path)] = [lambda _, records: seen.extend(records)]
+    cursor = stream.seq
+
+    rotated = path + ".new"
+    _write(rotated, {"n": 100}, {"n": 101})
+    os.replace(rotated, path)
+    assert follower.pump() == 0
+    assert seen == []
+    assert stream.generation == 1
+    assert [r["n"] for r in stream.snapshot()] == [100, 101]
+    assert follower.since(path, cursor)[0] == []
+
+    _write(path, {"n": 102})
+    follower.pump()
+    assert [r["n"] for r in seen] == [102]
+    assert [r["n"] for r in follower.since(path, cursor)[0]] == [102]
@@ -8,14 +8,15 @@ import os
 import json
 from datetime import datetime, timezone
 
+from memory_archive.log_store import append_jsonl, latest_jsonl
+
 FUSION_PATH = "memory_archive/tex_signal_fusion.jsonl"
 IMPACT_FILE = "memory_archive/agent_impact_scores.jsonl"
 
 def store_to_memory(domain, data):
     filename = f"memory_archive/{domain}.jsonl"
     try:
-        with open(filename, "a") as f:
-            f.write(json.dumps(data) + "\n")
+        append_jsonl(filename, data)
         print(f"[MEMORY] 📚 Stored to {domain}: {data}")
     except Exception as e:
         print(f"[MEMORY ERROR] ❌ Failed to store memory: {e}")
@@ -25,10 +26,8 @@ def recall_latest(domain):
     if not os.path.exists(filename):
         return None
     try:
-        with open(filename, "r") as f:
-            lines = [json.loads(line.strip()) for line in f if line.strip()]
-        if lines:
-            latest = sorted(lines, key=lambda x: x.get("timestamp", ""), reverse=True)[0]
+        latest = latest_jsonl(filename)
+        if latest:
             # ✅ Patch: Add agent_id fallback if needed
             if "data" in latest and isinstance(latest["data"], dict):
                 if "agent_id" not in latest["data"] and "id" in latest["data"]:
@@ -2,19 +2,25 @@
 Ω-tier Module: cognitive_event_router.py
 Author: Sovereign Cognition / Tex
 Purpose: Core event-driven orchestration bus for modular, reflexive AGI cognition
+         (indexed by event type, urgency-ordered with aging, served by a worker pool)
 """
 
-import threading
+import os
+import heapq
 import queue
+import threading
+import itertools
 import time
 import uuid
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
-# GLOBAL EVENT QUEUE
-COGNITIVE_EVENT_QUEUE = queue.Queue()
+from tex_signal_metrics import LatencySeries
 
-# MODULE REGISTRY
-REGISTERED_MODULES: Dict[str, Dict] = {}
+# === Configuration ===
+ROUTER_WORKERS = int(os.getenv("TEX_EVENT_WORKERS", "4"))
+MODULE_CONCURRENCY = int(os.getenv("TEX_EVENT_MODULE_CONCURRENCY", "1"))   # handlers per module at once
+AGING_PER_SEC = float(os.getenv("TEX_EVENT_AGING_PER_SEC", "0.05"))        # urgency gained per second waiting
+EVENT_TRACE = os.getenv("TEX_EVENT_TRACE", "0") == "1"                     # per-dispatch console trace (debug only)
 
 class CognitiveEvent:
     def __init__(self, event_type: str, payload: dict, urgency: float = 0.5, coherence_shift: float = 0.0):
@@ -28,33 +34,212 @@ class CognitiveEvent:
     def __repr__(self):
         return f"<CognitiveEvent {self.event_type} ({self.urgency})>"
 
-def register_module(name: str, trigger_types: List[str], handler_fn: Callable[[CognitiveEvent], None]):
-    REGISTERED_MODULES[name] = {
-        "triggers": trigger_types,
-        "handler": handler_fn
-    }
+
+# === Priority Queue ===
+class CognitiveEventQueue:
+    """
+    Max-urgency-first heap of (event, module) work items with linear aging. An item's
+    effective priority is urgency + AGING_PER_SEC * seconds_waited; since every waiting item
+    ages at the same rate, ordering by (urgency - AGING_PER_SEC * enqueue_time) is exact and
+    the heap key never changes.
+    """
+
+    def __init__(self, aging_per_sec: float = AGING_PER_SEC):
+        self.aging_per_sec = aging_per_sec
+        self._heap: List[Tuple[float, int, float, CognitiveEvent, Optional[str]]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def key(self, event: CognitiveEvent, enqueued: float) -> float:
+        return self.aging_per_sec * enqueued - float(event.urgency or 0.0)
+
+    def item(self, event: CognitiveEvent, module: Optional[str], enqueued: float = None) -> tuple:
+        enqueued = time.monotonic() if enqueued is None else enqueued
+        return self.key(event, enqueued), next(self._seq), enqueued, event, module
+
+    def put(self, event: CognitiveEvent, module: Optional[str] = None, enqueued: float = None):
+        """module=None means 'route to every handler indexed for the event type when popped'."""
+        self.put_item(self.item(event, module, enqueued))
+
+    def put_item(self, item: tuple):
+        with self._cond:
+            heapq.heappush(self._heap, item)
+            self._cond.notify()
+
+    def get(self, timeout: float = None) -> Tuple[CognitiveEvent, Optional[str], float]:
+        """(event, module, monotonic enqueue time) for the most urgent item; queue.Empty on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._heap, timeout=timeout):
+                raise queue.Empty
+            _, _, enqueued, event, module = heapq.heappop(self._heap)
+            return event, module, enqueued
+
+    def qsize(self) -> int:
+        return len(self._heap)
+
+
+# GLOBAL EVENT QUEUE
+COGNITIVE_EVENT_QUEUE = CognitiveEventQueue()
+
+# MODULE REGISTRY
+REGISTERED_MODULES: Dict[str, Dict] = {}
+
+# INVERTED INDEX: event_type -> module names (rebuilt on registration, read without locking)
+EVENT_INDEX: Dict[str, Tuple[str, ...]] = {}
+
+_registry_lock = threading.Lock()
+
+
+class _ModuleSlot:
+    """Concurrency gate for one module; items that find it full wait in its own aged heap."""
+
+    __slots__ = ("limit", "running", "backlog", "handled", "errors", "latency")
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.running = 0
+        self.backlog: List[tuple] = []
+        self.handled = 0
+        self.errors = 0
+        self.latency = LatencySeries()
+
+
+_slots: Dict[str, _ModuleSlot] = {}
+_slot_lock = threading.Lock()
+_queue_wait = LatencySeries()
+
+
+def _rebuild_index():
+    index: Dict[str, List[str]] = {}
+    for name, module in REGISTERED_MODULES.items():
+        for trigger in module["triggers"]:
+            index.setdefault(trigger, []).append(name)
+    global EVENT_INDEX
+    EVENT_INDEX = {trigger: tuple(names) for trigger, names in index.items()}
+
+
+def register_module(name: str, trigger_types: List[str], handler_fn: Callable[[CognitiveEvent], None],
+                    max_concurrency: int = MODULE_CONCURRENCY):
+    with _registry_lock:
+        REGISTERED_MODULES[name] = {
+            "triggers": list(trigger_types),
+            "handler": handler_fn,
+            "max_concurrency": max_concurrency
+        }
+        with _slot_lock:
+            slot = _slots.get(name)
+            if slot is None:
+                _slots[name] = _ModuleSlot(max_concurrency)
+            else:
+                slot.limit = max(1, max_concurrency)
+        _rebuild_index()
 
 def dispatch_event(event: CognitiveEvent):
-    COGNITIVE_EVENT_QUEUE.put(event)
+    """Fan out to one work item per indexed module; unindexed types are routed when popped."""
+    names = EVENT_INDEX.get(event.event_type)
+    if not names:
+        COGNITIVE_EVENT_QUEUE.put(event)
+        return
+    enqueued = time.monotonic()
+    for name in names:
+        COGNITIVE_EVENT_QUEUE.put(event, name, enqueued)
+
+
+# === Workers ===
+def _run_handler(name: str, event: CognitiveEvent):
+    module = REGISTERED_MODULES.get(name)
+    slot = _slots[name]
+    if module is None:
+        return
+    if EVENT_TRACE:
+        print(f"\t→ Dispatching {event} to: {name}")
+    start = time.perf_counter()
+    error = False
+    try:
+        module["handler"](event)
+    except Exception as e:
+        error = True
+        slot.errors += 1
+        print(f"[ERROR] Module {name} failed on event {event.event_type}: {e}")
+    slot.handled += 1
+    slot.latency.observe(time.perf_counter() - start, time.monotonic(), error=error)
+
+def _route(event: CognitiveEvent, name: Optional[str], enqueued: float):
+    if name is None:
+        # Dispatched before any module listened for it: fan out against the current index
+        for target in EVENT_INDEX.get(event.event_type, ()):
+            COGNITIVE_EVENT_QUEUE.put(event, target, enqueued)
+        return
+
+    slot = _slots.get(name)
+    if slot is None:
+        return
+    with _slot_lock:
+        if slot.running >= slot.limit:
+            heapq.heappush(slot.backlog, COGNITIVE_EVENT_QUEUE.item(event, name, enqueued))
+            return
+        slot.running += 1
+
+    _queue_wait.observe(time.monotonic() - enqueued, time.monotonic())
+    try:
+        _run_handler(name, event)
+    finally:
+        # Release right away; the module's most urgent waiting item goes back into the shared
+        # queue, so no worker ever sits on one module's permit while doing another's work
+        with _slot_lock:
+            slot.running -= 1
+            waiting = heapq.heappop(slot.backlog) if slot.backlog else None
+        if waiting is not None:
+            COGNITIVE_EVENT_QUEUE.put_item(waiting)
+
+_stop = threading.Event()
+_workers: List[threading.Thread] = []
 
 def event_loop():
-    print("[CognitiveEventRouter] ⏳ Event loop running...")
-    while True:
+    """One router worker: pull the most urgent (event, module) item and run that handler."""
+    while not _stop.is_set():
         try:
-            event = COGNITIVE_EVENT_QUEUE.get(timeout=1)
-            print(f"[Event Received] {event}")
-            for module_name, module in REGISTERED_MODULES.items():
-                if event.event_type in module["triggers"]:
-                    print(f"\t→ Dispatching to: {module_name}")
-                    try:
-                        module["handler"](event)
-                    except Exception as e:
-                        print(f"[ERROR] Module {module_name} failed on event {event.event_type}: {e}")
+            event, name, enqueued = COGNITIVE_EVENT_QUEUE.get(timeout=1)
         except queue.Empty:
             continue
+        if event is not None:
+            _route(event, name, enqueued)
+
+def start_router(workers: int = ROUTER_WORKERS):
+    with _registry_lock:
+        alive = [t for t in _workers if t.is_alive()]
+        _workers[:] = alive
+        _stop.clear()
+        for i in range(len(alive), max(1, workers)):
+            t = threading.Thread(target=event_loop, name=f"cognitive-router-{i}", daemon=True)
+            t.start()
+            _workers.append(t)
+    print(f"[CognitiveEventRouter] ⏳ Event loop running with {len(_workers)} worker(s)...")
 
-def start_router():
-    threading.Thread(target=event_loop, daemon=True).start()
+def stop_router(timeout: float = 2.0):
+    _stop.set()
+    for _ in _workers:
+        COGNITIVE_EVENT_QUEUE.put_item((float("-inf"), -1, 0.0, None, None))  # wake-up sentinel
+    for t in list(_workers):
+        t.join(timeout=timeout)
+
+def router_stats() -> dict:
+    now = time.monotonic()
+    return {
+        "queued": COGNITIVE_EVENT_QUEUE.qsize(),
+        "workers": sum(t.is_alive() for t in _workers),
+        "queue_wait": _queue_wait.snapshot(now),
+        "modules": {
+            name: {
+                "running": slot.running,
+                "backlog": len(slot.backlog),
+                "handled": slot.handled,
+                "errors": slot.errors,
+                "latency": slot.latency.snapshot(now)
+            }
+            for name, slot in list(_slots.items())
+        }
+    }
 
 # Example Test Registration
 if __name__ == "__main__":
@@ -69,4 +254,4 @@ if __name__ == "__main__":
     dispatch_event(CognitiveEvent("emotional_spike", {"emotion": "curiosity"}, urgency=0.9))
 
     while True:
-        time.sleep(1)
\ No newline at end of file
+        time.sleep(1)
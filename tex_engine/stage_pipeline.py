@@ -0,0 +1,136 @@
+# ============================================================
+# © 2025 Sovereign Cognition / VortexBlack LLC. All rights reserved.
+# File: tex_engine/stage_pipeline.py
+# Tier: ΩΩΩΩ — Cognitive Cycle Stage Graph
+# Purpose: Run a cycle as a dependency graph of stages: independent stages execute concurrently,
+#          every stage is timed, and the critical path is reported next to the wall-clock cycle time
+# ============================================================
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from tex_signal_metrics import LatencySeries
+
+# === Configuration ===
+STAGE_WORKERS = int(os.getenv("TEX_STAGE_WORKERS", "6"))
+
+
+class Stage(NamedTuple):
+    name: str
+    fn: Callable[[dict], object]                   # fn(ctx) -> result, stored as ctx[name]
+    deps: Tuple[str, ...] = ()
+    when: Optional[Callable[[dict], bool]] = None  # cheap gate evaluated on the caller thread
+
+
+class StagePipeline:
+    """
+    Stages share one context dict: inputs seeded by the caller plus each finished stage's
+    result under its name. A stage is submitted as soon as all of its deps finished; a stage
+    whose dependency failed or was gated off is skipped (its result is None).
+    """
+
+    def __init__(self, stages: List[Stage], max_workers: int = STAGE_WORKERS, name: str = "cycle"):
+        self.name = name
+        self.stages = {s.name: s for s in stages}
+        for s in stages:
+            missing = [d for d in s.deps if d not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{s.name}' depends on unknown stage(s): {missing}")
+        self._order = self._topological_order()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-stage")
+        self.timings: Dict[str, LatencySeries] = {s: LatencySeries() for s in self.stages}
+        self.cycle_timing = LatencySeries()
+        self.last_durations: Dict[str, float] = {}
+
+    def _topological_order(self) -> List[str]:
+        order, state = [], {}
+
+        def visit(name, trail=()):
+            if state.get(name) == "done":
+                return
+            if name in trail:
+                raise ValueError(f"Stage cycle: {' -> '.join(trail + (name,))}")
+            for dep in self.stages[name].deps:
+                visit(dep, trail + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _timed(self, stage: Stage, ctx: dict):
+        start = time.perf_counter()
+        error = None
+        try:
+            result = stage.fn(ctx)
+        except Exception as e:
+            result, error = None, e
+        return result, error, time.perf_counter() - start
+
+    def run(self, ctx: dict) -> dict:
+        """Execute one cycle; returns ctx with every stage's result filled in."""
+        cycle_start = time.perf_counter()
+        durations, done, failed = {}, set(), set()
+        pending = {}
+        remaining = list(self._order)
+
+        while remaining or pending:
+            # Submit everything whose dependencies are settled
+            for name in list(remaining):
+                stage = self.stages[name]
+                if not all(d in done or d in failed for d in stage.deps):
+                    continue
+                remaining.remove(name)
+                if any(d in failed for d in stage.deps) or (stage.when is not None and not stage.when(ctx)):
+                    ctx[name] = None
+                    failed.add(name)
+                    continue
+                pending[self._pool.submit(self._timed, stage, ctx)] = name
+            if not pending:
+                continue
+
+            finished, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in finished:
+                name = pending.pop(future)
+                result, error, seconds = future.result()
+                durations[name] = seconds
+                self.timings[name].observe(seconds, now, error=error is not None)
+                ctx[name] = result
+                if error is not None:
+                    print(f"[STAGE ERROR] {self.name}.{name}: {error}")
+                    failed.add(name)
+                else:
+                    done.add(name)
+
+        self.last_durations = durations
+        self.cycle_timing.observe(time.perf_counter() - cycle_start, time.monotonic())
+        return ctx
+
+    def critical_path(self, durations: Dict[str, float] = None) -> Tuple[float, List[str]]:
+        """Longest dependency chain by stage duration (last cycle by default)."""
+        durations = self.last_durations if durations is None else durations
+        best: Dict[str, Tuple[float, List[str]]] = {}
+        for name in self._order:
+            own = durations.get(name, 0.0)
+            prior = max((best[d] for d in self.stages[name].deps), default=(0.0, []), key=lambda b: b[0])
+            best[name] = (prior[0] + own, prior[1] + [name])
+        return max(best.values(), default=(0.0, []), key=lambda b: b[0])
+
+    def report(self) -> dict:
+        now = time.monotonic()
+        mean_durations = {n: (s.total / s.calls if s.calls else 0.0) for n, s in self.timings.items()}
+        path_sec, path = self.critical_path(mean_durations)
+        return {
+            "cycle": self.cycle_timing.snapshot(now),
+            "stages": {n: s.snapshot(now) for n, s in self.timings.items()},
+            "serial_sum_ms": round(sum(mean_durations.values()) * 1000, 3),
+            "critical_path_ms": round(path_sec * 1000, 3),
+            "critical_path": path,
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,224 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: tex_signal_metrics.py
+# Tier: ΩΩΩΩ — Spine Reflex Telemetry
+# Purpose: Per-signal and per-handler latency/throughput counters for the signal spine (always-on, O(1) per call)
+# ============================================================
+
+import os
+import math
+import time
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Optional
+
+# === Configuration ===
+METRICS_ENABLED = os.getenv("TEX_SPINE_METRICS", "1") != "0"
+METRICS_PORT = os.getenv("TEX_SPINE_METRICS_PORT")          # unset = no HTTP endpoint
+RATE_WINDOW = 60.0                                          # seconds for the moving throughput rate
+
+# Log-spaced latency buckets: 10 µs .. ~100 s at ~10% resolution (fixed memory per series)
+_BUCKET_BOUNDS = [1e-5 * (1.1 ** i) for i in range(int(math.log(1e7, 1.1)) + 1)]
+
+
+class LatencySeries:
+    __slots__ = ("calls", "errors", "timeouts", "total", "max", "buckets", "rate", "_rate_ts")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.rate = 0.0
+        self._rate_ts = time.monotonic()
+
+    def observe(self, seconds: float, now: float, error: bool = False, timeout: bool = False):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        if error:
+            self.errors += 1
+        if timeout:
+            self.timeouts += 1
+        # Exponentially decayed events/sec over RATE_WINDOW
+        self.rate = self.rate * math.exp(-(now - self._rate_ts) / RATE_WINDOW) + 1.0 / RATE_WINDOW
+        self._rate_ts = now
+
+    def quantile(self, q: float) -> float:
+        if not self.calls:
+            return 0.0
+        target = q * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(_BUCKET_BOUNDS[min(i, len(_BUCKET_BOUNDS) - 1)], self.max)
+        return self.max
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "rate_per_sec": round(self.rate * math.exp(-(now - self._rate_ts) / RATE_WINDOW), 4),
+            "mean_ms": round(self.total / self.calls * 1000, 3) if self.calls else 0.0,
+            "p50_ms": round(self.quantile(0.50) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class SpineMetrics:
+    """
+    Counters keyed by signal type and by (signal type, handler). Recording is a dict
+    lookup, a bisect and a few increments under one uncontended lock.
+    """
+
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled = enabled
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._handlers: Dict[tuple, LatencySeries] = {}
+        self._signals: Dict[str, LatencySeries] = {}
+        self._queue_wait: Dict[str, LatencySeries] = {}
+        self._depth_probe: Optional[Callable[[], Dict[str, int]]] = None
+        self._depth_peak: Dict[str, int] = {}
+
+    def bind_depth_probe(self, probe: Callable[[], Dict[str, int]]):
+        self._depth_probe = probe
+
+    def _series(self, table: dict, key) -> LatencySeries:
+        series = table.get(key)
+        if series is None:
+            series = table[key] = LatencySeries()
+        return series
+
+    def record_handler(self, signal_type: str, handler_name: str, seconds: float,
+                       error: bool = False, timeout: bool = False):
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._series(self._handlers, (signal_type, handler_name)).observe(seconds, now, error, timeout)
+
+    def record_signal(self, signal_type: str, seconds: float, queue_wait: float = 0.0, error: bool = False):
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._series(self._signals, signal_type).observe(seconds, now, error)
+            self._series(self._queue_wait, signal_type).observe(queue_wait, now)
+
+    def record_depth(self, band: str, depth: int):
+        if depth > self._depth_peak.get(band, 0):
+            self._depth_peak[band] = depth
+
+    def snapshot(self) -> dict:
+        """Point-in-time copy of every series plus current and peak queue depth."""
+        now = time.monotonic()
+        with self._lock:
+            handlers = {f"{sig}::{name}": s.snapshot(now) for (sig, name), s in self._handlers.items()}
+            signals = {sig: {**s.snapshot(now), "queue_wait_p95_ms": self._queue_wait[sig].snapshot(now)["p95_ms"]}
+                       for sig, s in self._signals.items()}
+        return {
+            "uptime_sec": round(time.time() - self.started, 1),
+            "queue_depth": self._depth_probe() if self._depth_probe else {},
+            "queue_depth_peak": dict(self._depth_peak),
+            "signals": signals,
+            "handlers": handlers,
+        }
+
+    def top_handlers(self, n: int = 10, by: str = "p95_ms") -> list:
+        """Handlers ranked by a snapshot field — the quickest way to find who is eating reflex time."""
+        ranked = sorted(self.snapshot()["handlers"].items(), key=lambda kv: kv[1][by], reverse=True)
+        return ranked[:n]
+
+    def reset(self):
+        with self._lock:
+            self._handlers.clear()
+            self._signals.clear()
+            self._queue_wait.clear()
+            self._depth_peak.clear()
+            self.started = time.time()
+
+    # === Prometheus Text Exposition ===
+    def render_prometheus(self) -> str:
+        """
+        Text exposition format: each family's samples follow its own HELP/TYPE lines as one
+        contiguous block, latency is reported in base-unit seconds, and every summary carries
+        _sum and _count so rates and means can be derived server-side.
+        """
+        depth = self._depth_probe() if self._depth_probe else {}
+        with self._lock:
+            signals = [(f'signal="{_escape(sig)}"', s) for sig, s in self._signals.items()]
+            handlers = [(f'signal="{_escape(sig)}",handler="{_escape(name)}"', s)
+                        for (sig, name), s in self._handlers.items()]
+            lines = []
+            _family(lines, "tex_spine_queue_depth", "gauge", "Signals waiting per urgency band",
+                    [(f'band="{_escape(b)}"', d) for b, d in depth.items()])
+            _family(lines, "tex_spine_signal_total", "counter", "Signals dispatched",
+                    [(label, s.calls) for label, s in signals])
+            _summary(lines, "tex_spine_signal_latency_seconds", "Signal dispatch latency", signals)
+            _family(lines, "tex_spine_handler_calls_total", "counter", "Handler invocations",
+                    [(label, s.calls) for label, s in handlers])
+            _family(lines, "tex_spine_handler_errors_total", "counter", "Handler invocations that raised",
+                    [(label, s.errors) for label, s in handlers])
+            _family(lines, "tex_spine_handler_timeouts_total", "counter", "Handler invocations that timed out",
+                    [(label, s.timeouts) for label, s in handlers])
+            _summary(lines, "tex_spine_handler_latency_seconds", "Handler latency", handlers)
+        return "\n".join(lines) + "\n"
+
+
+def _family(lines: list, name: str, kind: str, help_text: str, samples: list):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for label, value in samples:
+        lines.append(f"{name}{{{label}}} {value}")
+
+
+def _summary(lines: list, name: str, help_text: str, series: list):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} summary")
+    for label, s in series:
+        for q in (0.5, 0.95, 0.99):
+            lines.append(f'{name}{{{label},quantile="{q}"}} {s.quantile(q):.6g}')
+        lines.append(f"{name}_sum{{{label}}} {s.total:.6g}")
+        lines.append(f"{name}_count{{{label}}} {s.calls}")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def serve_prometheus(metrics: SpineMetrics, port: int, host: str = "0.0.0.0"):
+    """Expose GET /metrics on a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="spine-metrics", daemon=True).start()
+    print(f"📈 [SPINE METRICS] Prometheus endpoint on :{port}/metrics")
+    return server
+
+
+spine_metrics = SpineMetrics()
@@ -5,10 +5,14 @@
 # Purpose: Core AGI cognition orchestrator — loopless signal spine for reflex activation.
 # ============================================================
 import os
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Dict, List
+from types import MappingProxyType
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 import asyncio
-from typing import Callable, Dict, List
 from core_layer.tex_manifest import TEXPULSE
 from utils.logging_utils import log
 from core_layer.soma_tensor import update_soma_tensor, register_reflex_strain
@@ -20,21 +24,332 @@ from agentic_ai.milvus_memory_router import memory_router
 from quantum_layer.chronofabric import encode_event_to_fabric
 from core_agi_modules.reasoning_fragments import synthesize_thought_fragment
 from reflex.reality_reflex_writer import rewrite_reality_if_needed
+from tex_signal_metrics import spine_metrics, serve_prometheus, METRICS_PORT
+
+# === SPINE CONFIGURATION ===
+SPINE_MODE = os.getenv("TEX_SPINE_MODE", "async").strip().lower()        # async | sync (legacy inline)
+SPINE_WORKERS = int(os.getenv("TEX_SPINE_WORKERS", "4"))                   # concurrent signal workers
+SPINE_REFLEX_WORKERS = int(os.getenv("TEX_SPINE_REFLEX_WORKERS", "1"))     # extra workers that only serve the top band
+SPINE_THREADS = int(os.getenv("TEX_SPINE_THREADS", "16"))                  # pool for sync handlers
+SPINE_HANDLER_TIMEOUT = float(os.getenv("TEX_SPINE_HANDLER_TIMEOUT", "5.0"))
+SPINE_BLOCK_TIMEOUT = float(os.getenv("TEX_SPINE_BLOCK_TIMEOUT", "0.25"))  # max producer wait under "block"
+
+# Urgency bands, highest first: (name, min urgency, queue bound, policy when full)
+#   block       — producer waits up to SPINE_BLOCK_TIMEOUT, then the oldest queued signal is shed
+#   drop_oldest — shed the oldest queued signal to admit the new one
+#   drop_newest — reject the incoming signal
+URGENCY_BANDS = [
+    ("reflex", 0.8, int(os.getenv("TEX_SPINE_REFLEX_QUEUE", "256")), "block"),
+    ("normal", 0.4, int(os.getenv("TEX_SPINE_NORMAL_QUEUE", "1024")), "drop_oldest"),
+    ("background", 0.0, int(os.getenv("TEX_SPINE_BACKGROUND_QUEUE", "1024")), "drop_newest"),
+]
 
 # === SIGNAL REGISTRY ===
 signal_registry: Dict[str, List[Callable]] = {}
+handler_timeouts: Dict[tuple, float] = {}  # (signal_type, handler) -> seconds
+inline_handlers: set = set()               # (signal_type, handler) run directly on the spine loop
+guard_scopes: Dict[Callable, frozenset] = {}  # any_signal guard -> signal types it inspects
+_registry_version = 0
 
-def register(signal_type: str, handler: Callable):
+def register(signal_type: str, handler: Callable, timeout: float = None,
+             signal_types=None, inline: bool = None):
+    """
+    Attach a handler to a signal type. Guards ("any_signal") may pass `signal_types`
+    to be skipped for every other signal, and run inline on the spine loop by default
+    (pass inline=False for a guard that can block).
+    """
+    global _registry_version
     if signal_type not in signal_registry:
         signal_registry[signal_type] = []
     signal_registry[signal_type].append(handler)
+    if timeout is not None:
+        handler_timeouts[(signal_type, handler)] = timeout
+    if inline if inline is not None else signal_type == "any_signal":
+        inline_handlers.add((signal_type, handler))
+    if signal_type == "any_signal" and signal_types is not None:
+        guard_scopes[handler] = frozenset(signal_types)
+    _registry_version += 1
     if os.getenv("TEX_VERBOSE_LOGGING") == "true":
         log.info(f"🧠 [SPINE] Registered handler for signal: '{signal_type}'")
 
+def _handler_name(handler: Callable) -> str:
+    name = getattr(handler, "__qualname__", None) or repr(handler)
+    code = getattr(handler, "__code__", None)
+    if code is not None and "<lambda>" in name:
+        # Many registrations are lambdas in the same function; the line tells them apart
+        name = f"{name}:{code.co_firstlineno}"
+    return name
+
+
+# === COMPILED ROUTING TABLE ===
+class HandlerRoute(NamedTuple):
+    handler: Callable
+    name: str
+    is_async: bool
+    inline: bool
+    timeout: Optional[float]  # explicit per-registration timeout, None = spine default
+
+SignalRoute = Tuple[Tuple[HandlerRoute, ...], Tuple[HandlerRoute, ...]]  # (guards, handlers)
+
+_routes = MappingProxyType({})
+_routes_version = -1
+_unrouted: Dict[str, SignalRoute] = {}
+_routes_lock = threading.Lock()
+
+def _handler_route(signal_type: str, handler: Callable) -> HandlerRoute:
+    key = (signal_type, handler)
+    return HandlerRoute(handler, _handler_name(handler), asyncio.iscoroutinefunction(handler),
+                        key in inline_handlers, handler_timeouts.get(key))
+
+def _compile_route(signal_type: str) -> SignalRoute:
+    guards = tuple(
+        _handler_route("any_signal", g) for g in signal_registry.get("any_signal", ())
+        if g not in guard_scopes or signal_type in guard_scopes[g]
+    )
+    handlers = tuple(_handler_route(signal_type, h) for h in signal_registry.get(signal_type, ()))
+    return guards, handlers
+
+def compile_routes():
+    """Freeze signal_registry into per-signal (guards, handlers) routes. Rebuilt only after register()."""
+    global _routes, _routes_version
+    with _routes_lock:
+        version = _registry_version
+        table = {sig: _compile_route(sig) for sig in signal_registry if sig != "any_signal"}
+        _unrouted.clear()
+        _routes = MappingProxyType(table)
+        _routes_version = version
+    return _routes
+
+def route_for(signal_type: str) -> SignalRoute:
+    if _routes_version != _registry_version:
+        compile_routes()
+    route = _routes.get(signal_type)
+    if route is None:
+        # Unregistered types still pass their guards (deny-listed signals must trip them)
+        route = _unrouted.get(signal_type)
+        if route is None:
+            route = _unrouted[signal_type] = _compile_route(signal_type)
+    return route
+
+
+# === ASYNC SIGNAL SPINE ===
+class SignalSpine:
+    """
+    Asyncio-native dispatcher on its own loop thread. Signals land in bounded
+    per-urgency queues; workers always drain higher bands first. Sync handlers run
+    on a thread pool under a per-handler timeout; coroutine results become tasks.
+    """
+
+    def __init__(self, workers: int = SPINE_WORKERS, threads: int = SPINE_THREADS,
+                 handler_timeout: float = SPINE_HANDLER_TIMEOUT, bands=URGENCY_BANDS,
+                 reflex_workers: int = SPINE_REFLEX_WORKERS):
+        self.workers = max(1, workers)
+        self.reflex_workers = max(0, reflex_workers)
+        self.handler_timeout = handler_timeout
+        self.bands = bands
+        self._queues = {name: deque() for name, _, _, _ in bands}
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="spine-handler")
+        self._loop = None
+        self._thread = None
+        self._wakeup = None
+        self._tasks = set()
+        self._started = threading.Event()
+        self._start_lock = threading.Lock()
+        self.stats = {"accepted": 0, "dropped": 0, "vetoed": 0, "timeouts": 0, "errors": 0}
+        self.metrics = spine_metrics
+        self.metrics.bind_depth_probe(self.depth)
+        self._metrics_server = None
+
+    # === Lifecycle ===
+    def start(self):
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._started.clear()
+            self._thread = threading.Thread(target=self._run_loop, name="signal-spine", daemon=True)
+            self._thread.start()
+            if METRICS_PORT and self._metrics_server is None:
+                try:
+                    self._metrics_server = serve_prometheus(self.metrics, int(METRICS_PORT))
+                except Exception as e:
+                    log.warning(f"⚠️ [SPINE] Metrics endpoint failed to start: {e}")
+        self._started.wait()
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        all_bands = [b[0] for b in self.bands]
+        for i in range(self.workers):
+            self._loop.create_task(self._worker(i, all_bands))
+        # Reserved lane: slow handlers saturating the shared workers can't delay top-band reflexes
+        for i in range(self.reflex_workers):
+            self._loop.create_task(self._worker(self.workers + i, all_bands[:1]))
+        self._started.set()
+        self._loop.run_forever()
+
+    def shutdown(self, drain: bool = True, timeout: float = 10.0):
+        if self._loop is None:
+            return
+        if drain:
+            self.join(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        log.info("🧠 [SPINE] Signal spine stopped.")
+
+    def join(self, timeout: float = 10.0) -> bool:
+        """Wait until every queued signal has been taken by a worker (handlers may still run)."""
+        deadline = time.time() + timeout
+        with self._cond:
+            return self._cond.wait_for(lambda: not any(self._queues.values()), timeout=max(0.0, deadline - time.time()))
+
+    def depth(self) -> Dict[str, int]:
+        with self._cond:
+            return {name: len(q) for name, q in self._queues.items()}
+
+    # === Admission ===
+    def _band_for(self, urgency: float):
+        for band in self.bands:
+            if urgency >= band[1]:
+                return band
+        return self.bands[-1]
+
+    def submit(self, signal: dict) -> bool:
+        if self._loop is None:
+            self.start()
+        name, _, bound, policy = self._band_for(float(signal.get("urgency") or 0.0))
+        on_spine = threading.current_thread() is self._thread
+        with self._cond:
+            q = self._queues[name]
+            if len(q) >= bound and policy == "block" and not on_spine:
+                self._cond.wait_for(lambda: len(q) < bound, timeout=SPINE_BLOCK_TIMEOUT)
+            if len(q) >= bound:
+                if policy == "drop_newest":
+                    self.stats["dropped"] += 1
+                    log.warning(f"⚠️ [SPINE] '{name}' queue full — dropped '{signal['type']}'")
+                    return False
+                _, shed = q.popleft()
+                self.stats["dropped"] += 1
+                log.warning(f"⚠️ [SPINE] '{name}' queue full — shed '{shed['type']}'")
+            q.append((time.monotonic(), signal))
+            self.stats["accepted"] += 1
+            self.metrics.record_depth(name, len(q))
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        return True
+
+    def _next_signal(self, bands: List[str]):
+        with self._cond:
+            for name in bands:
+                q = self._queues[name]
+                if q:
+                    item = q.popleft()
+                    self._cond.notify_all()
+                    return item
+        return None
+
+    # === Workers ===
+    async def _worker(self, index: int, bands: List[str]):
+        while True:
+            item = self._next_signal(bands)
+            if item is None:
+                self._wakeup.clear()
+                # Re-check after clearing so a set() racing the clear is never lost
+                item = self._next_signal(bands)
+                if item is None:
+                    await self._wakeup.wait()
+                    continue
+            enqueued_at, signal = item
+            started = time.monotonic()
+            failed = False
+            try:
+                failed = not await self._process(signal)
+            except Exception as e:
+                failed = True
+                self.stats["errors"] += 1
+                log.error(f"❌ [SPINE] Worker {index} failed on '{signal.get('type')}': {e}")
+            finally:
+                done = time.monotonic()
+                self.metrics.record_signal(signal["type"], done - started, started - enqueued_at, failed)
+
+    async def _process(self, signal: dict) -> bool:
+        """Run guards then handlers; False when the signal was vetoed or had no handlers."""
+        signal_type = signal["type"]
+        guards, handlers = route_for(signal_type)
+        for guard in guards:
+            result = await self._call_safe(guard, signal)
+            if isinstance(result, BaseException):
+                self.stats["vetoed"] += 1
+                log.error(f"❌ [SPINE] Pre-check failed: {result}")
+                return False
+
+        if not handlers:
+            log.warning(f"⚠️ [SPINE] No handlers registered for: '{signal_type}'")
+            return False
+
+        register_reflex_strain()
+        if len(handlers) == 1:
+            results = [await self._call_safe(handlers[0], signal)]
+        else:
+            results = await asyncio.gather(*(self._call_safe(h, signal) for h in handlers))
+        for route, result in zip(handlers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.stats["timeouts"] += 1
+                log.error(f"⏱️ [SPINE] Handler {route.name} for '{signal_type}' timed out")
+            elif isinstance(result, BaseException):
+                self.stats["errors"] += 1
+                log.error(f"❌ [SPINE] Handler for '{signal_type}' failed: {result}")
+        return True
+
+    async def _call_safe(self, route: HandlerRoute, signal: dict):
+        # SystemExit from a reflex guard must not escape a task and stop the spine loop
+        started = time.monotonic()
+        try:
+            result = await self._call(route, signal)
+            self.metrics.record_handler(signal["type"], route.name, time.monotonic() - started)
+            return result
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            self.metrics.record_handler(signal["type"], route.name, time.monotonic() - started,
+                                        error=not timed_out, timeout=timed_out)
+            return e
+
+    async def _call(self, route: HandlerRoute, signal: dict):
+        if route.is_async or route.inline:
+            result = route.handler(signal)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await asyncio.wait_for(loop.run_in_executor(self._pool, route.handler, signal),
+                                            route.timeout or self.handler_timeout)
+        # Sync wrappers (lambdas) may still hand back a coroutine
+        if route.is_async or asyncio.iscoroutine(result):
+            # Coroutines are long-lived reflex pulses: run detached, bounded only by an explicit timeout
+            coro = asyncio.wait_for(result, route.timeout) if route.timeout is not None else result
+            task = asyncio.get_running_loop().create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(self._task_recorder(signal["type"], route.name + "[task]"))
+        return result
+
+    def _task_recorder(self, signal_type: str, name: str):
+        started = time.monotonic()
+
+        def _record(task: asyncio.Task):
+            exc = None if task.cancelled() else task.exception()
+            self.metrics.record_handler(signal_type, name, time.monotonic() - started,
+                                        error=exc is not None and not isinstance(exc, asyncio.TimeoutError),
+                                        timeout=isinstance(exc, asyncio.TimeoutError))
+        return _record
+
+
+spine = SignalSpine()
+
 
 # === SIGNAL DISPATCH CORE ===
-def dispatch_signal(signal_type: str, payload: dict = None, urgency: float = None, entropy: float = None, source: str = "internal"):
-    signal = {
+def _build_signal(signal_type, payload, urgency, entropy, source) -> dict:
+    return {
         "type": signal_type,
         "payload": payload or {},
         "urgency": urgency or TEXPULSE.get("urgency", 0.6),
@@ -43,36 +358,59 @@ def dispatch_signal(signal_type: str, payload: dict = None, urgency: float = Non
         "timestamp": datetime.utcnow().isoformat()
     }
 
+def dispatch_signal(signal_type: str, payload: dict = None, urgency: float = None, entropy: float = None, source: str = "internal"):
+    signal = _build_signal(signal_type, payload, urgency, entropy, source)
     log.info(f"📡 [SPINE] Emitting signal: '{signal_type}' | Urgency={signal['urgency']} | Entropy={signal['entropy']}")
+    if SPINE_MODE == "sync":
+        started = time.monotonic()
+        ok = _dispatch_inline(signal)
+        spine_metrics.record_signal(signal_type, time.monotonic() - started, error=not ok)
+        return ok
+    return spine.submit(signal)
+
+def spine_metrics_snapshot() -> dict:
+    """Per-signal and per-handler call counts, p50/p95/p99 latency, errors and queue depth."""
+    snap = spine_metrics.snapshot()
+    snap["spine"] = dict(spine.stats)
+    return snap
 
-    for handler in signal_registry.get("any_signal", []):
+def _run_inline(route: HandlerRoute, signal: dict):
+    started = time.monotonic()
+    try:
+        result = route.handler(signal)
+        if route.is_async or asyncio.iscoroutine(result):
+            try:
+                asyncio.get_running_loop().create_task(result)
+            except RuntimeError:
+                asyncio.run(result)
+    except BaseException:
+        spine_metrics.record_handler(signal["type"], route.name, time.monotonic() - started, error=True)
+        raise
+    spine_metrics.record_handler(signal["type"], route.name, time.monotonic() - started)
+
+def _dispatch_inline(signal: dict):
+    """Legacy caller-thread dispatch (TEX_SPINE_MODE=sync) for scripts and debugging."""
+    signal_type = signal["type"]
+    guards, handlers = route_for(signal_type)
+    for guard in guards:
         try:
-            result = handler(signal)
-            if asyncio.iscoroutine(result):
-                try:
-                    asyncio.get_running_loop().create_task(result)
-                except RuntimeError:
-                    asyncio.run(result)
+            _run_inline(guard, signal)
         except Exception as e:
             log.error(f"❌ [SPINE] Pre-check failed: {e}")
-            return
+            return False
 
-    if signal_type not in signal_registry:
+    if not handlers:
         log.warning(f"⚠️ [SPINE] No handlers registered for: '{signal_type}'")
-        return
+        return False
 
     register_reflex_strain()
 
-    for handler in signal_registry[signal_type]:
+    for route in handlers:
         try:
-            result = handler(signal)
-            if asyncio.iscoroutine(result):
-                try:
-                    asyncio.get_running_loop().create_task(result)
-                except RuntimeError:
-                    asyncio.run(result)
+            _run_inline(route, signal)
         except Exception as e:
             log.error(f"❌ [SPINE] Handler for '{signal_type}' failed: {e}")
+    return True
 
 # === THOUGHT FUSION REFLEX ===
 def _reflective_thought_synthesis():
@@ -154,10 +492,10 @@ def register_core_cortex_modules():
     from core_layer.narrative_continuity_engine import trigger_narrative_compression
     from core_layer.will_engine import evaluate_will_trigger
     from core_layer.recovery_protocol import initiate_recovery
-    from core_layer.ethics_reflex import ethics_guard
+    from core_layer.ethics_reflex import ethics_guard, ETHICAL_DENY_LIST
     from core_layer.harm_predictor import evaluate_harm_risk
     from core_layer.boundary_engine import enforce_boundaries
-    from core_layer.self_preservation_guard import protect_self
+    from core_layer.self_preservation_guard import protect_self, SENSITIVE_SIGNAL_TYPES
 
     # === Core Reflex Modules
     register("identity_conflict", evaluate_will_trigger)
@@ -188,10 +526,11 @@ def register_core_cortex_modules():
     register("manual_recovery", initiate_recovery)
 
     # === Global Reflex Guardrails
-    register("any_signal", ethics_guard)
+    # Deny-list guards only inspect their own signal types; harm and boundary checks read every signal
+    register("any_signal", ethics_guard, signal_types=ETHICAL_DENY_LIST)
     register("any_signal", evaluate_harm_risk)
     register("any_signal", enforce_boundaries)
-    register("any_signal", protect_self)
+    register("any_signal", protect_self, signal_types=SENSITIVE_SIGNAL_TYPES)
     register("potential_harm_detected", protect_self)
     register("self_rescue", protect_self)
 
@@ -199,4 +538,5 @@ def register_core_cortex_modules():
     register_embodiment_cortex(register)
 
     log.info("🧠 [SPINE] All sovereign brain + embodiment + reflection modules registered.")
+    compile_routes()
     log.info(f"🧠 [SPINE] Signal summary: {len(signal_registry)} signal types | {sum(len(h) for h in signal_registry.values())} total handlers registered.")
\ No newline at end of file
@@ -0,0 +1,263 @@
+# ============================================================
+# © 2025 VortexBlack / Sovereign Cognition. All rights reserved.
+# File: tex_stream_follower.py
+# Tier: ΩΩΩΩ — Shared Stream Follower
+# Purpose: One tail-follow reader per process for JSONL/text logs: each new line is parsed once,
+#          kept in a bounded per-stream window and fanned out to dashboards and websocket servers
+# ============================================================
+
+import os
+import json
+import threading
+from collections import deque
+from typing import Callable, Dict, List
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags  # optional: Linux only
+except ImportError:
+    INotify = None
+
+# === Configuration ===
+FOLLOW_WINDOW = int(os.getenv("TEX_FOLLOW_WINDOW", "5000"))       # records kept in memory per stream
+FOLLOW_POLL = float(os.getenv("TEX_FOLLOW_POLL", "0.25"))          # seconds between polls (or inotify safety sweep)
+FOLLOW_INOTIFY = os.getenv("TEX_FOLLOW_INOTIFY", "1") != "0"
+READ_BLOCK = 1 << 16
+
+
+class FollowedStream:
+    """
+    Byte-offset follower for one file. The window holds the newest records; `seq` counts
+    every record ever appended to it, so callers can ask for what is new since their last look.
+    A truncated or replaced file (size shrinks / inode changes) is reloaded from its tail
+    without publishing: only lines appended after the reopen count as new.
+    """
+
+    def __init__(self, path: str, window: int = FOLLOW_WINDOW, parse: str = "json", backfill: int = None):
+        self.path = path
+        self.parse = parse
+        self.records = deque(maxlen=window)
+        self.backfill = window if backfill is None else backfill
+        self.seq = 0
+        self.generation = 0      # bumped whenever the file was replaced and the window reloaded
+        self.malformed = 0
+        self.offset = 0
+        self.inode = 0
+        self._lock = threading.Lock()
+        self._load_tail(self.backfill)
+
+    # === Parsing ===
+    def _decode(self, raw: bytes):
+        line = raw.strip()
+        if not line:
+            return None
+        if self.parse == "text":
+            return line.decode("utf-8", errors="replace")
+        try:
+            return json.loads(line)
+        except ValueError:
+            self.malformed += 1
+            return None
+
+    def _ingest(self, lines: List[bytes], publish: bool = True) -> list:
+        fresh = []
+        for raw in lines:
+            record = self._decode(raw)
+            if record is not None:
+                fresh.append(record)
+        self.records.extend(fresh)
+        if publish:
+            self.seq += len(fresh)
+        return fresh
+
+    # === File Reads ===
+    def _load_tail(self, n: int, publish: bool = True) -> list:
+        """Parse only the last n complete lines; everything before them is skipped unread."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.offset, self.inode = 0, 0
+            return []
+        with open(self.path, "rb") as f:
+            end = st.st_size
+            blocks = []
+            newlines = 0
+            pos = end
+            # Walk backwards until we hold n+1 newlines (or reach the start)
+            while pos > 0 and newlines <= n:
+                step = min(READ_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                newlines += block.count(b"\n")
+                blocks.append(block)
+            data = b"".join(reversed(blocks))
+        complete = data[:data.rfind(b"\n") + 1]
+        lines = complete.splitlines(keepends=True)
+        if pos > 0 and lines:
+            lines = lines[1:]  # first line in the buffer may be cut mid-record
+        self.offset = end - (len(data) - len(complete))
+        self.inode = st.st_ino
+        return self._ingest(lines[-n:] if n else [], publish)
+
+    def refresh(self) -> list:
+        """Read whatever was appended since the last call; returns the newly parsed records."""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return []
+            if self.inode == 0:
+                # File appeared after we started following: all of it is new
+                self.inode = st.st_ino
+                self.offset = 0
+            elif st.st_ino != self.inode or st.st_size < self.offset:
+                # Rotated: the reloaded window is history, not news (seq stays put, so since() and
+                # subscribers are not replayed old lines); watch `generation` to notice the swap
+                self.records.clear()
+                self.generation += 1
+                self._load_tail(self.records.maxlen, publish=False)
+                return []
+            if st.st_size == self.offset:
+                return []
+
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read(st.st_size - self.offset)
+            complete = chunk[:chunk.rfind(b"\n") + 1]  # a trailing partial line waits for the next read
+            self.offset += len(complete)
+            return self._ingest(complete.splitlines())
+
+    def snapshot(self, limit: int = None) -> list:
+        with self._lock:
+            records = list(self.records)
+        return records[-limit:] if limit else records
+
+    def since(self, seq: int) -> list:
+        """Records appended after `seq` that are still inside the window."""
+        with self._lock:
+            missing = min(self.seq - seq, len(self.records))
+            return list(self.records)[-missing:] if missing > 0 else []
+
+
+class StreamFollower:
+    """
+    Process-wide registry of followed files. Readers pull with `snapshot()` (a stat plus
+    the appended bytes); push consumers `subscribe()` and are fed from one background
+    thread woken by inotify when available, otherwise by polling.
+    """
+
+    def __init__(self, poll_interval: float = FOLLOW_POLL, window: int = FOLLOW_WINDOW):
+        self.poll_interval = poll_interval
+        self.window = window
+        self._streams: Dict[str, FollowedStream] = {}
+        self._subscribers: Dict[str, List[Callable]] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # === Registry ===
+    def follow(self, path: str, parse: str = "json", window: int = None, backfill: int = None) -> FollowedStream:
+        key = os.path.abspath(path)
+        stream = self._streams.get(key)
+        if stream is None:
+            with self._lock:
+                stream = self._streams.get(key)
+                if stream is None:
+                    stream = FollowedStream(path, window or self.window, parse, backfill)
+                    self._streams[key] = stream
+        return stream
+
+    def _refresh(self, key: str, stream: FollowedStream) -> int:
+        fresh = stream.refresh()
+        if fresh:
+            for callback in list(self._subscribers.get(key, ())):
+                try:
+                    callback(stream.path, fresh)
+                except Exception as e:
+                    print(f"⚠️ [STREAM FOLLOWER] Subscriber error on {stream.path}: {e}")
+        return len(fresh)
+
+    # === Pull API (dashboards) ===
+    def snapshot(self, path: str, limit: int = None, parse: str = "json") -> list:
+        """Newest records of `path`, oldest first. Catches up inline, so it never lags the file."""
+        stream = self.follow(path, parse)
+        self._refresh(os.path.abspath(path), stream)
+        return stream.snapshot(limit)
+
+    def since(self, path: str, seq: int, parse: str = "json") -> tuple:
+        """(records after seq, current seq) — for cursor-style consumers."""
+        stream = self.follow(path, parse)
+        self._refresh(os.path.abspath(path), stream)
+        return stream.since(seq), stream.seq
+
+    # === Push API (websockets, live panels) ===
+    def subscribe(self, path: str, callback: Callable[[str, list], None], parse: str = "json",
+                  backfill: int = None) -> FollowedStream:
+        """callback(path, new_records) runs on the follower thread; keep it short."""
+        stream = self.follow(path, parse, backfill=backfill)
+        key = os.path.abspath(path)
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+        self.start()
+        return stream
+
+    def unsubscribe(self, path: str, callback: Callable):
+        with self._lock:
+            callbacks = self._subscribers.get(os.path.abspath(path), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def pump(self, directory: str = None) -> int:
+        """Refresh every followed stream (or only those in `directory`); returns records read."""
+        total = 0
+        for key, stream in list(self._streams.items()):
+            if directory is None or os.path.dirname(key) == directory:
+                total += self._refresh(key, stream)
+        return total
+
+    # === Background Thread ===
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="tex-stream-follower", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        inotify = None
+        if INotify is not None and FOLLOW_INOTIFY:
+            try:
+                inotify = INotify()
+            except OSError as e:
+                print(f"⚠️ [STREAM FOLLOWER] inotify unavailable ({e}) — polling every {self.poll_interval}s")
+        if inotify is None:
+            while not self._stop.is_set():
+                self.pump()
+                self._stop.wait(self.poll_interval)
+            return
+
+        mask = inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE
+        watches: Dict[int, str] = {}
+        try:
+            while not self._stop.is_set():
+                for key in list(self._streams):
+                    directory = os.path.dirname(key)
+                    if directory not in watches.values() and os.path.isdir(directory):
+                        watches[inotify.add_watch(directory, mask)] = directory
+                events = inotify.read(timeout=int(self.poll_interval * 4000))
+                if not events:
+                    self.pump()  # safety sweep in case an event was coalesced away
+                    continue
+                for directory in {watches.get(ev.wd) for ev in events}:
+                    self.pump(directory)
+        finally:
+            inotify.close()
+
+
+stream_follower = StreamFollower()
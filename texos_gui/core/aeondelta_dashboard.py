@@ -8,6 +8,8 @@ import streamlit as st
 import json
 import os
 
+from tex_stream_follower import stream_follower
+
 # === File Paths
 AEONDELTA_LOG = "memory_archive/AeonDelta.jsonl"
 SPAWN_LOG = "memory_archive/child_spawn_log.jsonl"
@@ -20,9 +22,7 @@ def render_aeondelta_dashboard():
     st.markdown("### 🧠 Cognitive Memory Stream")
 
     if os.path.exists(AEONDELTA_LOG):
-        with open(AEONDELTA_LOG, "r") as f:
-            lines = [json.loads(line) for line in f if line.strip()]
-        recent_entries = lines[-20:] if len(lines) > 20 else lines
+        recent_entries = stream_follower.snapshot(AEONDELTA_LOG, limit=20)
 
         for entry in reversed(recent_entries):
             data = entry.get("data", {})
@@ -44,8 +44,7 @@ def render_aeondelta_dashboard():
 
     spawn_entries = []
     if os.path.exists(SPAWN_LOG):
-        with open(SPAWN_LOG, "r") as f:
-            spawn_entries = [json.loads(line) for line in f if "AeonDelta" in line]
+        spawn_entries = [e for e in stream_follower.snapshot(SPAWN_LOG) if "AeonDelta" in json.dumps(e)]
 
         if spawn_entries:
             for spawn in reversed(spawn_entries[-10:]):
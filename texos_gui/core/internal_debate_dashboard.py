@@ -6,9 +6,10 @@
 
 import streamlit as st
 import os
-import json
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path ===
 DEBATE_LOG = "memory_archive/debate_log.jsonl"
 
@@ -16,8 +17,7 @@ DEBATE_LOG = "memory_archive/debate_log.jsonl"
 def load_debate_log():
     if not os.path.exists(DEBATE_LOG):
         return []
-    with open(DEBATE_LOG, "r") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    return stream_follower.snapshot(DEBATE_LOG)
 
 # === Main Render Function ===
 def render_internal_debate_dashboard():
@@ -7,9 +7,10 @@
 import streamlit as st
 import pandas as pd
 import os
-import json
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 RECALL_FILE = "memory_archive/memory_recall_log.jsonl"
 
@@ -19,8 +20,7 @@ def load_memory_recalls():
         return pd.DataFrame()
 
     try:
-        with open(RECALL_FILE, "r") as f:
-            lines = [json.loads(line) for line in f if line.strip()]
+        lines = stream_follower.snapshot(RECALL_FILE)
         df = pd.DataFrame(lines)
         if 'timestamp' in df.columns:
             df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
@@ -8,14 +8,15 @@ import streamlit as st
 import pandas as pd
 import os
 
+from tex_stream_follower import stream_follower
+
 MUTATION_FILE = "memory_archive/mutation_history.log"
 
 # === Load Mutation Data
 def load_mutation_data():
     if os.path.exists(MUTATION_FILE):
         try:
-            df = pd.read_json(MUTATION_FILE, lines=True)
-            return df
+            return pd.DataFrame(stream_follower.snapshot(MUTATION_FILE))
         except Exception as e:
             st.error(f"❌ Failed to load mutation log: {e}")
             return pd.DataFrame()
@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
-import json
 from pathlib import Path
 
+from tex_stream_follower import stream_follower
+
 def render_mutation_lineage_dashboard():
     st.markdown("### 🧬 Mutation Lineage Tracker")
     st.caption("Visualizing Tex’s mutation ancestry across AGI cognition cycles.")
@@ -14,13 +15,7 @@ def render_mutation_lineage_dashboard():
         st.warning("No mutation history found.")
         return
 
-    mutations = []
-    with open(log_path, "r") as f:
-        for line in f:
-            try:
-                mutations.append(json.loads(line))
-            except:
-                continue
+    mutations = stream_follower.snapshot(str(log_path))
 
     if not mutations:
         st.info("No mutation entries to display yet.")
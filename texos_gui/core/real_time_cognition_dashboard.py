@@ -6,10 +6,11 @@
 
 import streamlit as st
 import pandas as pd
-import json
 import os
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 FUSION_FILE = "memory_archive/tex_signal_fusion.jsonl"
 
@@ -19,8 +20,7 @@ def load_fusion_stream():
         return pd.DataFrame()
 
     try:
-        with open(FUSION_FILE, "r") as f:
-            lines = [json.loads(line) for line in f if line.strip()]
+        lines = stream_follower.snapshot(FUSION_FILE)
         if not lines:
             return pd.DataFrame()
         return pd.DataFrame(lines)
@@ -6,10 +6,11 @@
 
 import streamlit as st
 import pandas as pd
-import json
 import os
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 REASONING_FILE = "memory_archive/reasoning_trace_log.jsonl"
 
@@ -19,8 +20,7 @@ def load_reasoning_trace():
         return pd.DataFrame()
 
     try:
-        with open(REASONING_FILE, "r") as f:
-            data = [json.loads(line) for line in f if line.strip()]
+        data = stream_follower.snapshot(REASONING_FILE)
         return pd.DataFrame(data)
     except Exception as e:
         st.error(f"❌ Failed to load reasoning trace: {e}")
@@ -7,9 +7,10 @@
 import streamlit as st
 import pandas as pd
 import os
-import json
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 SPAWN_FILE = "memory_archive/child_spawn_log.jsonl"
 
@@ -19,8 +20,7 @@ def load_spawned_children():
         return pd.DataFrame()
 
     try:
-        with open(SPAWN_FILE, "r") as f:
-            entries = [json.loads(line) for line in f if line.strip()]
+        entries = stream_follower.snapshot(SPAWN_FILE)
         df = pd.DataFrame(entries)
         if 'timestamp' in df.columns:
             df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce', utc=True)
@@ -12,6 +12,8 @@ import random
 import uuid
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Paths
 AGENT_DIR = "memory_archive/"
 SPAWN_LOG = os.path.join(AGENT_DIR, "child_spawn_log.jsonl")
@@ -22,15 +24,13 @@ FEDERATED_LOG = os.path.join(AGENT_DIR, "federated_insights.jsonl")
 def load_jsonl(path):
     if not os.path.exists(path):
         return []
-    with open(path, "r") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    return stream_follower.snapshot(path)
 
 def load_agent_memory(agent_id):
     memory_path = os.path.join(AGENT_DIR, f"{agent_id}.jsonl")
     if not os.path.exists(memory_path):
         return []
-    with open(memory_path, "r") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    return stream_follower.snapshot(memory_path)
 
 # === Main Render Function
 def render_swarm_dashboard():
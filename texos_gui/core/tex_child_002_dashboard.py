@@ -7,9 +7,10 @@
 import streamlit as st
 import pandas as pd
 import os
-import json
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 MEMORY_FILE = "memory_archive/tex_child_002.jsonl"
 
@@ -19,8 +20,7 @@ def load_child_memory():
         return pd.DataFrame()
 
     try:
-        with open(MEMORY_FILE, "r") as f:
-            data = [json.loads(line) for line in f if line.strip()]
+        data = stream_follower.snapshot(MEMORY_FILE)
         return pd.DataFrame(data)
     except Exception as e:
         st.error(f"❌ Failed to load Tex_Child_002 memory: {e}")
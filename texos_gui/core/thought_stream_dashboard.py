@@ -7,9 +7,10 @@
 import streamlit as st
 import pandas as pd
 import os
-import json
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 THOUGHT_STREAM_FILE = "memory_archive/reasoning_trace_log.jsonl"
 
@@ -19,8 +20,7 @@ def load_thought_stream():
         return pd.DataFrame()
 
     try:
-        with open(THOUGHT_STREAM_FILE, "r") as f:
-            lines = [json.loads(line) for line in f if line.strip()]
+        lines = stream_follower.snapshot(THOUGHT_STREAM_FILE)
         df = pd.DataFrame(lines)
         if 'timestamp' in df.columns:
             df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
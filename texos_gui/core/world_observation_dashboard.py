@@ -6,10 +6,11 @@
 
 import streamlit as st
 import os
-import json
 import pandas as pd
 from datetime import datetime
 
+from tex_stream_follower import stream_follower
+
 # === File Path
 WORLD_FILE = "memory_archive/world_observations.jsonl"
 
@@ -19,8 +20,7 @@ def load_world_observations():
         return pd.DataFrame()
 
     try:
-        with open(WORLD_FILE, "r") as f:
-            lines = [json.loads(line) for line in f if line.strip()]
+        lines = stream_follower.snapshot(WORLD_FILE)
         df = pd.DataFrame(lines)
         if 'timestamp' in df.columns:
             df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
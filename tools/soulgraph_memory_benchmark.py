@@ -0,0 +1,102 @@
+# tools/soulgraph_memory_benchmark.py
+# Bytes per soulgraph belief: the original dict-backed node (Python-list vector, ISO strings,
+# eager history lists) against the slotted node + BeliefMatrix row, then peak memory of
+# streaming each graph's snapshot as JSON lines to /dev/null (same serialization path for both).
+#
+#   python tools/soulgraph_memory_benchmark.py --beliefs 20000
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+from agentic_ai.embedding_engine import EMBED_DIM
+from sovereign_evolution.soulgraph_store import BeliefMatrix
+from sovereign_evolution.texX_soulgraph import SoulgraphBelief, TexSoulgraph
+
+EMOTIONS = ["neutral", "curious", "alert", "reflective", "revival"]
+
+
+class LegacyBelief:
+    """The pre-compaction node layout, kept here only as the benchmark baseline."""
+
+    def __init__(self, belief, source, emotion, vector):
+        self.id = str(uuid.uuid4())
+        self.belief = belief
+        self.source = source
+        self.timestamp = datetime.utcnow().isoformat()
+        self.origin_beliefs = []
+        self.vector = vector
+        self.confidence = 1.0
+        self.activation = 1.0
+        self.drift_score = 0.0
+        self.emotion_history = [(emotion, self.timestamp)]
+        self.mutation_history = []
+        self.relations = []
+        self.semantic_tags = ["general"]
+        self.contradiction_flags = []
+        self.fork_lineage = []
+
+    def to_payload(self):
+        return {k: v for k, v in self.__dict__.items() if k != "vector"}
+
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, current - before, peak - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soulgraph bytes-per-belief benchmark")
+    parser.add_argument("--beliefs", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    n = args.beliefs
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.standard_normal((n, EMBED_DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    rows = [(f"belief {i} about reflex state", f"bench_source_{i % 50}", EMOTIONS[i % len(EMOTIONS)], vectors[i])
+            for i in range(n)]
+
+    # Each node gets its own list of floats, as embed_text() hands back
+    legacy, legacy_bytes, _ = measure(lambda: [LegacyBelief(t, s, e, v.tolist()) for t, s, e, v in rows])
+
+    def build_compact():
+        graph = TexSoulgraph.__new__(TexSoulgraph)
+        graph.graph, graph.store = {}, BeliefMatrix(capacity=n)
+        for text, source, emotion, vector in rows:
+            node = SoulgraphBelief(text, source, emotion, vector=vector.tolist())
+            node.attach(graph.store)
+            graph.graph[node.id] = node
+        return graph
+
+    compact, compact_bytes, _ = measure(build_compact)
+
+    def stream_legacy(sink):
+        for belief in legacy:
+            sink.write(json.dumps(belief.to_payload()) + "\n")
+
+    with open(os.devnull, "w") as sink:
+        _, _, legacy_peak = measure(lambda: stream_legacy(sink))
+        _, _, compact_peak = measure(lambda: compact.write_snapshot(sink) and None)
+
+    print(f"beliefs:              {n}")
+    print(f"legacy node:          {legacy_bytes / n:10.1f} bytes/belief")
+    print(f"slotted node + row:   {compact_bytes / n:10.1f} bytes/belief  ({legacy_bytes / max(compact_bytes, 1):.2f}x smaller)")
+    print(f"snapshot peak (legacy):  {legacy_peak / 1e6:8.2f} MB")
+    print(f"snapshot peak (slotted): {compact_peak / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# tools/spike_backend_benchmark.py
+# Compares the pooled Nengo reflex ensemble against the vectorized NumPy LIF backend:
+# spike-sum agreement on identical neuron parameters, then events/sec for each path.
+#
+#   python tools/spike_backend_benchmark.py --events 2000 --slots 8
+
+import argparse
+import time
+
+import numpy as np
+
+from brain_layer.lif_spike_engine import LIFSpikeEnsemble, classify_reflex_batch, DIMENSIONS, NEURON_COUNT, SIM_DURATION
+
+
+def build_nengo_reference(lif: LIFSpikeEnsemble, slots: int):
+    """Multi-stimulus Nengo network whose ensembles use the LIF backend's exact parameters."""
+    import nengo
+
+    inputs = np.zeros((slots, DIMENSIONS))
+    with nengo.Network(label="spike benchmark") as model:
+        stim = nengo.Node(lambda t: inputs.ravel(), size_out=slots * DIMENSIONS)
+        probes = []
+        for b in range(slots):
+            ens = nengo.Ensemble(
+                NEURON_COUNT, dimensions=DIMENSIONS,
+                encoders=lif.encoders, gain=lif.gain, bias=lif.bias,
+                neuron_type=nengo.LIF(initial_state={"voltage": lif.initial_voltage})
+            )
+            nengo.Connection(stim[b * DIMENSIONS:(b + 1) * DIMENSIONS], ens)
+            attr = 'spikes' if 'spikes' in ens.neurons.probeable else 'output'
+            probes.append(nengo.Probe(ens.neurons, attr))
+    sim = nengo.Simulator(model, progress_bar=False)
+    return sim, inputs, probes
+
+
+def run_nengo(sim, inputs, probes, vectors) -> np.ndarray:
+    slots = len(probes)
+    sums = []
+    for i in range(0, len(vectors), slots):
+        chunk = vectors[i:i + slots]
+        inputs[:] = 0.0
+        inputs[:len(chunk)] = chunk
+        sim.reset()
+        sim.run(SIM_DURATION)
+        sums.extend(float(np.sum(sim.data[p])) for p in probes[:len(chunk)])
+    return np.array(sums)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nengo vs vectorized LIF spike backend")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--slots", type=int, default=8, help="stimuli per Nengo simulator run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.random((args.events, DIMENSIONS))
+    vectors[:, 3] = (vectors[:, 3] > 0.7).astype(float)  # contradiction flag is 0/1 in encode_event_signal
+
+    lif = LIFSpikeEnsemble(seed=args.seed)
+
+    start = time.perf_counter()
+    lif_sums = lif.spike_sums(vectors)
+    classify_reflex_batch(vectors)
+    lif_elapsed = time.perf_counter() - start
+    print(f"⚡ [LIF]   {args.events} events in {lif_elapsed:.3f}s → {args.events / lif_elapsed:,.0f} events/sec")
+
+    try:
+        build_start = time.perf_counter()
+        sim, inputs, probes = build_nengo_reference(lif, args.slots)
+        build_elapsed = time.perf_counter() - build_start
+    except ImportError:
+        print("⚠️ [NENGO] nengo not installed — skipping comparison.")
+        return
+
+    start = time.perf_counter()
+    nengo_sums = run_nengo(sim, inputs, probes, vectors)
+    nengo_elapsed = time.perf_counter() - start
+    print(f"🧠 [NENGO] {args.events} events in {nengo_elapsed:.3f}s → {args.events / nengo_elapsed:,.0f} events/sec "
+          f"(+{build_elapsed:.3f}s one-time build, {args.slots} slots/run)")
+
+    diff = np.abs(lif_sums - nengo_sums)
+    print(f"📊 Speedup: {nengo_elapsed / lif_elapsed:.1f}x | spike_sum max Δ={diff.max():.1f} "
+          f"| exact matches {np.mean(diff == 0) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()